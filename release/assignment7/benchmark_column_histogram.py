@@ -0,0 +1,185 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from column_histogram import column_histogram, column_histograms
+
+SPOTIFY_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "assignment1",
+    "data",
+    "spotify.csv",
+)
+
+
+def time_histogram(data, bins):
+    """
+    Given a dataframe, return the size in bytes of the histogram spec of its
+    'value' column and the seconds taken to build and serialize it, along
+    with the seconds taken to render it to SVG when vl-convert is installed
+    """
+
+    start = time.perf_counter()
+    histogram_spec = column_histogram(data, "value", bins=bins).to_json()
+    spec_seconds = time.perf_counter() - start
+
+    try:
+        import vl_convert
+    except ImportError:
+        return len(histogram_spec), spec_seconds, np.nan
+
+    start = time.perf_counter()
+    vl_convert.vegalite_to_svg(histogram_spec)
+
+    return len(histogram_spec), spec_seconds, time.perf_counter() - start
+
+
+def benchmark_column_histogram(max_exponent=8, max_unbinned_exponent=6, bins=True):
+    """
+    Given the largest number of rows as a power of ten, compare the histogram
+    spec binned by Altair in the browser against the spec pre-binned with
+    NumPy for 10^4 rows upwards
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest number of rows
+    max_unbinned_exponent : int, optional
+        The exponent of the largest number of rows to embed in a spec
+    bins : bool, int, str or sequence of float, optional
+        The bins of the pre-binned histogram
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        The spec size, spec time and render time of both histograms for
+        each number of rows
+
+    Examples
+    --------
+    >>> benchmark_column_histogram(max_exponent=6)
+    """
+
+    # Every row is embedded in the unbinned spec, so Altair's limit is lifted
+    import altair as alt
+
+    alt.data_transformers.disable_max_rows()
+
+    rng = np.random.default_rng(0)
+
+    results = []
+    for exponent in range(4, max_exponent + 1):
+        data = pd.DataFrame({"value": rng.standard_normal(10**exponent)})
+
+        unbinned_results = (np.nan, np.nan, np.nan)
+        if exponent <= max_unbinned_exponent:
+            unbinned_results = time_histogram(data, bins=None)
+        binned_results = time_histogram(data, bins=bins)
+
+        results.append(
+            {
+                "row_count": 10**exponent,
+                "spec_bytes": binned_results[0],
+                "spec_seconds": binned_results[1],
+                "render_seconds": binned_results[2],
+                "unbinned_spec_bytes": unbinned_results[0],
+                "unbinned_spec_seconds": unbinned_results[1],
+                "unbinned_render_seconds": unbinned_results[2],
+            }
+        )
+
+    return pd.DataFrame(results)
+
+
+def time_histograms(data, column_names, bins):
+    """
+    Given a dataframe, return the total size in bytes of the histogram specs
+    of its columns and the seconds taken to build and serialize them, either
+    as one chart per column or, when bins is "batched", as a single chart
+    """
+
+    start = time.perf_counter()
+    if bins == "batched":
+        histogram_specs = [column_histograms(data, column_names).to_json()]
+    else:
+        histogram_specs = [
+            column_histogram(data, column_name, bins=bins).to_json()
+            for column_name in column_names
+        ]
+    spec_seconds = time.perf_counter() - start
+
+    return sum(len(histogram_spec) for histogram_spec in histogram_specs), spec_seconds
+
+
+def benchmark_column_histograms(max_exponent=7, max_unbinned_exponent=5):
+    """
+    Given the largest number of rows as a power of ten, profile the numeric
+    columns of the spotify data resampled to 10^4 rows upwards, with one
+    unbinned histogram per column, one pre-binned histogram per column and
+    a single batched chart
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest number of rows
+    max_unbinned_exponent : int, optional
+        The exponent of the largest number of rows to embed in the specs
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        The spec size and spec time of each approach for each number of rows
+
+    Examples
+    --------
+    >>> benchmark_column_histograms(max_exponent=5)
+    """
+
+    import altair as alt
+
+    alt.data_transformers.disable_max_rows()
+
+    spotify = pd.read_csv(SPOTIFY_PATH)
+    column_names = [
+        column_name
+        for column_name in spotify.select_dtypes("number").columns
+        if column_name not in ["Unnamed: 0", "target"]
+    ]
+
+    rng = np.random.default_rng(0)
+
+    results = []
+    for exponent in range(4, max_exponent + 1):
+        data = spotify.iloc[rng.integers(len(spotify), size=10**exponent)]
+
+        for approach in ["unbinned", "per_column", "batched"]:
+            if approach == "unbinned" and exponent > max_unbinned_exponent:
+                continue
+
+            bins = {"unbinned": None, "per_column": True}.get(approach, approach)
+            spec_bytes, spec_seconds = time_histograms(data, column_names, bins)
+            results.append(
+                {
+                    "row_count": 10**exponent,
+                    "approach": approach,
+                    "spec_bytes": spec_bytes,
+                    "spec_seconds": spec_seconds,
+                }
+            )
+
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+
+    print(benchmark_column_histogram(max_exponent=max_exponent).to_string(index=False))
+    print(
+        benchmark_column_histograms(max_exponent=min(max_exponent, 7)).to_string(
+            index=False
+        )
+    )
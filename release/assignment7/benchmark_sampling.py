@@ -0,0 +1,115 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sampling import sample_dataframe
+
+
+def make_grouped_dataframe(group_count, rows_per_group=5, seed=0):
+    """
+    Given a number of groups, return a synthetic dataframe with
+    rows_per_group rows in every group, in shuffled order
+
+    Parameters
+    ----------
+    group_count : int
+        The number of distinct values of the 'group' column
+    rows_per_group : int, optional
+        The number of rows of each group
+    seed : int, optional
+        The seed of the random number generator
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        The synthetic dataframe
+
+    Examples
+    --------
+    >>> make_grouped_dataframe(10)
+    """
+
+    rng = np.random.default_rng(seed)
+    row_count = group_count * rows_per_group
+
+    return pd.DataFrame(
+        {
+            "group": rng.permutation(np.repeat(np.arange(group_count), rows_per_group)),
+            "value": rng.random(row_count),
+        }
+    )
+
+
+def loop_sample_dataframe(data, grouping_col, N=1):
+    """
+    Given a dataframe, sample N rows from each group one group at a time,
+    as sample_dataframe used to, for comparison
+    """
+
+    df_grouped = data.groupby(grouping_col)
+
+    sampled_df = None
+
+    for group, rows in df_grouped:
+        group_sampling = df_grouped.get_group(group).sample(N)
+        sampled_df = pd.concat([sampled_df, group_sampling])
+
+    return sampled_df
+
+
+def time_sampler(sampler, data, N):
+    start = time.perf_counter()
+    sampler(data, "group", N)
+    return time.perf_counter() - start
+
+
+def benchmark_sampling(max_exponent=6, max_loop_exponent=4, N=2):
+    """
+    Given the largest number of groups as a power of ten, time
+    sample_dataframe against the group by group loop for 10 groups upwards
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest number of groups
+    max_loop_exponent : int, optional
+        The exponent of the largest number of groups to time the loop on
+    N : int, optional
+        The number of rows to sample from each group
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        The wall time of both samplers for each number of groups
+
+    Examples
+    --------
+    >>> benchmark_sampling(max_exponent=4)
+    """
+
+    results = []
+    for exponent in range(1, max_exponent + 1):
+        data = make_grouped_dataframe(10**exponent)
+
+        loop_seconds = np.nan
+        if exponent <= max_loop_exponent:
+            loop_seconds = time_sampler(loop_sample_dataframe, data, N)
+
+        results.append(
+            {
+                "group_count": 10**exponent,
+                "row_count": len(data),
+                "seconds": time_sampler(sample_dataframe, data, N),
+                "loop_seconds": loop_seconds,
+            }
+        )
+
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+
+    print(benchmark_sampling(max_exponent=max_exponent).to_string(index=False))
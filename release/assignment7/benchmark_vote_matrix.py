@@ -0,0 +1,120 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from vote_matrix import agreement_scores, build_vote_matrix
+
+
+def make_votes(country_count, rcid_count, missing_rate=0.2, seed=0):
+    """
+    Given a number of countries and roll calls, return a synthetic long
+    dataframe of votes, missing at missing_rate
+    """
+
+    rng = np.random.default_rng(seed)
+    country_codes, rcids = np.divmod(np.arange(country_count * rcid_count), rcid_count)
+    has_voted = rng.random(len(rcids)) >= missing_rate
+
+    return pd.DataFrame(
+        {
+            "rcid": rcids[has_voted],
+            "country": pd.Series(country_codes[has_voted]).map("country {}".format),
+            "vote": rng.choice([1, 1, 1, 2, 3], size=has_voted.sum()),
+        }
+    )
+
+
+def join_agreement_scores(data):
+    """
+    Given a long dataframe of votes, return the agreement of every pair of
+    countries by merging the dataframe with itself on the roll calls
+    """
+
+    pairs = data.merge(data, on="rcid")
+
+    return (
+        (pairs["vote_x"] == pairs["vote_y"])
+        .groupby([pairs["country_x"], pairs["country_y"]])
+        .mean()
+        .unstack()
+    )
+
+
+def benchmark_vote_matrix(
+    max_exponent=5, max_join_exponent=3, country_count=200, method="agreement"
+):
+    """
+    Given the largest number of roll calls as a power of ten, time the
+    agreement of every pair of countries with the vote matrix and with a
+    self-join, for 10^2 roll calls upwards
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest number of roll calls
+    max_join_exponent : int, optional
+        The exponent of the largest number of roll calls to self-join
+    country_count : int, optional
+        The number of countries
+    method : {'agreement', 'cosine'}, optional
+        The score of each pair of countries
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        The seconds taken to build the matrix, to score it and to score
+        the self-join for each number of roll calls
+
+    Examples
+    --------
+    >>> benchmark_vote_matrix(max_exponent=4)
+    """
+
+    results = []
+    for exponent in range(2, max_exponent + 1):
+        data = make_votes(country_count, 10**exponent)
+
+        start = time.perf_counter()
+        vote_matrix = build_vote_matrix(data)
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        agreement_scores(vote_matrix, method=method)
+        score_seconds = time.perf_counter() - start
+
+        join_seconds = np.nan
+        if exponent <= max_join_exponent:
+            start = time.perf_counter()
+            join_agreement_scores(data)
+            join_seconds = time.perf_counter() - start
+
+        results.append(
+            {
+                "rcid_count": 10**exponent,
+                "vote_count": len(data),
+                "matrix_bytes": vote_matrix["votes"].nbytes,
+                "build_seconds": build_seconds,
+                "score_seconds": score_seconds,
+                "join_seconds": join_seconds,
+            }
+        )
+
+    results = pd.DataFrame(results)
+    results["speedup"] = results["join_seconds"] / (
+        results["build_seconds"] + results["score_seconds"]
+    )
+
+    return results
+
+
+if __name__ == "__main__":
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(benchmark_vote_matrix(max_exponent=max_exponent).to_string(index=False))
+    print(
+        benchmark_vote_matrix(max_exponent=max_exponent, method="cosine").to_string(
+            index=False
+        )
+    )
@@ -1,8 +1,178 @@
+import numpy as np
 import pandas as pd
-import altair as alt
 
 
-def column_histogram(data, column_name):
+def _get_vega_bin_edges(min_value, max_value, maxbins=10):
+    """
+    Given the smallest and largest values of a column, return the bin edges
+    Vega-Lite picks for bin=True, so pre-binned histograms match the bins
+    of the browser
+    """
+
+    # A copy of __get_bin_edges in final_project/disney_functions.py, as the
+    # assignments cannot import each other. Keep the two in step; both are
+    # tested against the same expected edges.
+
+    min_value, max_value = float(min_value), float(max_value)
+    span = (max_value - min_value) or abs(min_value) or 1
+
+    # Vega-Lite prefers steps of 1, 2 or 5 times a power of ten
+    level = np.ceil(np.log10(maxbins))
+    step = 10 ** (np.round(np.log10(span)) - level)
+    while np.ceil(span / step) > maxbins:
+        step *= 10
+    for divisor in [5, 2]:
+        if span / (step / divisor) <= maxbins:
+            step /= divisor
+
+    precision = 0 if np.log(step) >= 0 else int(-np.log(step) / np.log(10)) + 1
+    eps = 10 ** (-precision - 1)
+
+    start = np.floor(min_value / step + eps) * step
+    if min_value < start:
+        start -= step
+    stop = np.ceil(max_value / step) * step
+    if stop == start:
+        stop = start + step
+
+    bin_count = int(np.round((stop - start) / step))
+
+    return np.round(start + step * np.arange(bin_count + 1), precision)
+
+
+def _count_bins(values, bin_edges):
+    """
+    Given the values of a column and its bin edges, return the number of
+    values in each bin, ignoring missing values and values outside of the
+    edges
+    """
+
+    # Equal-width bins are counted without sorting or searching the values
+    bin_widths = np.diff(bin_edges)
+    if np.allclose(bin_widths, bin_widths[0]):
+        return np.histogram(values, bins=len(bin_widths), range=bin_edges[[0, -1]])[0]
+
+    return np.histogram(values[~np.isnan(values)], bins=bin_edges)[0]
+
+
+def bin_columns(data, column_names, bins=True):
+    """
+
+    Given a dataframe, this function counts the values of several columns
+    in each bin with NumPy, ignoring missing values. The columns are
+    copied once into a numeric block, whose columns are each scanned in
+    place, rather than converting the dataframe once per column
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        The dataframe to filter
+    column_names : list of str
+        The columns to count
+    bins : True, int, str or sequence of float, optional
+        True for the bins Altair picks with bin=True, the number of
+        equal-width bins, a NumPy bin estimator such as "fd" for
+        Freedman–Diaconis, or the bin edges themselves, in which case
+        values outside of the edges are not counted
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        The 'column_name', 'bin_start', 'bin_end' and 'count' of every bin
+        of every column
+
+    Examples
+    --------
+    >>> bin_columns(spotify, ["danceability", "energy"], bins="fd")
+    """
+
+    # False is an int too, so it is caught before the number of bins
+    if bins is False:
+        raise ValueError(
+            "bins should be True, a number of bins, an estimator or edges, not False"
+        )
+    if bins is not True and isinstance(bins, (int, np.integer)) and bins < 1:
+        raise ValueError(f"bins should be at least 1, not {bins}")
+
+    # Each column of a Fortran ordered block is contiguous in memory
+    block = np.asfortranarray(
+        data[column_names].to_numpy(dtype=np.float64, na_value=np.nan)
+    )
+
+    if bins is True or isinstance(bins, (int, np.integer)):
+        # The ranges of all columns are found in one pass, ignoring missing values
+        min_values = np.fmin.reduce(block, axis=0)
+        max_values = np.fmax.reduce(block, axis=0)
+
+        # Columns without any values are binned from 0 to 1, as in NumPy
+        is_empty = np.isnan(min_values)
+        min_values[is_empty], max_values[is_empty] = 0, 1
+
+        if bins is True:
+            column_edges = [
+                _get_vega_bin_edges(min_value, max_value)
+                for min_value, max_value in zip(min_values, max_values)
+            ]
+        else:
+            is_constant = min_values == max_values
+            min_values[is_constant] -= 0.5
+            max_values[is_constant] += 0.5
+            column_edges = [
+                np.linspace(min_value, max_value, bins + 1)
+                for min_value, max_value in zip(min_values, max_values)
+            ]
+    else:
+        column_edges = [
+            np.histogram_bin_edges(values[~np.isnan(values)], bins=bins)
+            for values in block.T
+        ]
+
+    column_counts = [
+        _count_bins(values, bin_edges)
+        for values, bin_edges in zip(block.T, column_edges)
+    ]
+
+    return pd.DataFrame(
+        {
+            "column_name": np.repeat(
+                column_names, [len(counts) for counts in column_counts]
+            ),
+            "bin_start": np.concatenate([edges[:-1] for edges in column_edges]),
+            "bin_end": np.concatenate([edges[1:] for edges in column_edges]),
+            "count": np.concatenate(column_counts),
+        }
+    )
+
+
+def bin_column(data, column_name, bins=True):
+    """
+
+    Given a dataframe, this function counts the values of a specified
+    column in each bin with NumPy, ignoring missing values
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        The dataframe to filter
+    column_name : str
+        The column values to count
+    bins : True, int, str or sequence of float, optional
+        The bins to count the values in, as in bin_columns
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        The 'bin_start', 'bin_end' and 'count' of every bin
+
+    Examples
+    --------
+    >>> bin_column(chopped, "season", bins="fd")
+    """
+
+    return bin_columns(data, [column_name], bins).drop(columns="column_name")
+
+
+def column_histogram(data, column_name, bins=None):
     """
 
     Given a dataframe, this function creates a histogram
@@ -14,6 +184,11 @@ def column_histogram(data, column_name):
         The dataframe to filter
     column_name : str
         The column values to plot
+    bins : None, True, int, str or sequence of float, optional
+        None to let Altair bin every value of the column in the browser,
+        otherwise the bins to count with NumPy before plotting, as in
+        bin_column. Only the counts of each bin are then embedded in the
+        chart, rather than every row of the dataframe
 
     Returns
     -------
@@ -26,6 +201,9 @@ def column_histogram(data, column_name):
     altair.vegalite.v4.api.Chart
     """
 
+    # Altair is only imported once a histogram is plotted
+    import altair as alt
+
     # This checks if the data variable is of type pd.dataframe
     if not isinstance(data, pd.DataFrame):
         raise TypeError("The data argument is not of type DataFrame")
@@ -33,13 +211,81 @@ def column_histogram(data, column_name):
     column_labels = column_name + ":Q"
 
     # This makes a histogram and plots the values of column_name frequency
+    if bins is None:
+        histogram_plot = (
+            alt.Chart(data)
+            .mark_bar()
+            .encode(
+                alt.X(column_labels, bin=True),
+                y="count()",
+            )
+        )
+    else:
+        histogram_plot = (
+            alt.Chart(bin_column(data, column_name, bins))
+            .mark_bar()
+            .encode(
+                alt.X("bin_start:Q", bin="binned", title=f"{column_name} (binned)"),
+                alt.X2("bin_end:Q"),
+                alt.Y("count:Q", title="Count of Records"),
+            )
+        )
+
+    return histogram_plot
+
+
+def column_histograms(data, column_names, bins=True, columns=3):
+    """
+
+    Given a dataframe, this function creates a histogram of each of the
+    specified columns, faceted into a single chart. The bins of every
+    column are counted together with bin_columns, so the chart only
+    embeds one small table of counts
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        The dataframe to filter
+    column_names : list of str
+        The columns to plot
+    bins : True, int, str or sequence of float, optional
+        The bins to count the values of each column in, as in bin_columns
+    columns : int, optional
+        The number of histograms in each row of the chart
+
+    Returns
+    -------
+    altair.vegalite.v4.api.FacetChart
+        the plotted histograms
+
+    Examples
+    --------
+    >>> column_histograms(spotify, ["danceability", "energy", "tempo"])
+    altair.vegalite.v4.api.FacetChart
+    """
+
+    # Altair is only imported once a histogram is plotted
+    import altair as alt
+
+    # This checks if the data variable is of type pd.dataframe
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError("The data argument is not of type DataFrame")
+
+    # Each column keeps its own bins, so the scales of the facets are independent
     histogram_plot = (
-        alt.Chart(data)
+        alt.Chart(bin_columns(data, column_names, bins))
         .mark_bar()
         .encode(
-            alt.X(column_labels, bin=True),
-            y="count()",
+            alt.X("bin_start:Q", bin="binned", title=None),
+            alt.X2("bin_end:Q"),
+            alt.Y("count:Q", title="Count of Records"),
+        )
+        .properties(width=180, height=120)
+        .facet(
+            facet=alt.Facet("column_name:N", sort=column_names, title=None),
+            columns=columns,
         )
+        .resolve_scale(x="independent", y="independent")
     )
 
     return histogram_plot
@@ -1,7 +1,50 @@
+import os
+
+import numpy as np
 import pandas as pd
 
 
-def sample_dataframe(data, grouping_col, N=1):
+def _draw_group_sample(data, grouping_col, row_keys, N):
+    """
+    Given a dataframe and a random key for each of its rows, return the
+    positions of the N rows with the smallest keys in each group, ordered by
+    group and then by key, along with the group of each row and the size of
+    each group
+    """
+
+    # Number each row by its group, groups being ordered by their value
+    group_codes = (
+        data.groupby(grouping_col).ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    )
+    group_sizes = np.bincount(
+        group_codes[group_codes >= 0], minlength=group_codes.max(initial=-1) + 1
+    )
+
+    # Shuffle the rows within each group at once, then keep the first N of each
+    row_order = np.lexsort((row_keys, group_codes))
+    row_order = row_order[group_codes[row_order] >= 0]
+
+    group_starts = np.cumsum(group_sizes) - group_sizes
+    group_ranks = np.arange(len(row_order)) - group_starts[group_codes[row_order]]
+
+    return row_order[group_ranks < N], group_codes, group_sizes
+
+
+def _check_group_sizes(data, grouping_col, group_codes, group_sizes, N):
+    """
+    Raise a ValueError naming the first group with fewer than N rows
+    """
+
+    if (group_sizes < N).any():
+        small_code = np.argmax(group_sizes < N)
+        small_group = data[grouping_col][group_codes == small_code].iloc[0]
+        raise ValueError(
+            f"The group {small_group!r} has {group_sizes[small_code]} rows, "
+            f"which is fewer than the {N} rows to sample from each group"
+        )
+
+
+def sample_dataframe(data, grouping_col, N=1, random_state=None):
     """
     Given a dataframe, return a smaller sample of the dataframe
     sampling N rows from each specified group
@@ -15,12 +58,20 @@ def sample_dataframe(data, grouping_col, N=1):
     N : int, optional
         The number of rows to sample from each group (The default value is 1
         which implies a single observation)
+    random_state : int or numpy.random.Generator, optional
+        The seed or random number generator used to draw the sample (The
+        default value is None which draws a different sample on every call)
 
     Returns
     -------
     pandas.core.frame.DataFrame
         The new sampled dataframe
 
+    Raises
+    ------
+    ValueError
+        If a group has fewer than N rows
+
     Examples
     --------
     >>> sample_dataframe(pokemon, 'legendary'])
@@ -29,12 +80,85 @@ def sample_dataframe(data, grouping_col, N=1):
     640 Tornadus  641     100       80      flying  5      1
     """
 
-    df_grouped = data.groupby(grouping_col)
+    rng = np.random.default_rng(random_state)
 
-    sampled_df = None
+    sample_positions, group_codes, group_sizes = _draw_group_sample(
+        data, grouping_col, rng.random(len(data)), N
+    )
+    _check_group_sizes(data, grouping_col, group_codes, group_sizes, N)
 
-    for group, rows in df_grouped:
-        group_sampling = df_grouped.get_group(group).sample(N)
-        sampled_df = pd.concat([sampled_df, group_sampling])
+    sampled_df = data.iloc[sample_positions]
 
     return sampled_df
+
+
+def stream_sample_dataframe(
+    source, grouping_col, N=1, chunksize=100_000, random_state=None
+):
+    """
+    Given a csv file or an iterator of dataframe chunks, return a smaller
+    sample of the data sampling N rows from each specified group, while only
+    keeping N rows per group in memory between chunks
+
+    Parameters
+    ----------
+    source : str, os.PathLike or iterable of pandas.core.frame.DataFrame
+        The path of the csv file to sample from, or the chunks to sample from
+    grouping_col : str
+        The column to filter our condition on
+    N : int, optional
+        The number of rows to sample from each group (The default value is 1
+        which implies a single observation)
+    chunksize : int, optional
+        The number of rows to read at a time from a csv file
+    random_state : int or numpy.random.Generator, optional
+        The seed or random number generator used to draw the sample. For a
+        given seed the sample only depends on the order of the chunks
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        The new sampled dataframe, with the same columns and row order as
+        the result of sample_dataframe
+
+    Raises
+    ------
+    ValueError
+        If a group has fewer than N rows
+
+    Examples
+    --------
+    >>> stream_sample_dataframe('data/subvotes.csv', 'country', 5)
+    """
+
+    rng = np.random.default_rng(random_state)
+
+    if isinstance(source, (str, os.PathLike)):
+        chunks = pd.read_csv(source, chunksize=chunksize)
+    else:
+        chunks = source
+
+    # Each row keeps its random key, so the reservoir of a group always holds
+    # the N rows with the smallest keys seen so far
+    reservoir_df = None
+    reservoir_keys = np.empty(0)
+
+    for chunk in chunks:
+        candidate_df = pd.concat([reservoir_df, chunk])
+        candidate_keys = np.concatenate([reservoir_keys, rng.random(len(chunk))])
+
+        sample_positions, _, _ = _draw_group_sample(
+            candidate_df, grouping_col, candidate_keys, N
+        )
+        reservoir_df = candidate_df.iloc[sample_positions]
+        reservoir_keys = candidate_keys[sample_positions]
+
+    if reservoir_df is None:
+        raise ValueError("There are no rows to sample from")
+
+    _, group_codes, group_sizes = _draw_group_sample(
+        reservoir_df, grouping_col, reservoir_keys, N
+    )
+    _check_group_sizes(reservoir_df, grouping_col, group_codes, group_sizes, N)
+
+    return reservoir_df
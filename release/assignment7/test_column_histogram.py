@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The same expected edges are tested in final_project/test_display_histogram.py
+VEGA_BIN_EDGES = [
+    ((1, 44, 10), [0, 5, 10, 15, 20, 25, 30, 35, 40, 45]),
+    ((0.1, 0.9, 10), [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]),
+    ((1, 1, 10), [1, 1.1]),
+    ((1e6, 5e9, 10), [i * 5e8 for i in range(11)]),
+    ((-3.2, 7.5, 20), list(range(-4, 9))),
+    ((0, 1000, 5), [0, 200, 400, 600, 800, 1000]),
+]
+
+
+def test_ch_lazy_altair():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import column_histogram"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_packages = [
+        line.split("|")[-1].strip().split(".")[0]
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    ]
+
+    # Tests that altair is only imported once a histogram is plotted
+    assert "altair" not in imported_packages, "altair should not be imported with column_histogram"
+    return
+
+
+def test_ch_prebinned():
+    import numpy as np
+    import pandas as pd
+
+    from column_histogram import bin_column, column_histogram
+
+    data = pd.DataFrame({"season": [1, 2, 2, 7, 9, 14, 44, np.nan]})
+
+    # Tests that the NumPy bins match the bins Altair picks with bin=True
+    binned = bin_column(data, "season")
+    assert binned["bin_start"].tolist() == [0, 5, 10, 15, 20, 25, 30, 35, 40], "The bins should match the bins of Altair"
+    assert binned["count"].sum() == 7, "Every value but the missing one should be counted"
+    assert binned["count"].tolist()[:3] == [3, 2, 1], "The values are counted in the wrong bins"
+
+    # Tests that fixed counts, estimators and explicit edges are supported
+    assert len(bin_column(data, "season", bins=4)) == 4, "There should be 4 bins"
+    for bins in [False, 0]:
+        with pytest.raises(ValueError):
+            bin_column(data, "season", bins=bins)
+    assert len(bin_column(data, "season", bins="fd")) > 0, "The Freedman-Diaconis bins should be computed"
+    assert bin_column(data, "season", bins=[0, 10, 20])["count"].tolist() == [5, 1], "Values outside of the edges should not be counted"
+
+    # Tests that only the counts of each bin are embedded in the chart
+    histogram_data = column_histogram(data, "season", bins=True).to_dict()["datasets"]
+    assert [len(rows) for rows in histogram_data.values()] == [9], "The chart should embed one row per bin"
+    return
+
+
+def test_chs_batched():
+    import numpy as np
+    import pandas as pd
+
+    from column_histogram import bin_column, bin_columns, column_histograms
+
+    data = pd.DataFrame(
+        {
+            "season": [1, 2, 2, 7, 9, 14, 44, np.nan],
+            "rating": [0.5, 0.1, 0.9, 0.3, np.nan, 0.7, 0.2, 0.4],
+            "episode": [1, 1, 1, 1, 1, 1, 1, 1],
+        }
+    )
+    column_names = ["season", "rating", "episode"]
+
+    # Tests that the batched bins match the bins of each column on its own
+    for bins in [True, 4, "fd"]:
+        binned = bin_columns(data, column_names, bins=bins)
+        assert binned["column_name"].unique().tolist() == column_names, "Every column should be binned in order"
+        for column_name in column_names:
+            column_bins = binned[binned["column_name"] == column_name].drop(columns="column_name")
+            assert column_bins.reset_index(drop=True).equals(bin_column(data, column_name, bins=bins)), f"The bins of {column_name} are incorrect"
+
+    # Tests that a single faceted chart embeds the counts of every column
+    histogram_spec = column_histograms(data, column_names).to_dict()
+    assert len(histogram_spec["datasets"]) == 1, "The chart should embed a single table"
+    assert histogram_spec["facet"]["field"] == "column_name", "The chart should be faceted by column"
+    return
+
+
+def test_ch_vega_bin_edges():
+    import numpy as np
+
+    from column_histogram import _get_vega_bin_edges
+
+    # Tests that the bin edges match the edges Vega-Lite picks with bin=True
+    for (min_value, max_value, maxbins), expected_edges in VEGA_BIN_EDGES:
+        bin_edges = _get_vega_bin_edges(min_value, max_value, maxbins)
+        assert len(bin_edges) == len(expected_edges) and np.allclose(bin_edges, expected_edges), f"The bin edges from {min_value} to {max_value} are incorrect"
+    return
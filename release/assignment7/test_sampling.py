@@ -1,5 +1,5 @@
 import pandas as pd
-from sampling import sample_dataframe
+from sampling import sample_dataframe, stream_sample_dataframe
 
 def test_sd_rows():
     raw = {'id': [1873, 4913, 4801, 4540, 3581,
@@ -132,3 +132,70 @@ def test_sd_cherry():
     assert sampler[sampler['type'] == 'Cherry'].shape[0] == 3, "The dataframe should only have 1 row of type 'cherry'"
 
     return
+
+
+def test_sd_seed():
+    raw = {'id': [1873, 4913, 4801, 4540, 3581,
+                   4534, 1934, 4944, 1983, 1266],
+           'type': ['Oak', 'Cherry', 'Oak', 'Cherry', 'Oak',
+                    'Oak', 'Oak', 'Cherry', 'Cherry', 'Oak']}
+    helper_data = pd.DataFrame.from_dict(raw)
+
+    first = sample_dataframe(helper_data, 'type', 2, random_state=42)
+    second = sample_dataframe(helper_data, 'type', 2, random_state=42)
+
+    # Tests that the same seed draws the same sample
+    assert first.equals(second), "The same seed should draw the same sample"
+    return
+
+
+def test_sd_small_group():
+    raw = {'id': [1873, 4913, 4801, 4540, 3581],
+           'type': ['Oak', 'Cherry', 'Oak', 'Cherry', 'Oak']}
+    helper_data = pd.DataFrame.from_dict(raw)
+
+    # Tests that sampling more rows than a group has raises an error
+    try:
+        sample_dataframe(helper_data, 'type', 3)
+    except ValueError as error:
+        assert "'Cherry'" in str(error), "The error should name the small group"
+    else:
+        assert False, "Sampling more rows than a group has should raise a ValueError"
+    return
+
+
+def test_ssd_chunks():
+    raw = {'id': [1873, 4913, 4801, 4540, 3581,
+                   4534, 1934, 4944, 1983, 1266],
+           'type': ['Oak', 'Cherry', 'Oak', 'Cherry', 'Oak',
+                    'Oak', 'Oak', 'Cherry', 'Cherry', 'Oak']}
+    helper_data = pd.DataFrame.from_dict(raw)
+
+    def chunks():
+        for start in range(0, 10, 4):
+            yield helper_data.iloc[start:start + 4]
+
+    first = stream_sample_dataframe(chunks(), 'type', 3, random_state=7)
+    second = stream_sample_dataframe(chunks(), 'type', 3, random_state=7)
+
+    # Tests that streamed chunks give 3 rows of each type, the same for the same seed
+    assert first.shape == (6, 2), "The dataframe is not of the expected dimensions"
+    assert list(first['type']) == ['Cherry'] * 3 + ['Oak'] * 3, "The rows should be ordered by group"
+    assert first.equals(second), "The same seed should draw the same sample"
+    return
+
+
+def test_ssd_csv(tmp_path):
+    raw = {'id': [1873, 4913, 4801, 4540, 3581,
+                   4534, 1934, 4944, 1983, 1266],
+           'type': ['Oak', 'Cherry', 'Oak', 'Cherry', 'Oak',
+                    'Oak', 'Oak', 'Cherry', 'Cherry', 'Oak']}
+    helper_data = pd.DataFrame.from_dict(raw)
+    helper_data.to_csv(tmp_path / 'trees.csv', index=False)
+
+    sampler = stream_sample_dataframe(tmp_path / 'trees.csv', 'type', 2, chunksize=3)
+
+    # Tests that every sampled row comes from the csv file
+    assert sampler.shape == (4, 2), "The dataframe is not of the expected dimensions"
+    assert sampler.equals(helper_data.loc[sampler.index]), "The sampled rows should match the csv rows"
+    return
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+from vote_matrix import (
+    agreement_scores,
+    build_vote_matrix,
+    load_vote_matrix,
+    save_vote_matrix,
+)
+
+
+def _get_votes():
+    raw = {
+        "rcid": [10, 10, 10, 11, 11, 12, 12, 12],
+        "country": ["USA", "Canada", "Cuba", "USA", "Canada", "USA", "Canada", "Cuba"],
+        "vote": [1, 1, 3, 1, 2, 3, 3, 3],
+    }
+    return pd.DataFrame.from_dict(raw)
+
+
+def test_vm_pivot():
+    vote_matrix = build_vote_matrix(_get_votes())
+
+    # Tests that every vote lands in its country and roll call, missing votes as 0
+    assert vote_matrix["votes"].dtype == np.int8
+    assert vote_matrix["countries"].tolist() == ["Canada", "Cuba", "USA"]
+    assert vote_matrix["rcids"].tolist() == [10, 11, 12]
+    assert vote_matrix["votes"].tolist() == [[1, 2, 3], [3, 0, 3], [1, 1, 3]]
+
+    with pytest.raises(ValueError):
+        build_vote_matrix(pd.concat([_get_votes(), _get_votes().head(1)]))
+
+    # Tests that votes without a country or roll call are left out, and unknown votes rejected
+    unplaced = pd.DataFrame(
+        {"rcid": [13, np.nan], "country": [None, "USA"], "vote": [1, 1]}
+    )
+    unplaced_matrix = build_vote_matrix(pd.concat([_get_votes(), unplaced]))
+    assert unplaced_matrix["votes"].tolist() == vote_matrix["votes"].tolist()
+    assert unplaced_matrix["rcids"].tolist() == [10, 11, 12]
+
+    miscoded = _get_votes().assign(vote=[1, 1, 3, 1, 2, 3, 3, 9])
+    with pytest.raises(ValueError):
+        build_vote_matrix(miscoded)
+    with pytest.raises(ValueError):
+        agreement_scores({**vote_matrix, "votes": vote_matrix["votes"] + 5})
+    return
+
+
+def test_vm_agreement():
+    votes = _get_votes()
+    scores = agreement_scores(build_vote_matrix(votes))
+
+    # Tests that the scores match merging the votes with themselves
+    pairs = votes.merge(votes, on="rcid")
+    expected = (
+        (pairs["vote_x"] == pairs["vote_y"])
+        .groupby([pairs["country_x"], pairs["country_y"]])
+        .mean()
+        .unstack()
+    )
+    np.testing.assert_allclose(scores.to_numpy(), expected.to_numpy())
+    assert scores.loc["USA", "Canada"] == pytest.approx(2 / 3)
+
+    # Tests that the cosine similarity only uses the shared roll calls
+    cosine = agreement_scores(build_vote_matrix(votes), method="cosine")
+    assert cosine.loc["USA", "Cuba"] == pytest.approx(0)
+    assert cosine.loc["USA", "Canada"] == pytest.approx(2 / np.sqrt(6))
+    return
+
+
+def test_vm_saved(tmp_path):
+    vote_matrix = build_vote_matrix(_get_votes())
+    matrix_path = str(tmp_path / "subvotes.npy")
+
+    save_vote_matrix(vote_matrix, matrix_path)
+    loaded_matrix = load_vote_matrix(matrix_path)
+
+    # Tests that the saved votes are memory mapped back with their labels
+    assert isinstance(loaded_matrix["votes"], np.memmap)
+    assert loaded_matrix["countries"].tolist() == vote_matrix["countries"].tolist()
+    pd.testing.assert_frame_equal(
+        agreement_scores(loaded_matrix, chunk_size=2), agreement_scores(vote_matrix)
+    )
+    return
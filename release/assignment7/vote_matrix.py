@@ -0,0 +1,181 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# The votes of subvotes.csv, with 0 kept for roll calls a country missed
+VOTE_CODES = {"yes": 1, "abstain": 2, "no": 3}
+MISSING_VOTE = 0
+
+
+def build_vote_matrix(data, country_col="country", rcid_col="rcid", vote_col="vote"):
+    """
+
+    Given a long dataframe of votes, this function pivots it into a
+    compact matrix with a row for each country and a column for each roll
+    call, without merging the dataframe with itself. Votes missing their
+    country or roll call are left out
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        The dataframe of votes, with one row for each country and roll call
+    country_col : str, optional
+        The column of countries
+    rcid_col : str, optional
+        The column of roll call ids
+    vote_col : str, optional
+        The column of votes, coded as in VOTE_CODES
+
+    Returns
+    -------
+    dict
+        the int8 'votes' matrix, holding MISSING_VOTE where a country did
+        not vote, along with the sorted 'countries' and 'rcids' of its rows
+        and columns
+
+    Examples
+    --------
+    >>> build_vote_matrix(subvotes)
+    """
+
+    # This checks if the data variable is of type pd.dataframe
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError("The data argument is not of type DataFrame")
+
+    # A vote without a country or roll call has no cell, so it is left out
+    has_keys = data[country_col].notna() & data[rcid_col].notna()
+    if not has_keys.all():
+        data = data[has_keys]
+
+    is_coded = data[vote_col].isin([MISSING_VOTE, *VOTE_CODES.values()])
+    if not is_coded.all():
+        raise ValueError(
+            f"The votes should be coded as in VOTE_CODES, not {data.loc[~is_coded, vote_col].unique()[:5].tolist()}"
+        )
+
+    country_codes, countries = pd.factorize(data[country_col], sort=True)
+    rcid_codes, rcids = pd.factorize(data[rcid_col], sort=True)
+
+    # A vote cast twice would fill the same cell, so fewer cells are filled than rows
+    is_filled = np.zeros((len(countries), len(rcids)), dtype=bool)
+    is_filled[country_codes, rcid_codes] = True
+    if np.count_nonzero(is_filled) < len(data):
+        raise ValueError("Each country should only vote once on each roll call")
+
+    votes = np.full((len(countries), len(rcids)), MISSING_VOTE, dtype=np.int8)
+    votes[country_codes, rcid_codes] = data[vote_col].to_numpy(dtype=np.int8)
+
+    return {
+        "votes": votes,
+        "countries": np.asarray(countries, dtype=str),
+        "rcids": np.asarray(rcids),
+    }
+
+
+def _get_labels_path(matrix_path):
+    """
+    Given the path of a saved vote matrix, return the path of its labels
+    """
+
+    return os.path.splitext(matrix_path)[0] + "_labels.npz"
+
+
+def save_vote_matrix(vote_matrix, matrix_path):
+    """
+    Given a vote matrix, save its votes to a .npy file which can be memory
+    mapped, and its countries and roll call ids next to it
+    """
+
+    np.save(matrix_path, vote_matrix["votes"])
+    np.savez(
+        _get_labels_path(matrix_path),
+        countries=vote_matrix["countries"],
+        rcids=vote_matrix["rcids"],
+    )
+
+
+def load_vote_matrix(matrix_path, mmap_mode="r"):
+    """
+    Given the path of a vote matrix saved with save_vote_matrix, return the
+    vote matrix, its votes memory mapped from the file unless mmap_mode is
+    None
+    """
+
+    with np.load(_get_labels_path(matrix_path)) as labels:
+        return {
+            "votes": np.load(matrix_path, mmap_mode=mmap_mode),
+            "countries": labels["countries"],
+            "rcids": labels["rcids"],
+        }
+
+
+def agreement_scores(vote_matrix, method="agreement", chunk_size=2**14):
+    """
+
+    Given a vote matrix, this function scores how much every pair of
+    countries agree over the roll calls they both voted on, with masked
+    matrix products over all pairs at once. The roll calls are processed
+    in chunks, so the indicator matrices stay small
+
+    Parameters
+    ----------
+    vote_matrix : dict
+        The vote matrix, as in build_vote_matrix
+    method : {'agreement', 'cosine'}, optional
+        'agreement' for the share of shared roll calls with the same vote,
+        or 'cosine' for the cosine similarity of the votes scored as yes 1,
+        abstain 0 and no -1 over the shared roll calls
+    chunk_size : int, optional
+        The number of roll calls to multiply at a time
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        the score of each pair of countries, missing for pairs without a
+        shared roll call
+
+    Examples
+    --------
+    >>> agreement_scores(build_vote_matrix(subvotes), method="cosine")
+    """
+
+    if method not in ["agreement", "cosine"]:
+        raise ValueError(f"method should be 'agreement' or 'cosine', not {method!r}")
+
+    votes = vote_matrix["votes"]
+    country_count = len(votes)
+    vote_scores = np.zeros(max(VOTE_CODES.values()) + 1, dtype=np.float32)
+    vote_scores[[VOTE_CODES["yes"], VOTE_CODES["no"]]] = [1, -1]
+
+    # The counts of each chunk are exact in float32, and are summed in float64
+    shared_counts = np.zeros((country_count, country_count))
+    same_counts = np.zeros((country_count, country_count))
+    norm_counts = np.zeros((country_count, country_count))
+
+    for start in range(0, votes.shape[1], chunk_size):
+        chunk = np.asarray(votes[:, start : start + chunk_size])
+        if chunk.size and (chunk.min() < 0 or chunk.max() >= len(vote_scores)):
+            raise ValueError("The votes should be coded as in VOTE_CODES")
+        has_voted = (chunk != MISSING_VOTE).astype(np.float32)
+        shared_counts += has_voted @ has_voted.T
+
+        if method == "agreement":
+            for vote_code in VOTE_CODES.values():
+                is_vote = (chunk == vote_code).astype(np.float32)
+                same_counts += is_vote @ is_vote.T
+        else:
+            scores = vote_scores[chunk]
+            same_counts += scores @ scores.T
+            # The squared scores of each country over the roll calls shared with another
+            norm_counts += (scores * scores) @ has_voted.T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if method == "agreement":
+            pair_scores = same_counts / shared_counts
+        else:
+            pair_scores = same_counts / np.sqrt(norm_counts * norm_counts.T)
+    pair_scores[shared_counts == 0] = np.nan
+
+    countries = pd.Index(vote_matrix["countries"], name="country")
+    return pd.DataFrame(pair_scores, index=countries, columns=countries)
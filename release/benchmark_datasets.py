@@ -0,0 +1,95 @@
+"""
+Times loading every csv dataset of the assignments by parsing the csv, from
+the warm columnar cache and from the memory mapped cache.
+
+    python benchmark_datasets.py 5
+"""
+
+import glob
+import os
+import sys
+import time
+
+import pandas as pd
+
+from datasets import DATASET_READ_OPTIONS, RELEASE_DIR, get_cache_path, load_dataset
+
+
+def time_load(load, repeat):
+    """
+    Given a function loading a dataset, return the fastest of repeat loads
+    in seconds
+    """
+
+    load_seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load()
+        load_seconds.append(time.perf_counter() - start)
+
+    return min(load_seconds)
+
+
+def benchmark_datasets(repeat=5):
+    """
+    Times each csv dataset of the assignments parsed with read_csv, loaded
+    from the warm columnar cache and loaded from the memory mapped cache.
+    The _late copies are skipped, being the same files.
+
+    Parameters
+    ----------
+    repeat : int, optional
+        The number of loads to take the fastest of
+
+    Returns
+    -------
+    pandas.DataFrame
+        the csv size, cache size and load times of each dataset, with the
+        speedup of both cached loads over read_csv
+
+    Examples
+    --------
+    >>> benchmark_datasets(repeat=3)
+    """
+
+    csv_paths = sorted(
+        csv_path
+        for csv_path in glob.glob(os.path.join(RELEASE_DIR, "*", "data", "*.csv"))
+        if not os.path.basename(os.path.dirname(os.path.dirname(csv_path))).endswith(
+            "_late"
+        )
+    )
+
+    results = []
+    for csv_path in csv_paths:
+        read_options = DATASET_READ_OPTIONS.get(os.path.basename(csv_path), {})
+
+        # The first load writes the cache, so the later ones are warm.
+        load_dataset(csv_path)
+
+        results.append(
+            {
+                "dataset": os.path.relpath(csv_path, RELEASE_DIR),
+                "csv_bytes": os.path.getsize(csv_path),
+                "cache_bytes": os.path.getsize(get_cache_path(csv_path)),
+                "csv_seconds": time_load(
+                    lambda: pd.read_csv(csv_path, **read_options), repeat
+                ),
+                "cache_seconds": time_load(lambda: load_dataset(csv_path), repeat),
+                "mapped_seconds": time_load(
+                    lambda: load_dataset(csv_path, memory_map=True), repeat
+                ),
+            }
+        )
+
+    results = pd.DataFrame(results)
+    results["cache_speedup"] = results["csv_seconds"] / results["cache_seconds"]
+    results["mapped_speedup"] = results["csv_seconds"] / results["mapped_seconds"]
+
+    return results
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(benchmark_datasets(repeat=repeat).to_string(index=False))
@@ -0,0 +1,111 @@
+"""
+Times parse_date_column against pd.to_datetime inferring the format of
+every date, on the date_added column of the netflix titles resampled to
+10^4 rows upwards and on as many distinct dates in the same two formats.
+
+    python benchmark_date_parser.py 6
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from datasets import load_dataset
+from date_parser import _FORMAT_CACHE, parse_date_column
+
+
+def make_distinct_dates(row_count, seed=0):
+    """
+    Given a number of rows, return that many distinct dates, written half
+    as '22-Apr-15' and half as ' August 31, 2018'
+    """
+
+    rng = np.random.default_rng(seed)
+    dates = pd.Series(
+        pd.Timestamp("1900-01-01")
+        + pd.to_timedelta(rng.permutation(row_count), unit="min")
+    )
+    is_long = rng.random(row_count) < 0.5
+
+    return dates.dt.strftime("%d-%b-%y %H:%M").where(
+        ~is_long, dates.dt.strftime(" %B %d, %Y %H:%M")
+    )
+
+
+def benchmark_date_parser(max_exponent=6):
+    """
+    Given the largest number of rows as a power of ten, time parsing the
+    dates with per-element inference, with parse_date_column detecting the
+    formats and with parse_date_column reusing the cached formats
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest number of rows
+
+    Returns
+    -------
+    pandas.DataFrame
+        the seconds taken by each parser on each column for each number of
+        rows, with the speedup over per-element inference
+
+    Examples
+    --------
+    >>> benchmark_date_parser(max_exponent=5)
+    """
+
+    date_added = load_dataset("netflix_titles")["date_added"]
+    rng = np.random.default_rng(0)
+    formats = ["%d-%b-%y", "%B %d, %Y", "%d-%b-%y %H:%M", "%B %d, %Y %H:%M"]
+
+    results = []
+    for exponent in range(4, max_exponent + 1):
+        columns = {
+            "date_added": date_added.iloc[
+                rng.integers(len(date_added), size=10**exponent)
+            ].reset_index(drop=True),
+            "distinct": make_distinct_dates(10**exponent),
+        }
+
+        for column_name, dates in columns.items():
+            parsers = {
+                "inferred": lambda: pd.to_datetime(
+                    dates.str.strip(), format="mixed", errors="coerce"
+                ),
+                "detected": lambda: parse_date_column(dates, formats=formats),
+                "cached": lambda: parse_date_column(
+                    dates, cache_key=column_name, formats=formats
+                ),
+            }
+
+            # The formats are cached before the cached parse is timed.
+            _FORMAT_CACHE.pop(column_name, None)
+            parse_date_column(dates.head(1000), cache_key=column_name, formats=formats)
+
+            for parser, parse in parsers.items():
+                start = time.perf_counter()
+                parse()
+                results.append(
+                    {
+                        "row_count": 10**exponent,
+                        "column": column_name,
+                        "parser": parser,
+                        "seconds": time.perf_counter() - start,
+                    }
+                )
+
+    results = pd.DataFrame(results)
+    inferred_seconds = results.groupby(["row_count", "column"])["seconds"].transform(
+        "first"
+    )
+    results["speedup"] = inferred_seconds / results["seconds"]
+
+    return results
+
+
+if __name__ == "__main__":
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+
+    print(benchmark_date_parser(max_exponent=max_exponent).to_string(index=False))
@@ -0,0 +1,85 @@
+"""
+Times parse_durations against splitting each duration in python with
+Series.apply(str.split), on the netflix titles resampled to 10^4 rows
+upwards.
+
+    python benchmark_netflix_functions.py 7
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from datasets import load_dataset
+from netflix_functions import parse_durations
+
+
+def split_durations(data):
+    """
+    Given the netflix titles, return their minutes and seasons by splitting
+    each duration with Series.apply(str.split)
+    """
+
+    duration_parts = data["duration"].dropna().apply(str.split)
+    lengths = duration_parts.str[0].astype(int)
+    is_minutes = duration_parts.str[1] == "min"
+
+    return pd.DataFrame(
+        {
+            "duration_minutes": lengths[is_minutes],
+            "duration_seasons": lengths[~is_minutes],
+        }
+    ).reindex(data.index)
+
+
+def benchmark_parse_durations(max_exponent=7):
+    """
+    Given the largest number of rows as a power of ten, time parse_durations
+    and split_durations for 10^4 rows upwards
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest number of rows
+
+    Returns
+    -------
+    pandas.DataFrame
+        the seconds and rows per second of both parsers for each number of
+        rows
+
+    Examples
+    --------
+    >>> benchmark_parse_durations(max_exponent=6)
+    """
+
+    netflix = load_dataset("netflix_titles")[["type", "duration"]]
+    rng = np.random.default_rng(0)
+
+    results = []
+    for exponent in range(4, max_exponent + 1):
+        data = netflix.iloc[rng.integers(len(netflix), size=10**exponent)]
+        data = data.reset_index(drop=True)
+
+        for parser in [split_durations, parse_durations]:
+            start = time.perf_counter()
+            parser(data)
+            seconds = time.perf_counter() - start
+            results.append(
+                {
+                    "row_count": 10**exponent,
+                    "parser": parser.__name__,
+                    "seconds": seconds,
+                    "rows_per_second": 10**exponent / seconds,
+                }
+            )
+
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+    print(benchmark_parse_durations(max_exponent=max_exponent).to_string(index=False))
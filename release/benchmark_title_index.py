@@ -0,0 +1,160 @@
+"""
+Times the questions asked of the netflix titles with string scans against
+the sparse title index, on the titles resampled to 10^4 rows upwards.
+
+    python benchmark_title_index.py 6
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from datasets import load_dataset
+from title_index import (
+    build_title_index,
+    count_cooccurrences,
+    count_titles,
+    find_titles,
+    load_title_index,
+    save_title_index,
+)
+
+
+def time_query(query, repeat=3):
+    """
+    Given a function asking a question, return the fastest of repeat runs
+    in seconds
+    """
+
+    query_seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        query()
+        query_seconds.append(time.perf_counter() - start)
+
+    return min(query_seconds)
+
+
+def benchmark_title_index(max_exponent=6, actor="Adam Sandler", country="India"):
+    """
+    Given the largest number of rows as a power of ten, time finding the
+    titles of an actor, counting the titles of every country and counting
+    the directors an actor shares titles with, by scanning the strings and
+    with the title index, along with building, saving and loading the index
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest number of rows
+    actor : str, optional
+        The cast member to look for
+    country : str, optional
+        The country to look for
+
+    Returns
+    -------
+    pandas.DataFrame
+        the seconds taken by each question with both approaches, and by
+        the index itself, for each number of rows
+
+    Examples
+    --------
+    >>> benchmark_title_index(max_exponent=5)
+    """
+
+    netflix = load_dataset("netflix_titles")
+    rng = np.random.default_rng(0)
+
+    def split_field(data, field):
+        tokens = data[field].str.split(",").explode().str.strip()
+        return tokens[tokens.notna() & (tokens != "")]
+
+    def count_matches(data, field, tokens):
+        return (
+            split_field(data, field)
+            .isin(tokens)
+            .groupby(level=0)
+            .sum()
+            .reindex(data.index, fill_value=0)
+        )
+
+    def scan_cooccurrences(data):
+        titles = data[count_matches(data, "cast", [actor]) > 0]
+        return split_field(titles, "director").value_counts()
+
+    results = []
+    for exponent in range(4, max_exponent + 1):
+        data = netflix.iloc[rng.integers(len(netflix), size=10**exponent)]
+        data = data.reset_index(drop=True)
+
+        start = time.perf_counter()
+        index = build_title_index(data)
+        build_seconds = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as index_dir:
+            index_path = os.path.join(index_dir, "netflix_titles.npz")
+            start = time.perf_counter()
+            save_title_index(index, index_path)
+            save_seconds = time.perf_counter() - start
+            load_seconds = time_query(lambda: load_title_index(index_path))
+
+        questions = {
+            "find_titles": (
+                lambda: data[data["cast"].str.contains(actor, na=False, regex=False)],
+                lambda: data.iloc[find_titles(index, "cast", actor)],
+            ),
+            "count_titles": (
+                lambda: split_field(data, "country").value_counts(),
+                lambda: count_titles(index, "country"),
+            ),
+            "find_all_titles": (
+                lambda: data[
+                    count_matches(data, "country", ["United States", country]) == 2
+                ],
+                lambda: data.iloc[
+                    find_titles(index, "country", ["United States", country], "all")
+                ],
+            ),
+            "count_cooccurrences": (
+                lambda: scan_cooccurrences(data),
+                lambda: count_cooccurrences(index, "cast", actor, "director"),
+            ),
+        }
+
+        for question, (scan_query, index_query) in questions.items():
+            results.append(
+                {
+                    "row_count": 10**exponent,
+                    "question": question,
+                    "scan_seconds": time_query(scan_query),
+                    "index_seconds": time_query(index_query),
+                }
+            )
+        for question, index_seconds in [
+            ("build_index", build_seconds),
+            ("save_index", save_seconds),
+            ("load_index", load_seconds),
+        ]:
+            results.append(
+                {
+                    "row_count": 10**exponent,
+                    "question": question,
+                    "scan_seconds": np.nan,
+                    "index_seconds": index_seconds,
+                }
+            )
+
+    results = pd.DataFrame(results)
+    results["speedup"] = results["scan_seconds"] / results["index_seconds"]
+
+    return results
+
+
+if __name__ == "__main__":
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+
+    print(benchmark_title_index(max_exponent=max_exponent).to_string(index=False))
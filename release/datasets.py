@@ -0,0 +1,414 @@
+"""
+Loads the csv datasets of the assignments through a columnar cache.
+
+The first load of a dataset parses its csv as usual and saves the parsed
+columns next to it as an uncompressed Arrow file. Later loads read that file
+instead of parsing the csv again, either into the same dataframe read_csv
+returns or, with memory_map=True, into Arrow backed columns which stay in
+the memory mapped file. The cache is rebuilt whenever the csv changes.
+
+The data directories repeat the same files across assignments and their
+_late copies, so every file can also be stored once by content. The store
+keeps one blob per unique file and a manifest of the data files which are
+copies of each blob, and the datasets it lists are read from their blob and
+share one cache, whichever copy they are loaded through.
+
+    from datasets import load_dataset
+
+    netflix = load_dataset("netflix_titles")
+    chopped = load_dataset("chopped", parse_dates=["air_date"])
+
+    python datasets.py --link
+"""
+
+#######################
+### Import Packages ###
+#######################
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+
+import pandas as pd
+
+RELEASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STORE_DIR = os.path.join(RELEASE_DIR, ".datasets")
+CACHE_SUFFIX = ".arrow"
+
+# The read_csv options of the datasets which cannot be read with the defaults.
+DATASET_READ_OPTIONS = {
+    "wine_b.csv": {"header": 1},
+    "wine_c.csv": {"skipfooter": 2, "engine": "python"},
+}
+
+#####################
+### Find Datasets ###
+#####################
+
+
+def find_dataset(name):
+    """
+    Returns the path of a csv dataset, given either its path or the name of
+    a file in the data directory of one of the assignments.
+
+    Parameters
+    ----------
+    name : str
+        The path of the csv file, or its name with or without '.csv'
+
+    Returns
+    -------
+    str
+        the path of the csv file
+
+    Examples
+    --------
+    >>> find_dataset("netflix_titles")
+    """
+
+    if os.path.isfile(name):
+        return name
+
+    file_name = name if os.path.splitext(name)[1] else f"{name}.csv"
+    for pattern in [
+        os.path.join(RELEASE_DIR, "*", "data", file_name),
+        os.path.join(RELEASE_DIR, "*", file_name),
+    ]:
+        csv_paths = sorted(glob.glob(pattern))
+        if csv_paths:
+            return csv_paths[0]
+
+    raise FileNotFoundError(f"There is no dataset named {name!r}")
+
+
+#####################
+### Dataset Store ###
+#####################
+
+# The manifest of the store, reloaded whenever the file changes.
+_MANIFEST = {}
+
+
+def hash_file(file_path, chunk_size=2**20):
+    """
+    Returns the SHA-256 hash of the content of a file.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file
+    chunk_size : int, optional
+        The number of bytes to read at a time
+
+    Returns
+    -------
+    str
+        the hexadecimal hash
+
+    Examples
+    --------
+    >>> hash_file("assignment7/data/chopped.csv")
+    """
+
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as data_file:
+        for chunk in iter(lambda: data_file.read(chunk_size), b""):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+def build_dataset_store(link=False):
+    """
+    Stores every file in the data directories of the assignments once per
+    unique content, and saves the manifest of which files are copies of
+    which blob.
+
+    Parameters
+    ----------
+    link : bool, optional
+        Whether to replace each copy with a hard link to its blob, so the
+        disk only holds one copy of each file. Blobs are read-only, so a
+        linked copy has to be removed before it is written to
+
+    Returns
+    -------
+    dict
+        the 'blob', 'size' and 'mtime_ns' of each data file, keyed by its
+        path relative to the release directory
+
+    Examples
+    --------
+    >>> build_dataset_store(link=True)
+    """
+
+    blob_dir = os.path.join(STORE_DIR, "blobs")
+    os.makedirs(blob_dir, exist_ok=True)
+
+    manifest = {}
+    for data_path in sorted(glob.glob(os.path.join(RELEASE_DIR, "*", "data", "*"))):
+        if not os.path.isfile(data_path):
+            continue
+
+        blob = hash_file(data_path)
+        blob_path = os.path.join(blob_dir, blob)
+        if not os.path.exists(blob_path):
+            shutil.copy2(data_path, f"{blob_path}.tmp")
+            # Hard links share the blob, so writing to one in place would change every copy.
+            os.chmod(f"{blob_path}.tmp", 0o444)
+            os.replace(f"{blob_path}.tmp", blob_path)
+
+        if link and not os.path.samefile(data_path, blob_path):
+            try:
+                os.link(blob_path, f"{data_path}.tmp")
+                os.replace(f"{data_path}.tmp", data_path)
+            except OSError:
+                # Hard links cannot cross file systems, so the copy is kept.
+                pass
+
+        data_stat = os.stat(data_path)
+        manifest[os.path.relpath(data_path, RELEASE_DIR)] = {
+            "blob": blob,
+            "size": data_stat.st_size,
+            "mtime_ns": data_stat.st_mtime_ns,
+        }
+
+    manifest_path = os.path.join(STORE_DIR, "manifest.json")
+    with open(f"{manifest_path}.tmp", "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    return manifest
+
+
+def resolve_dataset(data_path):
+    """
+    Returns the blob of a data file listed in the manifest of the store, as
+    long as the file has not changed since the store was built.
+
+    Parameters
+    ----------
+    data_path : str
+        The path of the data file
+
+    Returns
+    -------
+    str or None
+        the path of the blob, or None if the file is not in the store
+
+    Examples
+    --------
+    >>> resolve_dataset("assignment8/data/netflix_titles.csv")
+    """
+
+    manifest_path = os.path.join(STORE_DIR, "manifest.json")
+    try:
+        manifest_mtime_ns = os.stat(manifest_path).st_mtime_ns
+        if (
+            _MANIFEST.get("path") != manifest_path
+            or _MANIFEST.get("mtime_ns") != manifest_mtime_ns
+        ):
+            with open(manifest_path) as manifest_file:
+                _MANIFEST.update(
+                    path=manifest_path,
+                    mtime_ns=manifest_mtime_ns,
+                    entries=json.load(manifest_file),
+                )
+        data_stat = os.stat(data_path)
+    except (OSError, ValueError):
+        return None
+
+    entry = _MANIFEST["entries"].get(
+        os.path.relpath(os.path.abspath(data_path), RELEASE_DIR)
+    )
+    if (
+        entry is None
+        or entry["size"] != data_stat.st_size
+        or entry["mtime_ns"] != data_stat.st_mtime_ns
+    ):
+        return None
+
+    return os.path.join(STORE_DIR, "blobs", entry["blob"])
+
+
+#####################
+### Dataset Cache ###
+#####################
+
+
+def get_cache_path(csv_path, read_options=None):
+    """
+    Returns the path of the columnar cache of a csv file, which is kept in
+    the store for datasets the store lists, so every copy shares it. Each
+    set of read_csv options passed to load_dataset is cached separately.
+
+    Parameters
+    ----------
+    csv_path : str
+        The path of the csv file
+    read_options : dict, optional
+        The keyword arguments passed to read_csv
+
+    Returns
+    -------
+    str
+        the path of the Arrow file next to the csv file or its blob
+
+    Examples
+    --------
+    >>> get_cache_path("assignment7/data/chopped.csv")
+    """
+
+    blob_path = resolve_dataset(csv_path)
+    if blob_path is None:
+        cache_stem = os.path.splitext(csv_path)[0]
+    else:
+        cache_stem = os.path.join(STORE_DIR, "cache", os.path.basename(blob_path))
+
+    if read_options:
+        options_key = json.dumps(read_options, sort_keys=True, default=repr)
+        cache_stem += "-" + hashlib.sha1(options_key.encode()).hexdigest()[:8]
+
+    return cache_stem + CACHE_SUFFIX
+
+
+def __get_source_key(csv_path, read_options):
+    # The cache is only used while the csv keeps the size and time it had when cached.
+    source_stat = os.stat(csv_path)
+    return json.dumps(
+        {
+            "size": source_stat.st_size,
+            "mtime_ns": source_stat.st_mtime_ns,
+            "read_options": read_options,
+        },
+        sort_keys=True,
+        default=repr,
+    ).encode()
+
+
+#####################
+### Load Datasets ###
+#####################
+
+
+def __read_cache(cache_path, source_key, memory_map):
+    import pyarrow as pa
+
+    try:
+        cache_file = pa.memory_map(cache_path)
+        table = pa.ipc.open_file(cache_file).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+
+    if (table.schema.metadata or {}).get(b"source_key") != source_key:
+        return None
+
+    if memory_map:
+        # Arrow backed columns keep pointing into the mapped file instead of copying it.
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    return table.to_pandas()
+
+
+def __write_cache(cache_path, source_key, dataset_df):
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(dataset_df)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), b"source_key": source_key}
+    )
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+    # Written to a temporary file first, so a half written cache is never read.
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with pa.OSFile(temporary_path, "wb") as cache_file:
+            with pa.ipc.new_file(cache_file, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+
+def load_dataset(name, memory_map=False, **read_options):
+    """
+    Loads a csv dataset, parsing it only the first time it is loaded and
+    reading the columnar cache saved next to it afterwards.
+
+    Parameters
+    ----------
+    name : str
+        The path of the csv file, or its name in the data directory of one
+        of the assignments, as in find_dataset
+    memory_map : bool, optional
+        Whether to return Arrow backed columns read straight from the
+        memory mapped cache, rather than the dtypes read_csv returns
+    **read_options
+        The keyword arguments to pass to read_csv, such as engine="python"
+        or parse_dates, on top of those in DATASET_READ_OPTIONS
+
+    Returns
+    -------
+    pandas.DataFrame
+        the dataset
+
+    Examples
+    --------
+    >>> load_dataset("netflix_titles")
+    >>> load_dataset("chopped", parse_dates=["air_date"])
+    """
+
+    csv_path = find_dataset(name)
+    cache_path = get_cache_path(csv_path, read_options)
+
+    read_options = {
+        **DATASET_READ_OPTIONS.get(os.path.basename(csv_path), {}),
+        **read_options,
+    }
+
+    # Datasets in the store are read from their blob, whichever copy is named.
+    csv_path = resolve_dataset(csv_path) or csv_path
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return pd.read_csv(csv_path, **read_options)
+
+    source_key = __get_source_key(csv_path, read_options)
+
+    dataset_df = __read_cache(cache_path, source_key, memory_map)
+    if dataset_df is not None:
+        return dataset_df
+
+    dataset_df = pd.read_csv(csv_path, **read_options)
+    __write_cache(cache_path, source_key, dataset_df)
+
+    if memory_map:
+        mapped_df = __read_cache(cache_path, source_key, memory_map)
+        if mapped_df is not None:
+            return mapped_df
+
+    return dataset_df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Store the data files of the assignments once per content."
+    )
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="replace each copy with a hard link to its blob",
+    )
+    args = parser.parse_args()
+
+    manifest = build_dataset_store(link=args.link)
+    blob_sizes = {entry["blob"]: entry["size"] for entry in manifest.values()}
+    print(
+        f"{len(manifest)} files ({sum(entry['size'] for entry in manifest.values())} bytes)"
+        f" stored as {len(blob_sizes)} blobs ({sum(blob_sizes.values())} bytes)"
+    )
@@ -0,0 +1,201 @@
+"""
+Parses the date columns of the assignments, which mix layouts such as
+'22-Apr-15' and ' August 31, 2018' within a single column.
+
+The formats of a column are detected from a sample of its distinct dates,
+and the dates of each format are then parsed with one call to
+pd.to_datetime with that format, rather than inferring the format of every
+date separately. The formats detected for a file and column are cached, and
+dates no format could parse are returned rather than silently left missing.
+
+    from date_parser import parse_date_column
+
+    date_added, unparsed = parse_date_column(
+        netflix["date_added"], cache_key=("netflix_titles.csv", "date_added")
+    )
+"""
+
+#######################
+### Import Packages ###
+#######################
+
+import numpy as np
+import pandas as pd
+
+# The formats tried on each column, in the order they are preferred when tied.
+DATE_FORMATS = [
+    "%d-%b-%y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%Y-%m-%d",
+    "%d-%b-%Y",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%m/%d/%y",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%B %Y",
+    "%Y",
+]
+
+# The formats detected for each file and column, shared by every parse.
+_FORMAT_CACHE = {}
+
+####################
+### Detect Dates ###
+####################
+
+
+def detect_date_formats(dates, sample_size=1000, formats=DATE_FORMATS, seed=0):
+    """
+    Detects the formats of a column of dates from a sample of its distinct
+    values. The format parsing the most of the sample is picked first, then
+    the format parsing the most of the rest, until every date of the sample
+    is parsed or no format parses any more of it.
+
+    Parameters
+    ----------
+    dates : pandas.Series
+        The date strings, stripped of whitespace
+    sample_size : int, optional
+        The number of distinct dates to detect the formats from
+    formats : list of str, optional
+        The strptime formats to try
+    seed : int, optional
+        The seed of the sample
+
+    Returns
+    -------
+    list of str
+        the formats detected, from the most to the least common
+
+    Examples
+    --------
+    >>> detect_date_formats(netflix["date_added"].str.strip())
+    """
+
+    sample = pd.Series(dates.dropna().unique(), dtype="str")
+    if len(sample) > sample_size:
+        sample = sample.sample(sample_size, random_state=seed)
+
+    is_parsed = pd.DataFrame(
+        {
+            date_format: pd.to_datetime(sample, format=date_format, errors="coerce")
+            .notna()
+            .to_numpy()
+            for date_format in formats
+        }
+    )
+
+    detected_formats = []
+    while len(is_parsed):
+        parsed_counts = is_parsed.sum()
+        if parsed_counts.max() == 0:
+            break
+
+        date_format = parsed_counts.idxmax()
+        detected_formats.append(date_format)
+        is_parsed = is_parsed[~is_parsed[date_format]]
+
+    return detected_formats
+
+
+###################
+### Parse Dates ###
+###################
+
+
+def parse_date_column(dates, cache_key=None, sample_size=1000, formats=DATE_FORMATS):
+    """
+    Parses a column of dates in a mix of formats. Each distinct date is only
+    parsed once, and the dates of each detected format are parsed together
+    in a single vectorized call. The formats detected for a cache_key are
+    reused for later columns with the same key, and detected again only
+    for dates none of them can parse. Every distinct date is tried against
+    every format before it is reported as unparsed.
+
+    Parameters
+    ----------
+    dates : pandas.Series
+        The date strings to parse, missing dates stay missing
+    cache_key : hashable, optional
+        The key to cache the detected formats under, such as the file and
+        column name of the dates
+    sample_size : int, optional
+        The number of distinct dates to detect the formats from
+    formats : list of str, optional
+        The strptime formats to try
+
+    Returns
+    -------
+    pandas.Series
+        the parsed dates, with the index of dates
+    pandas.Series
+        the dates which could not be parsed in any of the formats, with
+        their index in dates
+
+    Examples
+    --------
+    >>> air_date, unparsed = parse_date_column(
+    ...     chopped["air_date"], cache_key=("chopped.csv", "air_date")
+    ... )
+    """
+
+    date_codes, unique_dates = pd.factorize(dates)
+    unique_dates = pd.Series(unique_dates, dtype="str").str.strip()
+
+    # Formats cached for the column are tried before any are detected.
+    detected_formats = list(_FORMAT_CACHE.get(cache_key, []))
+    parsed_dates = pd.Series(pd.NaT, index=unique_dates.index, dtype="datetime64[us]")
+    is_unparsed = unique_dates.ne("").to_numpy(copy=True)
+
+    # Formats are detected again on the dates still unparsed until a round
+    # finds no new format, and then once more from every one of them, so a
+    # format missing from every sample is still found.
+    new_formats = detected_formats
+    round_size = sample_size
+    while True:
+        for date_format in new_formats:
+            if not is_unparsed.any():
+                break
+
+            format_dates = pd.to_datetime(
+                unique_dates[is_unparsed], format=date_format, errors="coerce"
+            )
+            is_format = format_dates.notna()
+            parsed_dates[format_dates.index[is_format]] = format_dates[is_format]
+            is_unparsed[format_dates.index[is_format]] = False
+
+        if not is_unparsed.any():
+            break
+
+        new_formats = [
+            date_format
+            for date_format in detect_date_formats(
+                unique_dates[is_unparsed], round_size, formats
+            )
+            if date_format not in detected_formats
+        ]
+        if not new_formats:
+            if round_size >= is_unparsed.sum():
+                break
+            round_size = is_unparsed.sum()
+        detected_formats = detected_formats + new_formats
+
+    if cache_key is not None:
+        _FORMAT_CACHE[cache_key] = detected_formats
+
+    # Missing dates have the code -1, and are left missing.
+    date_positions = np.where(date_codes == -1, len(unique_dates), date_codes)
+    parsed_dates = pd.concat(
+        [parsed_dates, pd.Series([pd.NaT], dtype=parsed_dates.dtype)],
+        ignore_index=True,
+    )
+    is_unparsed = np.append(is_unparsed, False)[date_positions]
+
+    return (
+        pd.Series(
+            parsed_dates.to_numpy()[date_positions], index=dates.index, name=dates.name
+        ),
+        dates[is_unparsed],
+    )
@@ -0,0 +1,698 @@
+#######################
+### Import Packages ###
+#######################
+
+import argparse
+import datetime as dt
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+import numpy as np
+
+import disney_functions
+from disney_functions import (
+    add_rereleases,
+    filter_duplicates,
+    get_release_dates,
+    get_totalgross_value,
+    get_totalgross_values,
+    load_disney_tables,
+    merge_on_actor,
+    merge_on_actors,
+    ranked_df,
+)
+
+######################
+### Synthetic Data ###
+######################
+
+GENRES = [
+    "Comedy",
+    "Adventure",
+    "Drama",
+    "Action",
+    "Thriller/Suspense",
+    "Romantic Comedy",
+    "Musical",
+    "Documentary",
+    "Western",
+    "Horror",
+    "Black Comedy",
+    "Concert/Performance",
+]
+MPAA_RATINGS = ["PG", "PG-13", "R", "G", "Not Rated"]
+
+
+def __format_dates(dates, month_format):
+    # Format Dates Like "Dec 21, 1937" or "December 21, 1937", Without Zero Padding.
+    dates = pd.DatetimeIndex(dates)
+    return (
+        pd.Series(dates.strftime(month_format))
+        + " "
+        + pd.Series(dates.day).astype(str)
+        + ", "
+        + pd.Series(dates.year).astype(str)
+    )
+
+
+def __format_grosses(grosses):
+    return pd.Series(grosses).map("${:,}".format)
+
+
+def make_disney_tables(record_count, rerelease_rate=0.1, multi_actor_rate=0.2, seed=0):
+    """
+    Returns synthetic versions of the Disney csv files, with the same columns
+    and value formats as the files in the data directory.
+
+    Parameters
+    ----------
+    record_count : int
+        The number of rows of the total gross table
+    rerelease_rate : float, optional
+        The fraction of rows of the total gross table which are rereleases of
+        an earlier film, with the same title, genre and rating
+    multi_actor_rate : float, optional
+        The fraction of characters voiced by more than one actor
+    seed : int, optional
+        The seed of the random number generator
+
+    Returns
+    -------
+    dict of pandas.DataFrame
+        the 'gross', 'characters', 'directors' and 'voice_actors' tables, as
+        they would be read from the csv files named in DISNEY_FILES
+
+    Examples
+    --------
+    >>> disney_tables = make_disney_tables(1000, rerelease_rate=0.2)
+    """
+
+    rng = np.random.default_rng(seed)
+
+    # Rereleases Repeat an Earlier Film Several Years After Its Release.
+    film_count = max(1, int(round(record_count * (1 - rerelease_rate))))
+    release_days = rng.integers(
+        np.datetime64("1937-01-01", "D").astype(int),
+        np.datetime64("2016-12-31", "D").astype(int),
+        size=film_count,
+    )
+    rerelease_films = rng.integers(0, film_count, size=record_count - film_count)
+    film_ids = np.concatenate([np.arange(film_count), rerelease_films])
+    release_days = np.concatenate(
+        [
+            release_days,
+            release_days[rerelease_films]
+            + rng.integers(365, 365 * 30, size=len(rerelease_films)),
+        ]
+    ).astype("datetime64[D]")
+
+    film_titles = pd.Series(np.arange(film_count)).map("Film {}".format)
+    film_genres = pd.Series(rng.choice(GENRES, size=film_count))
+    film_ratings = pd.Series(rng.choice(MPAA_RATINGS, size=film_count))
+
+    total_grosses = rng.integers(0, 10**9, size=record_count)
+    gross_df = pd.DataFrame(
+        {
+            "movie_title": film_titles[film_ids].to_numpy(),
+            "release_date": __format_dates(release_days, "%b"),
+            "genre": film_genres[film_ids].to_numpy(),
+            "MPAA_rating": film_ratings[film_ids].to_numpy(),
+            "total_gross": __format_grosses(total_grosses),
+            "inflation_adjusted_gross": __format_grosses(
+                total_grosses * rng.integers(1, 30, size=record_count)
+            ),
+        }
+    )
+
+    # Every Film Has a Director, and a Hero and a Villain From Its First Release.
+    directors_df = pd.DataFrame(
+        {
+            "name": film_titles,
+            "director": pd.Series(rng.integers(0, 1 + film_count // 5, film_count))
+            .map("Director {}".format)
+            .to_numpy(),
+        }
+    )
+    characters_df = pd.DataFrame(
+        {
+            "movie_title": film_titles,
+            "release_date": __format_dates(release_days[:film_count], "%B"),
+            "hero": film_titles.str.replace("Film", "Hero", regex=False),
+            "villian": film_titles.str.replace("Film", "Villain", regex=False),
+            "song": film_titles.str.replace("Film", "Song", regex=False),
+        }
+    )
+
+    characters = pd.concat(
+        [
+            characters_df[["hero", "movie_title"]].set_axis(
+                ["character", "movie"], axis=1
+            ),
+            characters_df[["villian", "movie_title"]].set_axis(
+                ["character", "movie"], axis=1
+            ),
+        ],
+        ignore_index=True,
+    )
+    actor_counts = np.where(
+        rng.random(len(characters)) < multi_actor_rate,
+        rng.integers(2, 5, size=len(characters)),
+        1,
+    )
+    voice_actors_df = characters.loc[characters.index.repeat(actor_counts)].reset_index(
+        drop=True
+    )
+    voice_actors_df.insert(
+        1,
+        "voice-actor",
+        pd.Series(rng.integers(0, 10 * film_count, size=len(voice_actors_df))).map(
+            "Actor {}".format
+        ),
+    )
+
+    return {
+        "gross": gross_df,
+        "characters": characters_df,
+        "directors": directors_df,
+        "voice_actors": voice_actors_df,
+    }
+
+
+def prepare_disney_tables(disney_tables):
+    """
+    Returns the inputs of the benchmarked functions from the synthetic tables
+    of make_disney_tables, cleaned as in build_complete_df.
+
+    Parameters
+    ----------
+    disney_tables : dict of pandas.DataFrame
+        the tables returned by make_disney_tables
+
+    Returns
+    -------
+    dict of pandas.DataFrame
+        the 'releases' dataframe of films with their parsed dates, grosses
+        and directors, the 'films' dataframe of films with their characters
+        and the renamed 'voice_actors' dataframe
+    """
+
+    gross_df = disney_tables["gross"]
+    releases_df = (
+        gross_df.drop(columns=["release_date"])
+        .join(get_release_dates(gross_df["release_date"], date_format="%b %d, %Y"))
+        .assign(
+            total_gross=get_totalgross_values(gross_df["total_gross"]),
+            inflation_adjusted_gross=get_totalgross_values(
+                gross_df["inflation_adjusted_gross"]
+            ),
+        )
+        .merge(
+            disney_tables["directors"].rename(columns={"name": "movie_title"}),
+            on="movie_title",
+            how="left",
+        )
+    )
+
+    characters_df = disney_tables["characters"]
+    films_df = (
+        characters_df.drop(columns=["release_date"])
+        .rename(columns={"villian": "villain"})
+        .join(
+            get_release_dates(characters_df["release_date"], date_format="%B %d, %Y")[
+                ["release_year", "release_month"]
+            ]
+        )
+    )
+
+    return {
+        "releases": releases_df,
+        "films": films_df,
+        "voice_actors": disney_tables["voice_actors"].rename(
+            columns={"movie": "movie_title"}
+        ),
+    }
+
+
+##################
+### Benchmarks ###
+##################
+
+
+def __get_histogram_spec(releases_df, prebin):
+    import altair as alt
+
+    # Altair Refuses to Embed More Than 5000 Rows Unless Told Otherwise.
+    alt.data_transformers.disable_max_rows()
+
+    get_histogram = getattr(disney_functions, "__get_histogram")
+    return get_histogram(releases_df, maxbins=10, prebin=prebin).to_dict()
+
+
+# Each Benchmark Takes the Prepared Tables, and May Be Limited to Smaller Sizes.
+BENCHMARKS = {
+    "add_rereleases": (lambda tables: add_rereleases(tables["releases"]), None),
+    "merge_on_actor": (
+        lambda tables: merge_on_actor(tables["voice_actors"], tables["films"], "hero"),
+        None,
+    ),
+    "merge_on_actors": (
+        lambda tables: merge_on_actors(tables["voice_actors"], tables["films"]),
+        None,
+    ),
+    "filter_duplicates": (
+        lambda tables: filter_duplicates(
+            tables["releases"].iloc[::2], tables["releases"].iloc[::3]
+        ),
+        None,
+    ),
+    "ranked_df": (lambda tables: ranked_df(tables["releases"], "genre"), None),
+    "histogram_prebinned": (
+        lambda tables: __get_histogram_spec(tables["releases"], prebin=True),
+        None,
+    ),
+    "histogram_unbinned": (
+        lambda tables: __get_histogram_spec(tables["releases"], prebin=False),
+        5,
+    ),
+}
+
+
+def measure_function(func, *args, repeat=3):
+    """
+    Returns the best wall time in seconds of calling func(*args) repeat times,
+    and the peak memory in bytes allocated during one more, traced, call.
+    """
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(timings), peak_memory
+
+
+def __get_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    min_exponent=3,
+    max_exponent=6,
+    functions=None,
+    rerelease_rate=0.1,
+    multi_actor_rate=0.2,
+    seed=0,
+    repeat=3,
+):
+    """
+    Times the Disney functions on synthetic tables of 10^min_exponent to
+    10^max_exponent rows, and measures their peak memory.
+
+    Parameters
+    ----------
+    min_exponent : int, optional
+        The exponent of the smallest number of rows
+    max_exponent : int, optional
+        The exponent of the largest number of rows
+    functions : list of str, optional
+        The names of the benchmarks to run, by default all of BENCHMARKS
+    rerelease_rate : float, optional
+        The fraction of rereleased films in the synthetic tables
+    multi_actor_rate : float, optional
+        The fraction of characters voiced by more than one actor
+    seed : int, optional
+        The seed of the synthetic tables
+    repeat : int, optional
+        The number of timings to take per function and size, the best is reported
+
+    Returns
+    -------
+    dict
+        the 'metadata' of the run and its 'results', one per function and size
+
+    Examples
+    --------
+    >>> run_benchmarks(max_exponent=5, functions=["add_rereleases"])
+    """
+
+    if functions is None:
+        functions = list(BENCHMARKS)
+
+    results = []
+    for exponent in range(min_exponent, max_exponent + 1):
+        record_count = 10**exponent
+        tables = prepare_disney_tables(
+            make_disney_tables(
+                record_count,
+                rerelease_rate=rerelease_rate,
+                multi_actor_rate=multi_actor_rate,
+                seed=seed,
+            )
+        )
+
+        for function in functions:
+            benchmark, function_max_exponent = BENCHMARKS[function]
+            if function_max_exponent is not None and exponent > function_max_exponent:
+                continue
+
+            seconds, peak_memory = measure_function(benchmark, tables, repeat=repeat)
+            results.append(
+                {
+                    "function": function,
+                    "record_count": record_count,
+                    "seconds": seconds,
+                    "peak_memory_mb": peak_memory / 2**20,
+                }
+            )
+
+    return {
+        "metadata": {
+            "commit": __get_commit(),
+            "timestamp": dt.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "rerelease_rate": rerelease_rate,
+            "multi_actor_rate": multi_actor_rate,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare_benchmarks(baseline, current):
+    """
+    Returns the ratio of the wall time and peak memory of two benchmark runs,
+    for every function and size measured in both.
+
+    Parameters
+    ----------
+    baseline : dict
+        the benchmark run to compare against, as returned by run_benchmarks
+    current : dict
+        the benchmark run to compare
+
+    Returns
+    -------
+    pandas.DataFrame
+        the time and memory ratios, above 1 when the current run is worse
+
+    Examples
+    --------
+    >>> compare_benchmarks(json.load(open("before.json")), run_benchmarks())
+    """
+
+    return (
+        pd.DataFrame(baseline["results"])
+        .merge(
+            pd.DataFrame(current["results"]),
+            on=["function", "record_count"],
+            suffixes=("_baseline", "_current"),
+        )
+        .assign(
+            time_ratio=lambda df: df["seconds_current"] / df["seconds_baseline"],
+            memory_ratio=lambda df: df["peak_memory_mb_current"]
+            / df["peak_memory_mb_baseline"],
+        )
+    )
+
+
+def sort_extreme_records(effective_df, feature, target, record_count):
+    """
+    Returns the lowest and highest records of a feature by fully sorting the
+    dataframe, as a reference for the partial selection of
+    display_concat_histograms.
+    """
+
+    plot_df = (
+        effective_df[effective_df[feature].notna() & effective_df[target].notna()]
+        .sort_values(by=feature, ascending=True)
+        .reset_index(drop=True)
+    )
+
+    return plot_df.head(record_count), plot_df.tail(record_count)
+
+
+def benchmark_extreme_records(max_exponent=7, record_count=10, repeat=3):
+    """
+    Times the selection of the lowest and highest records in
+    display_concat_histograms against a full sort, for 10^3 to 10^max_exponent rows.
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest dataframe size
+    record_count : int, optional
+        The number of lowest and highest records to select
+    repeat : int, optional
+        The number of timings to take per size, the best is reported
+
+    Returns
+    -------
+    pandas.DataFrame
+        the wall time of both approaches and the speedup for each size
+
+    Examples
+    --------
+    >>> benchmark_extreme_records(max_exponent=5)
+    """
+
+    get_extreme_records = getattr(disney_functions, "__get_extreme_records")
+
+    results = []
+    for exponent in range(3, max_exponent + 1):
+        size = 10**exponent
+        releases_df = prepare_disney_tables(make_disney_tables(size))["releases"]
+        args = (releases_df, "inflation_adjusted_gross", "release_decade", record_count)
+
+        sort_seconds, _ = measure_function(sort_extreme_records, *args, repeat=repeat)
+        select_seconds, _ = measure_function(get_extreme_records, *args, repeat=repeat)
+        results.append(
+            {
+                "record_count": size,
+                "sort_seconds": sort_seconds,
+                "select_seconds": select_seconds,
+                "speedup": sort_seconds / select_seconds,
+            }
+        )
+
+    return pd.DataFrame(results)
+
+
+def benchmark_gross_values(max_exponent=7, repeat=3, seed=0):
+    """
+    Times the conversion of total gross strings with get_totalgross_values
+    against applying get_totalgross_value to every cell, for 10^3 to
+    10^max_exponent cells.
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest number of cells
+    repeat : int, optional
+        The number of timings to take per size, the best is reported
+    seed : int, optional
+        The seed of the random number generator
+
+    Returns
+    -------
+    pandas.DataFrame
+        the wall time of both approaches and the speedup for each size
+
+    Examples
+    --------
+    >>> benchmark_gross_values(max_exponent=5)
+    """
+
+    rng = np.random.default_rng(seed)
+
+    results = []
+    for exponent in range(3, max_exponent + 1):
+        size = 10**exponent
+        total_gross = __format_grosses(rng.integers(0, 10**10, size)).astype("str")
+
+        apply_seconds, _ = measure_function(
+            lambda gross: gross.apply(get_totalgross_value),
+            total_gross,
+            repeat=repeat,
+        )
+        column_seconds, _ = measure_function(
+            get_totalgross_values, total_gross, repeat=repeat
+        )
+        results.append(
+            {
+                "cell_count": size,
+                "apply_seconds": apply_seconds,
+                "column_seconds": column_seconds,
+                "speedup": apply_seconds / column_seconds,
+            }
+        )
+
+    return pd.DataFrame(results)
+
+
+def __get_table_memory(data_dir):
+    table_bytes = {}
+    for read_dtype in ["object", None]:
+        table_bytes["object_bytes" if read_dtype else "plain_bytes"] = sum(
+            pd.read_csv(os.path.join(data_dir, file_name), dtype=read_dtype)
+            .memory_usage(deep=True)
+            .sum()
+            for file_name in disney_functions.DISNEY_FILES.values()
+        )
+
+    compact_tables = load_disney_tables(data_dir)
+    table_bytes["compact_bytes"] = sum(
+        compact_tables[file_key].memory_usage(deep=True).sum()
+        for file_key in disney_functions.DISNEY_FILES
+    )
+
+    return table_bytes
+
+
+def benchmark_table_memory(data_dir="data", max_exponent=6, seed=0):
+    """
+    Compares the memory of the Disney tables read as object columns and with
+    the default dtypes of read_csv against load_disney_tables, for the files in data_dir and for
+    synthetic files of 10^3 to 10^max_exponent rows.
+
+    Parameters
+    ----------
+    data_dir : str, optional
+        The directory containing the Disney csv files
+    max_exponent : int, optional
+        The exponent of the largest synthetic total gross table
+    seed : int, optional
+        The seed of the random number generator
+
+    Returns
+    -------
+    pandas.DataFrame
+        the bytes of both sets of tables and their ratio for each size
+
+    Examples
+    --------
+    >>> benchmark_table_memory(max_exponent=5)
+    """
+
+    results = []
+    results.append({"tables": data_dir, **__get_table_memory(data_dir)})
+
+    with tempfile.TemporaryDirectory() as synthetic_dir:
+        shutil.copy(
+            os.path.join(data_dir, disney_functions.STUDIO_REVENUE_FILE), synthetic_dir
+        )
+        for exponent in range(3, max_exponent + 1):
+            disney_tables = make_disney_tables(10**exponent, seed=seed)
+            for file_key, file_name in disney_functions.DISNEY_FILES.items():
+                disney_tables[file_key].to_csv(
+                    os.path.join(synthetic_dir, file_name), index=False
+                )
+
+            results.append(
+                {"tables": f"10^{exponent}", **__get_table_memory(synthetic_dir)}
+            )
+
+    results_df = pd.DataFrame(results)
+    results_df["object_ratio"] = (
+        results_df["object_bytes"] / results_df["compact_bytes"]
+    )
+    results_df["plain_ratio"] = results_df["plain_bytes"] / results_df["compact_bytes"]
+
+    return results_df
+
+
+# The Benchmarks Which Compare Two Approaches Rather Than Time the Functions Alone.
+EXTRA_BENCHMARKS = {
+    "extreme_records": lambda args: benchmark_extreme_records(
+        max_exponent=args.max_exponent, repeat=args.repeat
+    ),
+    "gross_values": lambda args: benchmark_gross_values(
+        max_exponent=args.max_exponent, repeat=args.repeat, seed=args.seed
+    ),
+    "table_memory": lambda args: benchmark_table_memory(
+        data_dir=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"),
+        max_exponent=args.max_exponent,
+        seed=args.seed,
+    ),
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Disney functions on synthetic data."
+    )
+    parser.add_argument("--min-exponent", type=int, default=3)
+    parser.add_argument("--max-exponent", type=int, default=6)
+    parser.add_argument("--functions", nargs="+", choices=list(BENCHMARKS))
+    parser.add_argument("--rerelease-rate", type=float, default=0.1)
+    parser.add_argument("--multi-actor-rate", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--extras",
+        nargs="*",
+        choices=list(EXTRA_BENCHMARKS),
+        default=list(EXTRA_BENCHMARKS),
+        help="the comparison benchmarks to run as well, all by default",
+    )
+    parser.add_argument("--output", help="the json file to save the results to")
+    parser.add_argument("--compare", help="a json file of results to compare to")
+    args = parser.parse_args()
+
+    benchmark_run = run_benchmarks(
+        min_exponent=args.min_exponent,
+        max_exponent=args.max_exponent,
+        functions=args.functions,
+        rerelease_rate=args.rerelease_rate,
+        multi_actor_rate=args.multi_actor_rate,
+        seed=args.seed,
+        repeat=args.repeat,
+    )
+    print(pd.DataFrame(benchmark_run["results"]).to_string(index=False))
+
+    benchmark_run["extras"] = {}
+    for extra in args.extras:
+        extra_df = EXTRA_BENCHMARKS[extra](args)
+        benchmark_run["extras"][extra] = extra_df.to_dict(orient="records")
+
+        print(f"\n{extra}:")
+        print(extra_df.to_string(index=False))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(benchmark_run, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            comparison_df = compare_benchmarks(json.load(baseline_file), benchmark_run)
+
+        print(f"\nCompared to {args.compare}:")
+        print(
+            comparison_df[
+                ["function", "record_count", "time_ratio", "memory_ratio"]
+            ].to_string(index=False)
+        )
@@ -2,12 +2,15 @@
 ### Import Packages ###
 #######################
 
+import glob
+import hashlib
+import os
+
 import pandas as pd
 import numpy as np
 
-import altair as alt
-
-from IPython.display import display
+# Altair and IPython Are Imported Lazily by the Plotting Functions Below,
+# So the Data Cleaning Functions Can Be Used Without Them.
 
 ##################
 ### Clean Data ###
@@ -21,10 +24,167 @@ def get_totalgross_value(total_gross):
     return float(total_gross.replace("$", "").replace(",", ""))
 
 
+def __get_gross_cents_arrow(total_gross):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # Up to 16 Whole Dollar Digits Fit in Int64 Once Scaled to Cents.
+    whole_pattern = r"(?:\d{1,16}|\d{1,3}(?:,\d{3}){1,4}|\d(?:,\d{3}){5})"
+    amount_pattern = rf"\$?{whole_pattern}(?:\.\d{{1,2}})?"
+
+    gross_strings = pc.utf8_trim_whitespace(
+        pa.array(total_gross.astype("string[pyarrow]").array)
+    )
+    is_valid = pc.match_substring_regex(
+        gross_strings, rf"^(?:\({amount_pattern}\)|-?{amount_pattern})$"
+    )
+
+    # The Sign and Currency Markers Only Appear at Either End of the Amount.
+    digits = pc.replace_substring(pc.utf8_trim(gross_strings, "()-$"), ",", "")
+    digits = pc.if_else(is_valid, digits, pa.scalar(None, digits.type))
+
+    # A Decimal Cast Scales Whole Dollars and Fractional Amounts Alike to Cents.
+    gross_cents = pc.cast(
+        pc.multiply(pc.cast(digits, pa.decimal128(18, 2)), 100), pa.int64()
+    )
+    is_negative = pc.or_(
+        pc.starts_with(gross_strings, "("), pc.starts_with(gross_strings, "-")
+    )
+    gross_cents = pc.if_else(is_negative, pc.negate(gross_cents), gross_cents)
+
+    return pd.Series(
+        gross_cents.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get).array,
+        index=total_gross.index,
+        name=total_gross.name,
+    )
+
+
+def __get_gross_cents_strings(total_gross):
+    gross_strings = total_gross.astype("string").str.strip()
+
+    amount_pattern = r"\$?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d{1,2})?"
+    is_valid = gross_strings.str.fullmatch(
+        rf"\({amount_pattern}\)|-?{amount_pattern}"
+    ).fillna(False)
+    is_negative = gross_strings.str.startswith(("(", "-")).fillna(False)
+
+    digits = (
+        gross_strings.where(is_valid)
+        .str.strip("()-$")
+        .str.replace(",", "", regex=False)
+    )
+
+    point_position = digits.str.find(".")
+    fraction_length = (digits.str.len() - point_position - 1).where(
+        point_position >= 0, 0
+    )
+    whole_length = digits.str.len() - fraction_length - (fraction_length > 0)
+    is_valid &= whole_length.fillna(0) <= 16
+
+    scaled_digits = digits.where(is_valid).str.replace(".", "", regex=False)
+    gross_cents = scaled_digits.astype("Int64") * (10 ** (2 - fraction_length)).astype(
+        "Int64"
+    )
+
+    return gross_cents.where(~is_negative, -gross_cents).rename(total_gross.name)
+
+
+def get_totalgross_values(total_gross, cents=False):
+    """
+    Converts a column of box office revenue strings such as "$184,925,485"
+    into numbers in a single vectorized pass. Negative amounts may be written
+    with a leading minus sign or in parentheses, e.g. "($1,200.50)". Missing
+    values, unparseable strings and amounts of more than 16 whole dollar
+    digits become missing values. The strings are validated with one regular
+    expression and converted with one decimal cast when pyarrow is installed.
+
+    Parameters
+    ----------
+    total_gross : pandas.core.series.Series
+        The revenue strings to convert
+    cents : bool, optional
+        Whether to return exact integer cents as an Int64 series, rather than
+        a float64 series of dollars
+
+    Returns
+    -------
+    pandas.core.series.Series
+        the converted revenue, with the same index as total_gross
+
+    Examples
+    --------
+    >>> get_totalgross_values(gross_df["total_gross"])
+    """
+
+    if total_gross.empty:
+        # Arrow Backed String Methods Cannot Run on an Empty Series.
+        gross_cents = pd.Series(
+            dtype="Int64", index=total_gross.index, name=total_gross.name
+        )
+    elif pd.api.types.is_numeric_dtype(total_gross):
+        gross_cents = (total_gross.astype("Float64") * 100).round().astype("Int64")
+    else:
+        try:
+            gross_cents = __get_gross_cents_arrow(total_gross)
+        except ImportError:
+            gross_cents = __get_gross_cents_strings(total_gross)
+
+    if cents:
+        return gross_cents
+
+    return (gross_cents / 100).astype("float64")
+
+
 def get_release_decade(release_year):
     return (release_year // 10) * 10
 
 
+def get_release_dates(release_date, date_format="%b %d, %Y"):
+    """
+    Parses a column of release dates in a single vectorized pass and returns
+    the release year, month and decade of every film as compact integers.
+    Each distinct date string is only parsed once, which matters for
+    catalogues where rereleases repeat the same dates.
+
+    Parameters
+    ----------
+    release_date : pandas.core.series.Series
+        The release date strings to parse, missing dates stay missing
+    date_format : str, optional
+        The strptime format of the dates, e.g. "%b %d, %Y" for "Dec 21, 1937"
+        or "%B %d, %Y" for "December 21, 1937"
+
+    Returns
+    -------
+    pandas.DataFrame
+        the 'release_year', 'release_month' and 'release_decade' columns,
+        with the same index as release_date
+
+    Examples
+    --------
+    >>> gross_df = gross_df.join(get_release_dates(gross_df["release_date"]))
+    """
+
+    # Parse Every Distinct Date String Once, Then Broadcast Back to the Rows.
+    date_codes, unique_dates = pd.factorize(release_date)
+    parsed_dates = pd.DatetimeIndex(pd.to_datetime(unique_dates, format=date_format))
+
+    unique_years = pd.array(parsed_dates.year, dtype="Int16")
+    unique_months = pd.array(parsed_dates.month, dtype="Int8")
+
+    release_years = unique_years.take(date_codes, allow_fill=True)
+    release_months = unique_months.take(date_codes, allow_fill=True)
+
+    return pd.DataFrame(
+        {
+            "release_year": release_years,
+            "release_month": release_months,
+            "release_decade": get_release_decade(release_years),
+        },
+        index=release_date.index,
+    )
+
+
 def capitalize_label(label):
     return " ".join(
         word.capitalize()
@@ -58,7 +218,7 @@ def ranked_df(effective_df, feature):
     """
 
     return (
-        effective_df.groupby(feature)["movie_title"]
+        effective_df.groupby(feature, observed=True)["movie_title"]
         .agg("count")
         .reset_index()
         .rename(columns={"movie_title": "number_of_films"})
@@ -72,6 +232,8 @@ def add_rereleases(effective_df):
     Given a dataframe of films, this function adds the box office revenue from
     rereleased films to the original release. This function also sorts the dataframe by
     release year and then by movie title, and resets the index of the dataframe.
+    A title shared by several releases, such as a remake, sums the revenue of
+    each release separately.
 
     Parameters
     ----------
@@ -92,42 +254,23 @@ def add_rereleases(effective_df):
     """
 
     # Let's Assume That These Movies are *Probably* Rereleases.
-    cleaned_df = effective_df.copy()
-    cleaned_df.drop_duplicates(
-        subset=["movie_title", "director", "genre", "MPAA_rating"],
-        keep="first",
-        inplace=True,
-    )
+    release_cols = ["movie_title", "director", "genre", "MPAA_rating"]
+    gross_cols = ["total_gross", "inflation_adjusted_gross"]
 
-    rerelease_df = effective_df[
-        effective_df.duplicated(
-            subset=["movie_title", "director", "genre", "MPAA_rating"]
-        )
-    ]
+    original_mask = ~effective_df.duplicated(subset=release_cols, keep="first")
+    rerelease_mask = effective_df.duplicated(subset=release_cols, keep=False)
 
-    rereleased_projects = {
-        row["movie_title"]: [row["director"], row["genre"], row["MPAA_rating"]]
-        for i, row in rerelease_df.iterrows()
-    }
+    # Sum the Box Office Revenue of Every Release in a Single Grouped Pass.
+    gross_sums = effective_df.groupby(
+        release_cols, sort=False, dropna=False, observed=True
+    )[gross_cols].transform("sum")
 
-    for movie, details in rereleased_projects.items():
-        # Find All Duplicate Entries Within DataFrame.
-        current_df = effective_df.query(f'movie_title == "{movie}"')
-        current_df = current_df.query(f'director == "{details[0]}"')
-        current_df = current_df.query(f'genre == "{details[1]}"')
-        current_df = current_df.query(f'MPAA_rating == "{details[2]}"')
-
-        total_sum = current_df.groupby(
-            ["movie_title", "director", "genre", "MPAA_rating"]
-        )["total_gross"].agg("sum")[0]
-        inflation_adjusted_sum = current_df.groupby(
-            ["movie_title", "director", "genre", "MPAA_rating"]
-        )["inflation_adjusted_gross"].agg("sum")[0]
-
-        cleaned_df.at[current_df.index[0], "total_gross"] = total_sum
-        cleaned_df.at[
-            current_df.index[0], "inflation_adjusted_gross"
-        ] = inflation_adjusted_sum
+    cleaned_df = effective_df[original_mask].copy()
+
+    update_mask = rerelease_mask[original_mask]
+    cleaned_df.loc[update_mask, gross_cols] = gross_sums.loc[
+        cleaned_df.index[update_mask], gross_cols
+    ]
 
     cleaned_df.sort_values(
         by=["release_year", "movie_title"], ascending=[True, True], inplace=True
@@ -137,6 +280,15 @@ def add_rereleases(effective_df):
     return cleaned_df
 
 
+def __join_actors(actors):
+    # Characters Without a Voice-Actor Are Left Out, As in merge_on_actors.
+    actors = actors.dropna()
+    if actors.empty:
+        return np.nan
+
+    return "; ".join(actors)
+
+
 def merge_on_actor(voice_actors_df, film_revenue_df, char_type):
     """
     Given a dataframe of voice actors and a dataframe of films, this function
@@ -172,42 +324,48 @@ def merge_on_actor(voice_actors_df, film_revenue_df, char_type):
         columns={"voice-actor": f"{char_type}-actor"}, inplace=True
     )
 
+    # Categorical Keys Must Share Their Categories to Stay Categorical When Merged.
+    if isinstance(film_revenue_df[char_type].dtype, pd.CategoricalDtype):
+        actor_chars = effective_actors_df[char_type]
+        if isinstance(actor_chars.dtype, pd.CategoricalDtype):
+            actor_chars = actor_chars.cat.categories
+        char_dtype = pd.CategoricalDtype(
+            film_revenue_df[char_type].cat.categories.union(
+                pd.Index(actor_chars.dropna().unique())
+            )
+        )
+        film_revenue_df = film_revenue_df.assign(
+            **{char_type: film_revenue_df[char_type].astype(char_dtype)}
+        )
+        effective_actors_df[char_type] = effective_actors_df[char_type].astype(
+            char_dtype
+        )
+
     merged_chars_df = pd.merge(
         film_revenue_df, effective_actors_df, on=["movie_title", char_type], how="left"
     )
 
     # Squeeze Rows with Multiple Voice-Actors For Same Character.
-
-    duplicated_df = merged_chars_df[
-        merged_chars_df.duplicated(
-            subset=["movie_title", "release_month", "release_year"]
+    release_cols = ["movie_title", "release_month", "release_year"]
+    actor_col = f"{char_type}-actor"
+
+    duplicated_mask = merged_chars_df.duplicated(subset=release_cols, keep=False)
+    if duplicated_mask.any():
+        squeezed_actors = (
+            merged_chars_df[duplicated_mask]
+            .groupby(release_cols, sort=False, dropna=False)[actor_col]
+            .agg(__join_actors)
         )
-    ][["movie_title", "release_month", "release_year"]].drop_duplicates()
 
-    duplicated_indices = {}
-    for i, row in duplicated_df.iterrows():
-        movie_title = row["movie_title"]
-        release_year = row["release_year"]
-        release_month = row["release_month"]
+        # Groups Are Listed in Order of First Occurrence, As Are the Kept Rows.
+        keep_mask = duplicated_mask & ~merged_chars_df.duplicated(subset=release_cols)
+        if isinstance(merged_chars_df[actor_col].dtype, pd.CategoricalDtype):
+            actor_categories = merged_chars_df[actor_col].cat.categories
+            merged_chars_df[actor_col] = merged_chars_df[actor_col].cat.add_categories(
+                pd.Index(squeezed_actors.dropna().unique()).difference(actor_categories)
+            )
+        merged_chars_df.loc[keep_mask, actor_col] = squeezed_actors.to_numpy()
 
-        effective_df = merged_chars_df.query(f'movie_title == "{movie_title}"')
-        effective_df = effective_df.query(f"release_year == {release_year}")
-        effective_df = effective_df.query(f"release_month == {release_month}")
-
-        effective_indices = effective_df.index.to_list()
-
-        duplicated_indices[effective_indices[0]] = effective_indices[1:]
-
-    actors_dict = {
-        i: merged_chars_df.loc[i, f"{char_type}-actor"]
-        for i in duplicated_indices.keys()
-    }
-    for keep, duplicates in duplicated_indices.items():
-        for i in duplicates:
-            actors_dict[keep] += f'; {merged_chars_df.loc[i, f"{char_type}-actor"]}'
-
-    for i, actors in actors_dict.items():
-        merged_chars_df.at[i, f"{char_type}-actor"] = actors
     merged_chars_df.drop_duplicates(
         subset=["movie_title", "release_year", "release_month"], inplace=True
     )
@@ -215,6 +373,119 @@ def merge_on_actor(voice_actors_df, film_revenue_df, char_type):
     return merged_chars_df
 
 
+def merge_on_actors(voice_actors_df, film_revenue_df, roles=("hero", "villain")):
+    """
+    Given a dataframe of voice actors and a dataframe of films, this function
+    adds the voice actors of several types of characters in a single pass. The
+    voice actors of each character are squeezed once, then looked up for every
+    type of character, giving the same rows and actors as merging the results
+    of merge_on_actor for each type of character.
+
+    Parameters
+    ----------
+    voice_actors_df : pandas.core.frame.DataFrame
+        The dataframe of voice actors, must contain the columns :
+        'character', 'voice-actor', 'movie_title'
+    film_revenue_df : pandas.core.frame.DataFrame
+        The dataframe of films, must contain the columns :
+        'movie_title', 'release_month', 'release_year' and a column for each role
+    roles : tuple of str, optional
+        The types of character to add the voice actors of, each must be
+        either 'hero' or 'villain'
+
+    Returns
+    -------
+    pandas.DataFrame
+        the films, with a '<role>-actor' column for each role
+
+    Examples
+    --------
+    >>> merge_on_actors(voice_actors_df, film_revenue_df, roles=('hero', 'villain'))
+    """
+
+    for role in roles:
+        if role != "hero" and role != "villain":
+            raise ValueError("roles must be either hero or villain")
+
+    # Squeeze the Voice-Actors of Each Character Once For All Roles.
+    actor_keys = ["movie_title", "character"]
+    squeezed_actors = voice_actors_df.loc[
+        voice_actors_df["voice-actor"].notna(), actor_keys + ["voice-actor"]
+    ].astype(object)
+
+    duplicated_mask = squeezed_actors.duplicated(subset=actor_keys, keep=False)
+    if duplicated_mask.any():
+        # Summing Separated Strings Joins Them Without a Python Call Per Group.
+        duplicated_actors = squeezed_actors[duplicated_mask]
+        joined_actors = (
+            (duplicated_actors["voice-actor"] + "; ")
+            .groupby(
+                [duplicated_actors[key] for key in actor_keys],
+                sort=False,
+                dropna=False,
+            )
+            .sum()
+            .str[:-2]
+        )
+
+        # Groups Are Listed in Order of First Occurrence, As Are the Kept Rows.
+        keep_mask = duplicated_mask & ~squeezed_actors.duplicated(subset=actor_keys)
+        squeezed_actors.loc[keep_mask, "voice-actor"] = joined_actors.to_numpy()
+    squeezed_actors = squeezed_actors.drop_duplicates(subset=actor_keys)
+
+    actor_dtype = voice_actors_df["voice-actor"].dtype
+    if isinstance(actor_dtype, pd.CategoricalDtype):
+        actor_dtype = "category"
+
+    release_cols = ["movie_title", "release_month", "release_year"]
+    release_duplicated_mask = film_revenue_df.duplicated(
+        subset=release_cols, keep=False
+    ).to_numpy()
+    release_keep_mask = ~film_revenue_df.duplicated(subset=release_cols).to_numpy()
+    if release_duplicated_mask.any():
+        release_codes = (
+            film_revenue_df.groupby(
+                release_cols, sort=False, dropna=False, observed=True
+            )
+            .ngroup()
+            .to_numpy()
+        )
+
+    merged_df = film_revenue_df[release_keep_mask].reset_index(drop=True)
+    for role in roles:
+        role_keys = pd.DataFrame(
+            {
+                "movie_title": film_revenue_df["movie_title"].to_numpy(dtype=object),
+                "character": film_revenue_df[role].to_numpy(dtype=object),
+            }
+        )
+        role_actors = pd.merge(
+            role_keys,
+            squeezed_actors,
+            on=["movie_title", "character"],
+            how="left",
+        )["voice-actor"]
+        kept_actors = role_actors.to_numpy(dtype=object)[release_keep_mask]
+
+        # Films Listed More Than Once Keep the Voice-Actors of All of Their Rows.
+        if release_duplicated_mask.any():
+            joined_mask = release_duplicated_mask & role_actors.notna().to_numpy()
+            joined_actors = (
+                (role_actors[joined_mask] + "; ")
+                .groupby(release_codes[joined_mask], sort=False)
+                .sum()
+                .str[:-2]
+            )
+            kept_duplicated_mask = release_duplicated_mask[release_keep_mask]
+            kept_actors[kept_duplicated_mask] = joined_actors.reindex(
+                release_codes[release_keep_mask][kept_duplicated_mask]
+            ).to_numpy(dtype=object)
+
+        merged_df[f"{role}-actor"] = pd.Series(kept_actors, dtype=actor_dtype)
+
+    return merged_df
+
+
 def filter_duplicates(filter_df, search_df):
     """
     Given two dataframes, this function filters the first dataframe to remove
@@ -242,29 +513,297 @@ def filter_duplicates(filter_df, search_df):
     if filter_df.columns.to_list() != search_df.columns.to_list():
         raise Exception("The columns of the two dataframes are not the same.")
 
-    # Find the Duplicate Rows.
-    duplicate_df = pd.concat([filter_df, search_df]).sort_values(
-        by=["movie_title", "release_year", "release_month"]
+    # Hash the Release Keys of Both Dataframes Together, Without Sorting.
+    # Rows of filter_df Sharing a Key With Any Other Row Are Duplicates.
+    release_cols = ["movie_title", "release_year", "release_month"]
+    duplicated_mask = (
+        pd.concat([filter_df[release_cols], search_df[release_cols]], ignore_index=True)
+        .duplicated(keep=False)
+        .to_numpy()[: len(filter_df)]
     )
-    duplicate_df = duplicate_df[
-        duplicate_df.duplicated(subset=["movie_title", "release_year", "release_month"])
-    ]
 
-    filtered_df = filter_df.copy()
+    filtered_df = filter_df[~duplicated_mask].copy()
 
-    # Find the Indices of the Duplicate Rows.
-    for i, row in duplicate_df.iterrows():
-        movie_title = row["movie_title"]
-        release_year = row["release_year"]
-        release_month = row["release_month"]
+    return filtered_df
 
-        effective_df = filter_df.query(f'movie_title == "{movie_title}"')
-        effective_df = effective_df.query(f"release_year == {release_year}")
-        effective_df = effective_df.query(f"release_month == {release_month}")
 
-        filtered_df.drop(effective_df.index.to_list(), inplace=True)
+##################
+### Build Data ###
+##################
 
-    return filtered_df
+DISNEY_FILES = {
+    "gross": "disney_movies_total_gross.csv",
+    "characters": "disney-characters.csv",
+    "directors": "disney-director.csv",
+    "voice_actors": "disney-voice-actors.csv",
+}
+
+STUDIO_REVENUE_FILE = "disney_revenue_1991-2016.csv"
+
+COMPLETE_COLS = [
+    "movie_title",
+    "release_decade",
+    "release_year",
+    "release_month",
+    "total_gross",
+    "inflation_adjusted_gross",
+    "director",
+    "MPAA_rating",
+    "genre",
+    "hero-actor",
+    "hero",
+    "villain-actor",
+    "villain",
+    "song",
+]
+
+
+def __get_title_dtype():
+    try:
+        import pyarrow
+    except ImportError:
+        return "string"
+
+    return "string[pyarrow]"
+
+
+def load_disney_tables(data_dir="data"):
+    """
+    Reads the five Disney csv files with compact dtypes. Titles are read as
+    Arrow-backed strings when pyarrow is installed, low-cardinality fields
+    (genres, ratings, directors, heroes, villains and voice actors) as categoricals,
+    release dates as small integer years and months, and grosses as floats.
+
+    The tables get the same light cleaning as in build_complete_df: the
+    misspelled 'villian' column is renamed, line breaks are stripped from the
+    character titles, and film names are found in a 'movie_title' column.
+
+    Parameters
+    ----------
+    data_dir : str, optional
+        The directory containing the Disney csv files
+
+    Returns
+    -------
+    dict of pandas.DataFrame
+        the 'gross', 'characters', 'directors', 'voice_actors' and
+        'studio_revenue' tables
+
+    Examples
+    --------
+    >>> disney_tables = load_disney_tables("data")
+    """
+
+    title_dtype = __get_title_dtype()
+    release_cols = ["release_year", "release_month"]
+
+    # Casting After Reading Shares One Compact Set of Categories Per Column.
+    def read_disney_csv(file_key, category_cols):
+        return pd.read_csv(
+            os.path.join(data_dir, DISNEY_FILES[file_key]), dtype=title_dtype
+        ).astype({col: "category" for col in category_cols})
+
+    gross_df = read_disney_csv("gross", ["genre", "MPAA_rating"])
+    gross_df = gross_df.join(
+        get_release_dates(gross_df["release_date"], date_format="%b %d, %Y")[
+            release_cols
+        ]
+    ).drop(columns=["release_date"])
+    gross_df = gross_df.assign(
+        total_gross=get_totalgross_values(gross_df["total_gross"]),
+        inflation_adjusted_gross=get_totalgross_values(
+            gross_df["inflation_adjusted_gross"]
+        ),
+    )
+
+    characters_df = read_disney_csv("characters", ["hero", "villian"]).rename(
+        columns={"villian": "villain"}
+    )
+    characters_df["movie_title"] = characters_df["movie_title"].str.replace("\r\n", "")
+    characters_df = characters_df.join(
+        get_release_dates(characters_df["release_date"], date_format="%B %d, %Y")[
+            release_cols
+        ]
+    ).drop(columns=["release_date"])
+
+    directors_df = read_disney_csv("directors", ["director"]).rename(
+        columns={"name": "movie_title"}
+    )
+
+    voice_actors_df = read_disney_csv("voice_actors", ["voice-actor"]).rename(
+        columns={"movie": "movie_title"}
+    )
+
+    studio_revenue_df = pd.read_csv(
+        os.path.join(data_dir, STUDIO_REVENUE_FILE), dtype={"Year": "Int16"}
+    )
+
+    return {
+        "gross": gross_df,
+        "characters": characters_df,
+        "directors": directors_df,
+        "voice_actors": voice_actors_df,
+        "studio_revenue": studio_revenue_df,
+    }
+
+
+def __get_file_hash(file_path):
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
+
+
+def __build_complete_df(data_dir):
+    gross_df = pd.read_csv(os.path.join(data_dir, DISNEY_FILES["gross"]))
+    characters_df = pd.read_csv(os.path.join(data_dir, DISNEY_FILES["characters"]))
+    directors_df = pd.read_csv(os.path.join(data_dir, DISNEY_FILES["directors"]))
+    voice_actors_df = pd.read_csv(os.path.join(data_dir, DISNEY_FILES["voice_actors"]))
+
+    # Parse the Release Dates, Which Use a Different Format in Each Table.
+    release_cols = ["release_year", "release_month"]
+    gross_df = gross_df.join(
+        get_release_dates(gross_df["release_date"], date_format="%b %d, %Y")[
+            release_cols
+        ]
+    ).drop(columns=["release_date"])
+    characters_df = characters_df.join(
+        get_release_dates(characters_df["release_date"], date_format="%B %d, %Y")[
+            release_cols
+        ]
+    ).drop(columns=["release_date"])
+
+    # Villain Was Misspelled and Titles Contain Line Breaks in the Characters Table.
+    characters_df = characters_df.rename(columns={"villian": "villain"})
+    characters_df["movie_title"] = characters_df["movie_title"].str.replace("\r\n", "")
+
+    char_revenue_df = pd.merge(
+        gross_df,
+        characters_df,
+        on=["movie_title", "release_year", "release_month"],
+        how="outer",
+    )
+    film_revenue_df = pd.merge(
+        char_revenue_df,
+        directors_df.rename(columns={"name": "movie_title"}),
+        on="movie_title",
+        how="outer",
+    )
+
+    voice_actors_df = voice_actors_df.rename(columns={"movie": "movie_title"})
+    complete_df = merge_on_actors(
+        voice_actors_df, film_revenue_df, roles=("hero", "villain")
+    )
+    complete_df = complete_df.assign(
+        release_decade=get_release_decade(complete_df["release_year"]),
+        total_gross=get_totalgross_values(complete_df["total_gross"]),
+        inflation_adjusted_gross=get_totalgross_values(
+            complete_df["inflation_adjusted_gross"]
+        ),
+    )
+    complete_df = (
+        complete_df[COMPLETE_COLS]
+        .sort_values(by=["release_year", "movie_title"])
+        .reset_index(drop=True)
+    )
+
+    # The 2016 Remake of The Jungle Book Was Listed Under the Original Director,
+    # and Its Rereleases Under a Different Rating and Genre Than the Original.
+    jungle_book_mask = complete_df["movie_title"] == "The Jungle Book"
+    remake_mask = jungle_book_mask & (complete_df["release_year"] == 2016)
+    complete_df.loc[remake_mask, "director"] = "Jon Favreau"
+
+    jungle_book_df = complete_df[jungle_book_mask & ~remake_mask].sort_values(
+        by=["release_year"]
+    )
+    if len(jungle_book_df) > 1:
+        complete_df.loc[jungle_book_df.index[1:], ["MPAA_rating", "genre"]] = (
+            jungle_book_df.iloc[0][["MPAA_rating", "genre"]].to_list()
+        )
+
+    return add_rereleases(complete_df)
+
+
+def __read_complete_df(feather, cache_path, memory_map):
+    complete_table = feather.read_table(cache_path, memory_map=True)
+    if memory_map:
+        # Arrow Backed Columns Keep Pointing Into the Mapped File Instead of Copying It.
+        return complete_table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    return complete_table.to_pandas()
+
+
+def build_complete_df(data_dir="data", cache_dir=None, memory_map=False):
+    """
+    Builds the complete dataframe of Disney films, merging the box office
+    revenue, characters, directors and voice actors of every film and adding
+    the revenue of rereleases to the original releases.
+
+    The result is cached on disk in the Arrow (Feather) columnar format, keyed
+    by the contents of the input files and of this module, so it is only
+    rebuilt when either changes. With memory_map=True, the dataframe is
+    returned as Arrow backed columns which stay in the memory mapped cache
+    rather than being copied into pandas. Without pyarrow, the dataframe is
+    rebuilt on every call.
+
+    Parameters
+    ----------
+    data_dir : str, optional
+        The directory containing the Disney csv files
+    cache_dir : str, optional
+        The directory to cache the complete dataframe in, by default the
+        '.cache' directory within data_dir
+    memory_map : bool, optional
+        Whether to return Arrow backed columns read straight from the memory
+        mapped cache, rather than the dtypes of the built dataframe
+
+    Returns
+    -------
+    pandas.DataFrame
+        the complete dataframe
+
+    Examples
+    --------
+    >>> complete_df = build_complete_df("data")
+    """
+
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return __build_complete_df(data_dir)
+
+    if cache_dir is None:
+        cache_dir = os.path.join(data_dir, ".cache")
+
+    # Key the Cache on the Input Files and the Code Which Builds the Dataframe.
+    cache_hash = hashlib.sha256(__get_file_hash(__file__).encode())
+    for file_name in sorted(DISNEY_FILES.values()):
+        cache_hash.update(__get_file_hash(os.path.join(data_dir, file_name)).encode())
+    cache_path = os.path.join(
+        cache_dir, f"complete_df-{cache_hash.hexdigest()[:16]}.feather"
+    )
+
+    if os.path.exists(cache_path):
+        return __read_complete_df(feather, cache_path, memory_map)
+
+    complete_df = __build_complete_df(data_dir)
+
+    # Write the Cache Atomically, Then Drop Caches of Older Inputs.
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    feather.write_feather(complete_df, temp_path, compression="uncompressed")
+    os.replace(temp_path, cache_path)
+
+    for stale_path in glob.glob(os.path.join(cache_dir, "complete_df-*.feather")):
+        if stale_path != cache_path:
+            os.remove(stale_path)
+
+    if memory_map:
+        return __read_complete_df(feather, cache_path, memory_map)
+
+    return complete_df
 
 
 ######################
@@ -272,13 +811,46 @@ def filter_duplicates(filter_df, search_df):
 ######################
 
 
+def __get_bin_edges(values, maxbins):
+    # Follow the Vega-Lite Binning Rules So Pre-Binned Charts Match Altair's Bins.
+    # _get_vega_bin_edges in assignment7/column_histogram.py Is a Copy of This.
+    min_value, max_value = float(values.min()), float(values.max())
+    span = (max_value - min_value) or abs(min_value) or 1
+
+    level = np.ceil(np.log10(maxbins))
+    step = 10 ** (np.round(np.log10(span)) - level)
+    while np.ceil(span / step) > maxbins:
+        step *= 10
+    for divisor in [5, 2]:
+        if span / (step / divisor) <= maxbins:
+            step /= divisor
+
+    precision = 0 if np.log(step) >= 0 else int(-np.log(step) / np.log(10)) + 1
+    eps = 10 ** (-precision - 1)
+
+    start = np.floor(min_value / step + eps) * step
+    if min_value < start:
+        start -= step
+    stop = np.ceil(max_value / step) * step
+    if stop == start:
+        stop = start + step
+
+    bin_count = int(np.round((stop - start) / step))
+    bin_edges = np.round(start + step * np.arange(bin_count + 1), precision)
+
+    return bin_edges, precision
+
+
 def __get_histogram(
     effective_df,
     feature="inflation_adjusted_gross",
     target="release_decade",
     plot_title="Distribution",
     maxbins=5,
+    prebin=False,
 ):
+    import altair as alt
+
     if maxbins > 0:
         plot_bin = alt.Bin(maxbins=maxbins)
     else:
@@ -313,12 +885,12 @@ def __get_histogram(
     plot_width = 550
 
     if (effective_df[feature].dtypes == np.float64) or (
-        effective_df[feature].dtypes == np.int
+        effective_df[feature].dtypes == np.int64
     ):
         # Set the Exponent For the Y-Axis to Improve Histogram Readability.
         exp = len(str(int(plot_df[plot_df[feature] != 0][feature].iloc[0]))) - 1
         plot_df = plot_df.assign(
-            feature_display=plot_df[feature].apply(lambda x: float(x) / (10**exp))
+            feature_display=plot_df[feature].astype(np.float64) / (10**exp)
         )
 
         if feature.lower().find("gross") != -1:
@@ -329,15 +901,54 @@ def __get_histogram(
         plot_df = plot_df.assign(feature_display=plot_df[feature])
         plot_y_axis = alt.Axis(title=y_label)
 
+    if prebin:
+        # Count the Records of Each Bin so the Chart Only Embeds the Counts.
+        if plot_bin is not None:
+            bin_edges, precision = __get_bin_edges(plot_df["feature_display"], maxbins)
+            bin_labels = [
+                f"{bin_start:.{precision}f} – {bin_stop:.{precision}f}"
+                for bin_start, bin_stop in zip(bin_edges[:-1], bin_edges[1:])
+            ]
+            bin_indices = np.clip(
+                np.searchsorted(bin_edges, plot_df["feature_display"], side="right")
+                - 1,
+                0,
+                len(bin_labels) - 1,
+            )
+            plot_df = plot_df.assign(
+                feature_display=pd.Categorical.from_codes(bin_indices, bin_labels)
+            )
+            plot_sort = bin_labels
+
+        group_cols = ["feature_display"]
+        if target in plot_df.columns:
+            group_cols.append(target)
+
+        plot_df = (
+            plot_df.groupby(group_cols, observed=True).size().reset_index(name="count")
+        )
+        if plot_bin is None:
+            # Sort the Values Before They Become Strings, as the Unbinned Chart Does.
+            plot_sort = (
+                plot_df["feature_display"]
+                .drop_duplicates()
+                .sort_values()
+                .astype(str)
+                .to_list()
+            )
+        plot_df = plot_df.astype({"feature_display": str})
+
+        plot_x = alt.X("count:Q", stack=True, title="Count of Records")
+        plot_y = alt.Y("feature_display:N", sort=plot_sort, axis=plot_y_axis)
+    else:
+        plot_x = alt.X("count()", stack=True)
+        plot_y = alt.Y(f"feature_display:N", bin=plot_bin, axis=plot_y_axis)
+
     # Create Histogram.
     histogram = (
         alt.Chart(plot_df)
         .mark_bar(opacity=0.7)
-        .encode(
-            x=alt.X("count()", stack=True),
-            y=alt.Y(f"feature_display:N", bin=plot_bin, axis=plot_y_axis),
-            color=plot_color,
-        )
+        .encode(x=plot_x, y=plot_y, color=plot_color)
         .properties(title=plot_title, width=plot_width, height=plot_height)
     )
 
@@ -350,6 +961,7 @@ def display_histogram(
     target="release_decade",
     plot_title="Distribution",
     maxbins=5,
+    prebin=False,
 ):
     """
     Plots a histogram of a dataframe feature
@@ -367,6 +979,9 @@ def display_histogram(
         the plot title
     maxbins: int, optional
         the maximum number of data bins on the y-axis
+    prebin: bool, optional
+        whether to count the records of each bin in pandas, so that the chart
+        only embeds the counts instead of the whole dataframe
 
     Returns
     -------
@@ -381,6 +996,7 @@ def display_histogram(
             target=target,
             plot_title=plot_title,
             maxbins=maxbins,
+            prebin=prebin,
         )
         .configure_axis(labelFontSize=10, titleFontSize=15)
         .configure_title(fontSize=24)
@@ -392,6 +1008,43 @@ def display_histogram(
 ##############################
 
 
+def __get_extreme_records(effective_df, feature, target, record_count):
+    # Drop Null Values From DataFrame.
+    if target in effective_df.columns:
+        plot_mask = effective_df[feature].notna() & effective_df[target].notna()
+    elif target == "count()":
+        plot_mask = effective_df[feature].notna()
+    else:
+        raise ValueError("Target not found in dataframe.")
+
+    plot_positions = np.flatnonzero(plot_mask.to_numpy())
+    plot_values = effective_df[feature].iloc[plot_positions].reset_index(drop=True)
+
+    if len(plot_values) < record_count:
+        plot_count = int(len(plot_values) / 2)
+    else:
+        plot_count = record_count
+
+    # Select the Records at Either End Without Sorting Every Record.
+    # Ties Are Broken As in a Stable Ascending Sort.
+    lowest_positions = plot_values.nsmallest(plot_count, keep="first").index
+    highest_positions = plot_values.nlargest(plot_count, keep="last").index
+
+    extreme_dfs = []
+    for extreme_positions, first_index in [
+        (lowest_positions, 0),
+        (highest_positions, len(plot_values) - plot_count),
+    ]:
+        extreme_positions = extreme_positions.to_numpy()[
+            np.lexsort((extreme_positions, plot_values[extreme_positions]))
+        ]
+        extreme_df = effective_df.iloc[plot_positions[extreme_positions]]
+        extreme_df.index = pd.RangeIndex(first_index, first_index + plot_count)
+        extreme_dfs.append(extreme_df)
+
+    return tuple(extreme_dfs)
+
+
 def display_concat_histograms(
     effective_df,
     feature="inflation_adjusted_gross",
@@ -399,6 +1052,7 @@ def display_concat_histograms(
     category_title="Grossing Films",
     maxbins=5,
     record_count=10,
+    prebin=False,
 ):
     """
     Plots a concatenated histogram of a dataframe feature
@@ -417,6 +1071,9 @@ def display_concat_histograms(
         the maximum number of data bins on the y-axis
     record_count: int, optional
         the number of records to plot
+    prebin: bool, optional
+        whether to count the records of each bin in pandas, so that the charts
+        only embed the counts instead of the plotted records
 
     Returns
     -------
@@ -424,37 +1081,22 @@ def display_concat_histograms(
         an Altair concatenated histogram
     """
 
+    import altair as alt
+
+    from IPython.display import display
+
     if len(effective_df) < record_count:
         raise ValueError(
             "Record count must be less than the number of records in the dataframe."
         )
 
-    # Drop Null Values From DataFrame.
-    if target in effective_df.columns:
-        plot_df = effective_df[
-            effective_df[feature].notna() & effective_df[target].notna()
-        ].sort_values(by=feature, ascending=True)
-    elif target == "count()":
-        plot_df = effective_df[effective_df[feature].notna()].sort_values(
-            by=feature, ascending=True
-        )
-    else:
-        raise ValueError("Target not found in dataframe.")
-
-    plot_df.reset_index(drop=True, inplace=True)
-
-    if len(plot_df) < record_count:
-        plot_count = int(len(plot_df) / 2)
-    else:
-        plot_count = record_count
-
     # Separate the Lowest and Highest Grossing Films.
-    lowest_df = plot_df.head(plot_count)
-
-    highest_df = filter_duplicates(
-        filter_df=plot_df.tail(plot_count), search_df=lowest_df
+    lowest_df, highest_df = __get_extreme_records(
+        effective_df, feature=feature, target=target, record_count=record_count
     )
 
+    highest_df = filter_duplicates(filter_df=highest_df, search_df=lowest_df)
+
     # Display the Lowest and Highest Grossing Films in a DataFrame.
     print("Lowest Grossing Films:")
     display(lowest_df)
@@ -469,6 +1111,7 @@ def display_concat_histograms(
         target=target,
         plot_title=f"Lowest {category_title} : Distribution",
         maxbins=maxbins,
+        prebin=prebin,
     )
 
     highest_histogram = __get_histogram(
@@ -477,6 +1120,7 @@ def display_concat_histograms(
         target=target,
         plot_title=f"Highest {category_title} : Distribution",
         maxbins=maxbins,
+        prebin=prebin,
     )
 
     # Concatenate Histograms.
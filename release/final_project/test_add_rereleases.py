@@ -47,3 +47,89 @@ def test_add_rereleases():
     ), f'The inflation adjusted gross for the first row should be 1.1. It instead is {cleaned_data.iloc[0]["total_gross"]}.'
 
     return
+
+
+def test_add_rereleases_multiple_films():
+    helper_dict = {
+        # Identifying Columns
+        "movie_title": [
+            "The Jungle Book",
+            "101 Dalmatians",
+            "The Jungle Book",
+            "101 Dalmatians",
+            "Pinocchio",
+        ],
+        "director": [
+            "Wolfgang Reitherman",
+            "Stephen Herek",
+            "Wolfgang Reitherman",
+            "Stephen Herek",
+            "Ben Sharpsteen",
+        ],
+        "MPAA_rating": ["G", "G", "G", "G", "G"],
+        "genre": ["Adventure", "Comedy", "Adventure", "Comedy", "Adventure"],
+        "release_year": [1967, 1996, 1990, 2000, 1940],
+        # Summation Columns
+        "total_gross": [2.0, 4.0, 1.0, 3.0, 8.0],
+        "inflation_adjusted_gross": [1.5, 2.0, 0.5, 1.0, 6.0],
+    }
+    helper_data = pd.DataFrame.from_dict(helper_dict)
+
+    cleaned_data = add_rereleases(helper_data)
+
+    # Tests That Each Film Keeps Its First Release and is Sorted by Release Year.
+    assert cleaned_data["movie_title"].to_list() == [
+        "Pinocchio",
+        "The Jungle Book",
+        "101 Dalmatians",
+    ], f"The cleaned data is not sorted by release year. It instead is {cleaned_data['movie_title'].to_list()}."
+    assert cleaned_data["release_year"].to_list() == [
+        1940,
+        1967,
+        1996,
+    ], f"The cleaned data should keep the first release of each film."
+    assert cleaned_data["total_gross"].to_list() == [
+        8.0,
+        3.0,
+        7.0,
+    ], f"The total gross should be summed for each film. It instead is {cleaned_data['total_gross'].to_list()}."
+    assert cleaned_data["inflation_adjusted_gross"].to_list() == [
+        6.0,
+        2.0,
+        3.0,
+    ], f"The inflation adjusted gross should be summed for each film. It instead is {cleaned_data['inflation_adjusted_gross'].to_list()}."
+
+    return
+
+
+def test_add_rereleases_shared_title():
+    helper_dict = {
+        # Identifying Columns
+        "movie_title": ["The Lion King"] * 4,
+        "director": ["Roger Allers", "Jon Favreau", "Roger Allers", "Jon Favreau"],
+        "MPAA_rating": ["G", "PG", "G", "PG"],
+        "genre": ["Musical", "Adventure", "Musical", "Adventure"],
+        "release_year": [1994, 2019, 2011, 2020],
+        # Summation Columns
+        "total_gross": [4.0, 5.0, 1.0, 0.5],
+        "inflation_adjusted_gross": [7.0, 5.0, 1.5, 0.5],
+    }
+    helper_data = pd.DataFrame.from_dict(helper_dict)
+
+    cleaned_data = add_rereleases(helper_data)
+
+    # Tests That Each Release of a Shared Title Sums Its Own Rereleases.
+    assert cleaned_data["release_year"].to_list() == [
+        1994,
+        2019,
+    ], f"Each release should keep its first row. It instead keeps {cleaned_data['release_year'].to_list()}."
+    assert cleaned_data["total_gross"].to_list() == [
+        5.0,
+        5.5,
+    ], f"The total gross should be summed for each release. It instead is {cleaned_data['total_gross'].to_list()}."
+    assert cleaned_data["inflation_adjusted_gross"].to_list() == [
+        8.5,
+        5.5,
+    ], f"The inflation adjusted gross should be summed for each release. It instead is {cleaned_data['inflation_adjusted_gross'].to_list()}."
+
+    return
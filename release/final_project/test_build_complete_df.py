@@ -0,0 +1,61 @@
+#######################
+### Import Packages ###
+#######################
+
+import os
+import shutil
+
+import pandas as pd
+
+from disney_functions import build_complete_df
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def test_build_complete_df(tmp_path):
+    data_dir = tmp_path / "data"
+    shutil.copytree(DATA_DIR, data_dir)
+
+    complete_df = build_complete_df(data_dir)
+    cache_files = os.listdir(data_dir / ".cache")
+
+    # Tests That the Dataframe is Cached and Reloaded Unchanged.
+    assert (
+        len(cache_files) == 1
+    ), f"The complete dataframe should be cached in a single file. The cache instead contains {cache_files}."
+    assert build_complete_df(data_dir).equals(
+        complete_df
+    ), "The cached dataframe should equal the built dataframe."
+    assert (
+        complete_df[
+            complete_df.duplicated(
+                subset=["movie_title", "director", "genre", "MPAA_rating"]
+            )
+        ].shape[0]
+        == 0
+    ), f"The complete data should not contain any rereleases."
+
+    # Tests That the Memory Mapped Dataframe Holds the Same Records in Arrow Columns.
+    mapped_df = build_complete_df(data_dir, memory_map=True)
+    assert all(
+        isinstance(dtype, pd.ArrowDtype) for dtype in mapped_df.dtypes
+    ), f"The memory mapped columns should be Arrow backed. They instead are {mapped_df.dtypes.to_dict()}."
+    assert (
+        mapped_df["movie_title"].to_list() == complete_df["movie_title"].to_list()
+    ), "The memory mapped dataframe should hold the same films."
+
+    # Tests That Changing an Input File Rebuilds the Dataframe.
+    with open(data_dir / "disney-director.csv", "a") as directors_file:
+        directors_file.write("\nA New Film,A New Director")
+
+    rebuilt_df = build_complete_df(data_dir)
+    rebuilt_files = os.listdir(data_dir / ".cache")
+
+    assert (
+        len(rebuilt_files) == 1 and rebuilt_files != cache_files
+    ), f"The cache should be replaced when an input changes. It instead contains {rebuilt_files}."
+    assert (
+        "A New Film" in rebuilt_df["movie_title"].to_list()
+    ), "The rebuilt dataframe should contain the new film."
+
+    return
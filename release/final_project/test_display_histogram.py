@@ -0,0 +1,82 @@
+#######################
+### Import Packages ###
+#######################
+
+import pandas as pd
+import numpy as np
+
+import disney_functions
+from disney_functions import display_histogram
+
+# The Same Expected Edges Are Tested in assignment7/test_column_histogram.py
+VEGA_BIN_EDGES = [
+    ((1, 44, 10), [0, 5, 10, 15, 20, 25, 30, 35, 40, 45]),
+    ((0.1, 0.9, 10), [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]),
+    ((1, 1, 10), [1, 1.1]),
+    ((1e6, 5e9, 10), [i * 5e8 for i in range(11)]),
+    ((-3.2, 7.5, 20), list(range(-4, 9))),
+    ((0, 1000, 5), [0, 200, 400, 600, 800, 1000]),
+]
+
+
+def test_display_histogram_prebin():
+    rng = np.random.default_rng(0)
+    helper_dict = {
+        "movie_title": [f"Film {i}" for i in range(1000)],
+        "inflation_adjusted_gross": rng.uniform(1e6, 5e9, size=1000),
+        "release_decade": rng.choice([1960, 1990, 2010], size=1000),
+    }
+    helper_data = pd.DataFrame.from_dict(helper_dict)
+
+    histogram = display_histogram(helper_data, maxbins=10, prebin=True)
+    plot_df = histogram.data
+
+    # Tests That the Chart Only Embeds One Count Per Bin and Decade.
+    assert (
+        plot_df["feature_display"].nunique() <= 10
+    ), f"The chart should have at most 10 bins. It instead has {plot_df['feature_display'].nunique()}."
+    assert plot_df.shape[0] <= 30 and plot_df.columns.to_list() == [
+        "feature_display",
+        "release_decade",
+        "count",
+    ], f"The chart data should only contain the binned counts. It instead has the shape {plot_df.shape}."
+    assert (
+        plot_df["count"].sum() == 1000
+    ), f"Every record should be counted once. The counts instead sum to {plot_df['count'].sum()}."
+
+    return
+
+
+def test_get_bin_edges():
+    # Tests That the Bin Edges Match the Edges Vega-Lite Picks With bin=True.
+    for (min_value, max_value, maxbins), expected_edges in VEGA_BIN_EDGES:
+        bin_edges, _ = disney_functions.__get_bin_edges(
+            pd.Series([min_value, max_value]), maxbins
+        )
+        assert len(bin_edges) == len(expected_edges) and np.allclose(
+            bin_edges, expected_edges
+        ), f"The bin edges from {min_value} to {max_value} are incorrect. They instead are {bin_edges.tolist()}."
+
+    return
+
+
+def test_display_histogram_prebin_unbinned():
+    helper_data = pd.DataFrame(
+        {
+            "movie_title": ["Film 1", "Film 2", "Film 3", "Film 4"],
+            "inflation_adjusted_gross": [10e9, 2e9, 3e9, 10e9],
+            "release_decade": [1960, 1990, 1990, 2010],
+        }
+    )
+
+    histogram = display_histogram(helper_data, maxbins=0, prebin=True)
+    plot_sort = histogram.to_dict()["encoding"]["y"]["sort"]
+
+    # Tests That Unbinned Values Are Sorted by Number Rather Than as Strings.
+    assert plot_sort == [
+        "2.0",
+        "3.0",
+        "10.0",
+    ], f"The values should be sorted numerically. They instead are sorted as {plot_sort}."
+
+    return
@@ -0,0 +1,36 @@
+#######################
+### Import Packages ###
+#######################
+
+import pandas as pd
+
+from disney_functions import filter_duplicates
+
+
+def test_filter_duplicates():
+    filter_dict = {
+        "movie_title": ["Frozen", "Zootopia", "Moana", "Tangled"],
+        "release_year": [2013, 2016, 2016, 2010],
+        "release_month": [11, 3, 11, 11],
+    }
+    search_dict = {
+        "movie_title": ["Tangled", "Frozen", "Moana"],
+        "release_year": [2010, 2013, 2017],
+        "release_month": [11, 11, 11],
+    }
+    filter_df = pd.DataFrame.from_dict(filter_dict)
+    search_df = pd.DataFrame.from_dict(search_dict)
+
+    filtered_df = filter_duplicates(filter_df, search_df)
+
+    # Tests That Only the Films Missing From the Search Dataframe Are Kept, In Order.
+    assert filtered_df["movie_title"].to_list() == [
+        "Zootopia",
+        "Moana",
+    ], f'The filtered data should only contain Zootopia and Moana. It instead contains {filtered_df["movie_title"].to_list()}.'
+    assert filtered_df.index.to_list() == [
+        1,
+        2,
+    ], f"The filtered data should keep its original index. It instead has {filtered_df.index.to_list()}."
+
+    return
@@ -0,0 +1,52 @@
+#######################
+### Import Packages ###
+#######################
+
+import pandas as pd
+import numpy as np
+
+from disney_functions import get_release_dates
+
+
+def test_get_release_dates():
+    helper_data = pd.Series(
+        ["December 21, 1937", np.nan, "February 7, 1940", "December 21, 1937"],
+        index=[3, 5, 7, 9],
+    )
+
+    release_dates = get_release_dates(helper_data, date_format="%B %d, %Y")
+
+    # Tests That Every Date is Parsed Into Its Year, Month and Decade.
+    assert release_dates.index.to_list() == [
+        3,
+        5,
+        7,
+        9,
+    ], f"The release dates should keep the index of the dates. It instead is {release_dates.index.to_list()}."
+    assert release_dates["release_year"].to_list() == [
+        1937,
+        pd.NA,
+        1940,
+        1937,
+    ], f'The release years are incorrect. They instead are {release_dates["release_year"].to_list()}.'
+    assert release_dates["release_month"].to_list() == [
+        12,
+        pd.NA,
+        2,
+        12,
+    ], f'The release months are incorrect. They instead are {release_dates["release_month"].to_list()}.'
+    assert release_dates["release_decade"].to_list() == [
+        1930,
+        pd.NA,
+        1940,
+        1930,
+    ], f'The release decades are incorrect. They instead are {release_dates["release_decade"].to_list()}.'
+
+    # Tests That the Columns Use Compact Integer Types.
+    assert release_dates.dtypes.to_list() == [
+        "Int16",
+        "Int8",
+        "Int16",
+    ], f"The release dates should be small integers. They instead are {release_dates.dtypes.to_list()}."
+
+    return
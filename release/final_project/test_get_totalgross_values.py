@@ -0,0 +1,89 @@
+#######################
+### Import Packages ###
+#######################
+
+import pandas as pd
+import numpy as np
+
+import disney_functions
+from disney_functions import get_totalgross_value, get_totalgross_values
+
+
+def test_get_totalgross_values():
+    helper_data = pd.Series(
+        ["$184,925,485", np.nan, "($1,200.50)", "-$3.5", "$12", "N/A", "$1,23"],
+        name="total_gross",
+    )
+
+    gross_values = get_totalgross_values(helper_data)
+    gross_cents = get_totalgross_values(helper_data, cents=True)
+
+    # Tests That the Column Parser Agrees With the Element Parser on Valid Values.
+    assert gross_values.iloc[[0, 1, 4]].equals(
+        helper_data.iloc[[0, 1, 4]].apply(get_totalgross_value)
+    ), f"The parsed values should match get_totalgross_value. They instead are {gross_values.to_list()}."
+    assert (
+        gross_values.name == "total_gross"
+    ), f"The parsed values should keep the column name. It instead is {gross_values.name}."
+
+    # Tests That Negative Amounts Are Parsed and Invalid Amounts Are Missing.
+    assert gross_cents.to_list() == [
+        18492548500,
+        pd.NA,
+        -120050,
+        -350,
+        1200,
+        pd.NA,
+        pd.NA,
+    ], f"The parsed cents are incorrect. They instead are {gross_cents.to_list()}."
+    assert (
+        gross_cents.dtype == "Int64"
+    ), f"The parsed cents should be of type Int64. They instead are of type {gross_cents.dtype}."
+
+    # Tests That Amounts Too Large for Int64 Cents Are Missing Rather Than Overflowing.
+    large_cents = get_totalgross_values(
+        pd.Series(["999999999999999999", "99999999999999999", "9999999999999999.99"]),
+        cents=True,
+    )
+    assert large_cents.to_list() == [
+        pd.NA,
+        pd.NA,
+        999999999999999999,
+    ], f"Amounts too large for Int64 cents should be missing. They instead are {large_cents.to_list()}."
+
+    # Tests That an Empty Column Is Parsed to an Empty Column.
+    empty_data = pd.Series([], dtype="str", name="total_gross")
+    empty_values = get_totalgross_values(empty_data)
+    empty_cents = get_totalgross_values(empty_data, cents=True)
+    assert (
+        empty_values.empty and empty_values.dtype == "float64"
+    ), f"An empty column should give empty float64 values. It instead is {empty_values}."
+    assert (
+        empty_cents.empty and empty_cents.dtype == "Int64"
+    ), f"An empty column should give empty Int64 cents. It instead is {empty_cents}."
+
+    return
+
+
+def test_get_totalgross_values_without_pyarrow():
+    helper_data = pd.Series(
+        [
+            "$184,925,485",
+            np.nan,
+            " ($1,200.50) ",
+            "-$3.5",
+            "(-$3)",
+            "$1,234,5",
+            "99,999,999,999,999,999",
+            "9,999,999,999,999,999.99",
+        ],
+        name="total_gross",
+    )
+
+    arrow_cents = getattr(disney_functions, "__get_gross_cents_arrow")(helper_data)
+    string_cents = getattr(disney_functions, "__get_gross_cents_strings")(helper_data)
+
+    # Tests That the String Methods Used Without pyarrow Give the Same Cents.
+    pd.testing.assert_series_equal(arrow_cents, string_cents)
+
+    return
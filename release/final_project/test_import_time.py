@@ -0,0 +1,56 @@
+#######################
+### Import Packages ###
+#######################
+
+import os
+import subprocess
+import sys
+
+# Importing the Data Cleaning Functions May Only Cost This Much More Than pandas.
+IMPORT_BUDGET_US = 200_000
+
+PLOTTING_PACKAGES = ["altair", "jsonschema", "IPython"]
+
+
+def get_import_times(module_name):
+    """
+    Returns the cumulative import time in microseconds of every package imported
+    by a fresh interpreter importing module_name, as reported by -X importtime.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        _, cumulative, package = line[len("import time:") :].split("|")
+        import_times[package.strip()] = int(cumulative)
+
+    return import_times
+
+
+def test_import_time():
+    import_times = get_import_times("disney_functions")
+
+    # Tests That the Plotting Packages Are Not Imported With the Module.
+    imported_packages = {package.split(".")[0] for package in import_times}
+    for package in PLOTTING_PACKAGES:
+        assert (
+            package not in imported_packages
+        ), f"Importing disney_functions should not import {package}."
+
+    # Tests That the Module Stays Within Its Startup Budget.
+    module_cost = import_times["disney_functions"] - import_times["pandas"]
+    assert (
+        module_cost <= IMPORT_BUDGET_US
+    ), f"Importing disney_functions should take at most {IMPORT_BUDGET_US} us more than pandas. It instead takes {module_cost} us more."
+
+    return
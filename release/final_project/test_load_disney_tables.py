@@ -0,0 +1,83 @@
+#######################
+### Import Packages ###
+#######################
+
+import os
+
+import pandas as pd
+
+from disney_functions import add_rereleases, load_disney_tables, merge_on_actor
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def test_load_disney_tables():
+    disney_tables = load_disney_tables(DATA_DIR)
+    gross_df = disney_tables["gross"]
+    characters_df = disney_tables["characters"]
+
+    # Tests That Identifying Fields are Categorical and Dates are Small Integers.
+    assert gross_df.dtypes[
+        ["genre", "MPAA_rating", "release_year", "release_month"]
+    ].to_list() == [
+        "category",
+        "category",
+        "Int16",
+        "Int8",
+    ], f"The total gross table has the wrong types. They instead are {gross_df.dtypes.to_dict()}."
+    assert gross_df["total_gross"].dtype == "float64"
+    assert characters_df.dtypes[["hero", "villain"]].to_list() == [
+        "category",
+        "category",
+    ], f"The heroes and villains should be categorical. They instead are {characters_df.dtypes.to_dict()}."
+    assert disney_tables["directors"]["director"].dtype == "category"
+    assert disney_tables["voice_actors"]["voice-actor"].dtype == "category"
+    assert pd.api.types.is_string_dtype(gross_df["movie_title"])
+
+    # Tests That the Values Match the Plain Csv Files.
+    assert (
+        gross_df["total_gross"].sum()
+        == pd.read_csv(os.path.join(DATA_DIR, "disney_movies_total_gross.csv"))[
+            "total_gross"
+        ]
+        .str.replace(r"[$,]", "", regex=True)
+        .astype(float)
+        .sum()
+    ), "The total grosses should be parsed into dollars."
+    assert (
+        characters_df["movie_title"].str.contains("\r\n").sum() == 0
+    ), "The character titles should not contain line breaks."
+
+    return
+
+
+def test_load_disney_tables_stay_compact():
+    disney_tables = load_disney_tables(DATA_DIR)
+
+    film_revenue_df = pd.merge(
+        disney_tables["gross"],
+        disney_tables["characters"],
+        on=["movie_title", "release_year", "release_month"],
+        how="outer",
+    ).merge(disney_tables["directors"], on="movie_title", how="outer")
+    hero_revenue_df = merge_on_actor(
+        disney_tables["voice_actors"], film_revenue_df, "hero"
+    )
+    rerelease_df = add_rereleases(hero_revenue_df)
+
+    # Tests That the Functions Do Not Convert the Compact Types Back to Objects.
+    assert (
+        hero_revenue_df.dtypes[["hero", "hero-actor", "genre", "director"]]
+        == "category"
+    ).all(), f"The merged heroes should stay categorical. They instead are {hero_revenue_df.dtypes.to_dict()}."
+    assert (
+        hero_revenue_df["hero-actor"].notna().sum() > 0
+    ), "The hero actors should be merged."
+    assert (
+        rerelease_df.dtypes == hero_revenue_df.dtypes
+    ).all(), f"Adding rereleases should keep the types. They instead are {rerelease_df.dtypes.to_dict()}."
+    assert (
+        object not in rerelease_df.dtypes.to_list()
+    ), "No column should be converted to objects."
+
+    return
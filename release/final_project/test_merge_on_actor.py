@@ -0,0 +1,83 @@
+#######################
+### Import Packages ###
+#######################
+
+import pandas as pd
+
+from disney_functions import merge_on_actor
+
+
+def test_merge_on_actor():
+    voice_actors_dict = {
+        "character": ["Mowgli", "Mowgli", "Shere Khan", "Mowgli", "Pinocchio"],
+        "voice-actor": [
+            "Bruce Reitherman",
+            "Neel Sethi",
+            "George Sanders",
+            "Clint Howard",
+            "Dickie Jones",
+        ],
+        "movie_title": [
+            "The Jungle Book",
+            "The Jungle Book",
+            "The Jungle Book",
+            "The Jungle Book",
+            "Pinocchio",
+        ],
+    }
+    film_dict = {
+        "movie_title": ["Pinocchio", "The Jungle Book"],
+        "release_month": [2, 10],
+        "release_year": [1940, 1967],
+        "hero": ["Pinocchio", "Mowgli"],
+    }
+    voice_actors_df = pd.DataFrame.from_dict(voice_actors_dict)
+    film_revenue_df = pd.DataFrame.from_dict(film_dict)
+
+    merged_df = merge_on_actor(voice_actors_df, film_revenue_df, char_type="hero")
+
+    # Tests That Each Film Keeps a Single Row With All of Its Voice-Actors.
+    assert merged_df.shape == (
+        2,
+        5,
+    ), f"The merged data should have 2 rows and 5 columns. It instead has the shape {merged_df.shape}."
+    assert merged_df.columns.to_list() == [
+        "movie_title",
+        "release_month",
+        "release_year",
+        "hero",
+        "hero-actor",
+    ], f"The merged data has the wrong columns. It instead has {merged_df.columns.to_list()}."
+    assert merged_df["hero-actor"].to_list() == [
+        "Dickie Jones",
+        "Bruce Reitherman; Neel Sethi; Clint Howard",
+    ], f'The voice-actors should be joined in order. They instead are {merged_df["hero-actor"].to_list()}.'
+
+    return
+
+
+def test_merge_on_actor_unmatched_character():
+    voice_actors_df = pd.DataFrame(
+        {
+            "character": ["Mickey Mouse"],
+            "voice-actor": ["Walt Disney"],
+            "movie_title": ["Fantasia"],
+        }
+    )
+    film_revenue_df = pd.DataFrame(
+        {
+            "movie_title": ["Fantasia", "Fantasia", "Dumbo", "Dumbo"],
+            "release_month": [11, 11, 10, 10],
+            "release_year": [1940, 1940, 1941, 1941],
+            "hero": ["Mickey Mouse", "Yen Sid", "Dumbo", "Timothy"],
+        }
+    )
+
+    merged_df = merge_on_actor(voice_actors_df, film_revenue_df, char_type="hero")
+
+    # Tests That Characters Without a Voice-Actor Are Left Out of the Joined Voice-Actors.
+    assert merged_df["hero-actor"].iloc[0] == "Walt Disney" and pd.isna(
+        merged_df["hero-actor"].iloc[1]
+    ), f'The unmatched characters should be left out. The voice-actors instead are {merged_df["hero-actor"].to_list()}.'
+
+    return
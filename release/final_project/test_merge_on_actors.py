@@ -0,0 +1,101 @@
+#######################
+### Import Packages ###
+#######################
+
+import numpy as np
+import pandas as pd
+
+from disney_functions import merge_on_actor, merge_on_actors
+
+
+def test_merge_on_actors():
+    voice_actors_dict = {
+        "character": ["Mowgli", "Mowgli", "Shere Khan", "Mowgli", "Pinocchio"],
+        "voice-actor": [
+            "Bruce Reitherman",
+            "Neel Sethi",
+            "George Sanders",
+            "Clint Howard",
+            "Dickie Jones",
+        ],
+        "movie_title": [
+            "The Jungle Book",
+            "The Jungle Book",
+            "The Jungle Book",
+            "The Jungle Book",
+            "Pinocchio",
+        ],
+    }
+    film_dict = {
+        "movie_title": ["Pinocchio", "The Jungle Book"],
+        "release_month": [2, 10],
+        "release_year": [1940, 1967],
+        "hero": ["Pinocchio", "Mowgli"],
+        "villain": ["Stromboli", "Shere Khan"],
+    }
+    voice_actors_df = pd.DataFrame.from_dict(voice_actors_dict)
+    film_revenue_df = pd.DataFrame.from_dict(film_dict)
+
+    merged_df = merge_on_actors(voice_actors_df, film_revenue_df)
+
+    # Tests That Every Role Gets Its Voice-Actors in a Single Frame.
+    assert merged_df.columns.to_list() == [
+        "movie_title",
+        "release_month",
+        "release_year",
+        "hero",
+        "villain",
+        "hero-actor",
+        "villain-actor",
+    ], f"The merged data has the wrong columns. It instead has {merged_df.columns.to_list()}."
+    assert merged_df["hero-actor"].to_list() == [
+        "Dickie Jones",
+        "Bruce Reitherman; Neel Sethi; Clint Howard",
+    ], f'The hero voice-actors should be joined in order. They instead are {merged_df["hero-actor"].to_list()}.'
+    assert merged_df["villain-actor"].isna().to_list() == [
+        True,
+        False,
+    ], f'Only Shere Khan has a voice-actor. The villain voice-actors instead are {merged_df["villain-actor"].to_list()}.'
+
+    # Tests That the Result Matches Merging Each Role Separately.
+    hero_df = merge_on_actor(voice_actors_df, film_revenue_df, "hero")
+    villain_df = merge_on_actor(voice_actors_df, film_revenue_df, "villain")
+    separate_df = pd.merge(
+        hero_df,
+        villain_df,
+        on=["movie_title", "release_month", "release_year", "hero", "villain"],
+    )
+    pd.testing.assert_frame_equal(merged_df, separate_df)
+
+    return
+
+
+def test_merge_on_actors_listed_twice():
+    voice_actors_df = pd.DataFrame(
+        {
+            "character": ["Mowgli", "Baloo", "Mowgli"],
+            "voice-actor": ["Bruce Reitherman", "Phil Harris", "Neel Sethi"],
+            "movie_title": ["The Jungle Book"] * 3,
+        }
+    )
+    film_revenue_df = pd.DataFrame(
+        {
+            "movie_title": ["The Jungle Book", "The Jungle Book"],
+            "release_month": [10, 10],
+            "release_year": [1967, 1967],
+            "hero": ["Mowgli", "Baloo"],
+            "villain": [np.nan, np.nan],
+        }
+    )
+
+    merged_df = merge_on_actors(voice_actors_df, film_revenue_df, roles=("hero",))
+
+    # Tests That a Film Listed Twice Keeps the Voice-Actors of Both Rows.
+    assert merged_df["hero-actor"].to_list() == [
+        "Bruce Reitherman; Neel Sethi; Phil Harris"
+    ], f'The voice-actors of both rows should be joined. They instead are {merged_df["hero-actor"].to_list()}.'
+    assert (
+        "villain-actor" not in merged_df.columns
+    ), "Only the requested roles should be merged."
+
+    return
@@ -0,0 +1,504 @@
+"""
+Grades a cohort of notebook submissions against the test_assignmentN module
+of an assignment, in a pool of processes.
+
+Each submission is run cell by cell as its notebook would be, and every call
+it makes to a test_* check is timed and recorded instead of stopping at the
+first failure. The test module, the libraries it needs and the csv files of
+the assignment are loaded once before the pool is forked, so every
+submission reuses them through copy-on-write rather than loading them again.
+
+    python grade_submissions.py assignment7 submissions/*.ipynb --output report.json
+"""
+
+#######################
+### Import Packages ###
+#######################
+
+import argparse
+import contextlib
+import glob
+import importlib
+import importlib.util
+import io
+import json
+import linecache
+import multiprocessing
+import multiprocessing.connection
+import os
+import re
+import signal
+import sys
+import time
+import types
+
+import pandas as pd
+
+########################
+### Load Submissions ###
+########################
+
+# Set in the parent process before the pool is forked, so every worker shares it.
+_GRADER = {}
+
+
+class CheckTimeout(Exception):
+    pass
+
+
+def __raise_timeout(signum, frame):
+    raise CheckTimeout("The check did not finish in time")
+
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """
+    Raises CheckTimeout in the main thread if the block runs for longer than
+    the given number of seconds. Only available where SIGALRM is.
+
+    Limits can be nested, such as a check within a cell. The inner limit
+    never outlasts the outer one, and the outer timer is re-armed with the
+    time it has left once the inner block ends.
+    """
+
+    if not seconds or not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    start = time.monotonic()
+    previous_handler = signal.signal(signal.SIGALRM, __raise_timeout)
+    previous_seconds, _ = signal.setitimer(signal.ITIMER_REAL, seconds)
+    if previous_seconds and previous_seconds < seconds:
+        signal.setitimer(signal.ITIMER_REAL, previous_seconds)
+
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+        if previous_seconds:
+            # An outer limit which has already run out fires straight away.
+            remaining_seconds = previous_seconds - (time.monotonic() - start)
+            signal.setitimer(signal.ITIMER_REAL, max(remaining_seconds, 1e-6))
+
+
+def load_submission(notebook_path):
+    """
+    Returns the source of every code cell of a notebook, without the shell
+    commands, magics and help requests only IPython understands.
+
+    Parameters
+    ----------
+    notebook_path : str
+        The path of the notebook to load
+
+    Returns
+    -------
+    list of str
+        the source of each code cell, in order
+
+    Examples
+    --------
+    >>> load_submission("assignment7/assignment7.ipynb")
+    """
+
+    with open(notebook_path, encoding="utf8") as notebook_file:
+        notebook = json.load(notebook_file)
+
+    cell_sources = []
+    for cell in notebook["cells"]:
+        if cell["cell_type"] != "code":
+            continue
+
+        source = "".join(cell["source"])
+        cell_sources.append(
+            "\n".join(
+                line
+                for line in source.splitlines()
+                if not line.lstrip().startswith(("!", "%", "?"))
+                and not re.fullmatch(r"\s*[\w.]+\?\??\s*", line)
+            )
+        )
+
+    return cell_sources
+
+
+def preload_datasets(assignment_dir):
+    """
+    Reads every csv file of an assignment, keyed by its absolute path, so
+    they can be handed to submissions without parsing them again.
+
+    Parameters
+    ----------
+    assignment_dir : str
+        The directory of the assignment
+
+    Returns
+    -------
+    dict of pandas.DataFrame
+        the dataframe of each csv file
+
+    Examples
+    --------
+    >>> preload_datasets("assignment7")
+    """
+
+    datasets = {}
+    for csv_path in glob.glob(
+        os.path.join(assignment_dir, "**", "*.csv"), recursive=True
+    ):
+        try:
+            datasets[os.path.abspath(csv_path)] = pd.read_csv(csv_path)
+        except (pd.errors.ParserError, UnicodeDecodeError):
+            continue
+
+    return datasets
+
+
+def __read_preloaded_csv(filepath_or_buffer, *args, **kwargs):
+    # Only plain reads of a preloaded file are served from memory.
+    if not args and not kwargs and isinstance(filepath_or_buffer, (str, os.PathLike)):
+        dataset = _GRADER["datasets"].get(os.path.abspath(filepath_or_buffer))
+        if dataset is not None:
+            return dataset.copy()
+
+    return _GRADER["read_csv"](filepath_or_buffer, *args, **kwargs)
+
+
+def __prepare_grader(assignment_dir, check_timeout, cell_timeout):
+    assignment_dir = os.path.abspath(assignment_dir)
+    assignment_name = os.path.basename(assignment_dir).replace("_late", "")
+    module_name = f"test_{assignment_name}"
+
+    # Import the Checks and the Libraries They Use Once, Before Forking. The
+    # checks are loaded from their file rather than sys.modules, so grading a
+    # second assignment with a test module of the same name uses its own checks.
+    loaded_modules = set(sys.modules)
+    sys.path.insert(0, assignment_dir)
+    try:
+        module_spec = importlib.util.spec_from_file_location(
+            module_name, os.path.join(assignment_dir, f"{module_name}.py")
+        )
+        test_module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(test_module)
+    finally:
+        sys.path.remove(assignment_dir)
+        # Modules the checks import from the assignment are not reused by others.
+        for loaded_name in set(sys.modules) - loaded_modules:
+            loaded_path = getattr(sys.modules[loaded_name], "__file__", None) or ""
+            if loaded_path.startswith(assignment_dir + os.sep):
+                del sys.modules[loaded_name]
+
+    for library in ["numpy", "pandas", "altair"]:
+        with contextlib.suppress(ImportError):
+            importlib.import_module(library)
+
+    _GRADER.update(
+        assignment_dir=assignment_dir,
+        module_name=module_name,
+        test_module=test_module,
+        datasets=preload_datasets(assignment_dir),
+        read_csv=pd.read_csv,
+        check_timeout=check_timeout,
+        cell_timeout=cell_timeout,
+    )
+
+
+#########################
+### Grade Submissions ###
+#########################
+
+
+def __record_checks(test_module, records):
+    # Stands in for the test module, so each check a notebook calls is recorded.
+    recorder = types.ModuleType(test_module.__name__)
+    recorder.__dict__.update(vars(test_module))
+
+    def record_check(check_name, check):
+        def recorded_check(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                with time_limit(_GRADER["check_timeout"]):
+                    check(*args, **kwargs)
+                status, message = "passed", ""
+            except AssertionError as error:
+                status, message = "failed", str(error)
+            except CheckTimeout as error:
+                status, message = "timeout", str(error)
+            except (Exception, SystemExit) as error:
+                status, message = "error", f"{type(error).__name__}: {error}"
+
+            records.append(
+                {
+                    "check": check_name,
+                    "status": status,
+                    "seconds": time.perf_counter() - start,
+                    "message": message,
+                }
+            )
+            return "Success" if status == "passed" else None
+
+        return recorded_check
+
+    for check_name, check in vars(test_module).items():
+        if check_name.startswith("test_") and callable(check):
+            setattr(recorder, check_name, record_check(check_name, check))
+
+    return recorder
+
+
+def grade_submission(notebook_path):
+    """
+    Runs every code cell of a notebook and records each check it calls.
+    Errors and timeouts in a cell or a check are recorded and the next cell
+    is run, and checks the notebook never reaches are recorded as missing.
+
+    Parameters
+    ----------
+    notebook_path : str
+        The path of the notebook to grade
+
+    Returns
+    -------
+    list of dict
+        the 'submission', 'check', 'status', 'seconds' and 'message' of
+        every check and of every cell which raised an error
+
+    Examples
+    --------
+    >>> grade_submission("submissions/student_1/assignment7.ipynb")
+    """
+
+    records = []
+    try:
+        cell_sources = load_submission(notebook_path)
+    except (OSError, ValueError) as error:
+        cell_sources = []
+        records.append(
+            {
+                "check": "notebook",
+                "status": "error",
+                "seconds": 0.0,
+                "message": f"{type(error).__name__}: {error}",
+            }
+        )
+
+    # Modules next to the notebook take precedence over the assignment's, but
+    # data files are always read from the assignment, as the checks expect.
+    submission_dir = os.path.dirname(os.path.abspath(notebook_path))
+    os.chdir(_GRADER["assignment_dir"])
+    sys.path[:0] = [submission_dir, _GRADER["assignment_dir"]]
+
+    test_module = _GRADER["test_module"]
+    sys.modules[_GRADER["module_name"]] = __record_checks(test_module, records)
+    pd.read_csv = __read_preloaded_csv
+
+    namespace = {"__name__": "__main__", "display": lambda *args, **kwargs: None}
+    for cell_number, cell_source in enumerate(cell_sources, start=1):
+        # Cells are cached as IPython does, so checks can inspect the source of answers.
+        cell_name = f"<{notebook_path} cell {cell_number}>"
+        linecache.cache[cell_name] = (
+            len(cell_source),
+            None,
+            cell_source.splitlines(keepends=True),
+            cell_name,
+        )
+
+        start = time.perf_counter()
+        try:
+            with time_limit(_GRADER["cell_timeout"]), contextlib.redirect_stdout(
+                io.StringIO()
+            ), contextlib.redirect_stderr(io.StringIO()):
+                exec(compile(cell_source, cell_name, "exec"), namespace)
+        except (Exception, SystemExit) as error:
+            records.append(
+                {
+                    "check": f"cell {cell_number}",
+                    "status": "timeout" if isinstance(error, CheckTimeout) else "error",
+                    "seconds": time.perf_counter() - start,
+                    "message": f"{type(error).__name__}: {error}",
+                }
+            )
+
+    called_checks = {record["check"] for record in records}
+    for check_name in vars(test_module):
+        if check_name.startswith("test_") and check_name not in called_checks:
+            records.append(
+                {
+                    "check": check_name,
+                    "status": "missing",
+                    "seconds": 0.0,
+                    "message": "",
+                }
+            )
+
+    return [{"submission": notebook_path, **record} for record in records]
+
+
+def __grade_in_process(notebook_path, connection, grader_args):
+    # Without fork, the process loads the assignment for itself.
+    if grader_args is not None:
+        __prepare_grader(*grader_args)
+
+    connection.send(grade_submission(notebook_path))
+    connection.close()
+
+
+def __record_lost_submission(notebook_path, status, message, seconds):
+    return [
+        {
+            "submission": notebook_path,
+            "check": "submission",
+            "status": status,
+            "seconds": seconds,
+            "message": message,
+        }
+    ]
+
+
+def grade_submissions(
+    assignment_dir,
+    notebook_paths,
+    n_jobs=None,
+    check_timeout=10,
+    cell_timeout=60,
+    submission_timeout=600,
+):
+    """
+    Grades every submission of an assignment in a pool of processes. Each
+    submission runs in a fresh process forked from one which has already
+    loaded the checks, the libraries and the csv files of the assignment.
+    A process still running after submission_timeout seconds is killed,
+    which also stops hangs inside C code that SIGALRM cannot interrupt.
+
+    Parameters
+    ----------
+    assignment_dir : str
+        The directory of the assignment, containing its test_assignmentN.py
+    notebook_paths : list of str
+        The notebooks to grade
+    n_jobs : int, optional
+        The number of processes, one per core by default
+    check_timeout : float, optional
+        The number of seconds a check may run for
+    cell_timeout : float, optional
+        The number of seconds a cell may run for
+    submission_timeout : float, optional
+        The number of seconds a whole submission may run for
+
+    Returns
+    -------
+    pandas.DataFrame
+        the 'submission', 'check', 'status', 'seconds' and 'message' of
+        every check of every submission
+
+    Examples
+    --------
+    >>> grade_submissions("assignment7", glob.glob("submissions/*/assignment7.ipynb"))
+    """
+
+    __prepare_grader(assignment_dir, check_timeout, cell_timeout)
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        process_context = multiprocessing.get_context("fork")
+        grader_args = None
+    else:
+        process_context = multiprocessing.get_context()
+        grader_args = (assignment_dir, check_timeout, cell_timeout)
+
+    n_jobs = n_jobs or os.cpu_count()
+    pending_paths = list(enumerate(notebook_paths))
+    submission_records = [None] * len(notebook_paths)
+    running = {}
+
+    while pending_paths or running:
+        # One fresh process per submission, at most n_jobs at a time.
+        while pending_paths and len(running) < n_jobs:
+            position, notebook_path = pending_paths.pop(0)
+            receiver, sender = process_context.Pipe(duplex=False)
+            process = process_context.Process(
+                target=__grade_in_process, args=(notebook_path, sender, grader_args)
+            )
+            process.start()
+            sender.close()
+            running[receiver] = (position, notebook_path, process, time.monotonic())
+
+        next_deadline = min(start for *_, start in running.values()) + (
+            submission_timeout or float("inf")
+        )
+        ready_receivers = multiprocessing.connection.wait(
+            list(running),
+            timeout=(
+                max(next_deadline - time.monotonic(), 0) if submission_timeout else None
+            ),
+        )
+
+        for receiver in list(running):
+            position, notebook_path, process, start = running[receiver]
+            seconds = time.monotonic() - start
+
+            if receiver in ready_receivers:
+                try:
+                    submission_records[position] = receiver.recv()
+                except EOFError:
+                    # The process died before sending its records.
+                    process.join()
+                    submission_records[position] = __record_lost_submission(
+                        notebook_path,
+                        "error",
+                        f"The process exited with code {process.exitcode}",
+                        seconds,
+                    )
+            elif submission_timeout and seconds >= submission_timeout:
+                process.kill()
+                submission_records[position] = __record_lost_submission(
+                    notebook_path,
+                    "timeout",
+                    "The submission did not finish in time",
+                    seconds,
+                )
+            else:
+                continue
+
+            process.join()
+            receiver.close()
+            del running[receiver]
+
+    return pd.DataFrame(
+        [record for records in submission_records for record in records],
+        columns=["submission", "check", "status", "seconds", "message"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Grade notebook submissions against an assignment's checks."
+    )
+    parser.add_argument("assignment_dir")
+    parser.add_argument("notebooks", nargs="+")
+    parser.add_argument("--jobs", type=int)
+    parser.add_argument("--check-timeout", type=float, default=10)
+    parser.add_argument("--cell-timeout", type=float, default=60)
+    parser.add_argument("--submission-timeout", type=float, default=600)
+    parser.add_argument("--output", help="the json file to save the report to")
+    args = parser.parse_args()
+
+    report_df = grade_submissions(
+        args.assignment_dir,
+        args.notebooks,
+        n_jobs=args.jobs,
+        check_timeout=args.check_timeout,
+        cell_timeout=args.cell_timeout,
+        submission_timeout=args.submission_timeout,
+    )
+    print(
+        report_df.pivot_table(
+            index="submission", columns="status", values="check", aggfunc="count"
+        )
+        .fillna(0)
+        .astype(int)
+        .to_string()
+    )
+
+    if args.output:
+        report_df.to_json(args.output, orient="records", indent=2)
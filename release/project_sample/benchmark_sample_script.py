@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Times custom_agg in a single process against the process pool of n_jobs on
+synthetic data, to show how the aggregation scales with the number of cores.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sample_script import custom_agg
+
+
+def make_agg_data(row_count, group_count=10000, seed=0):
+    """
+    Given a number of rows, return a synthetic dataframe with a string
+    'group' column of group_count groups and a float 'value' column
+    """
+
+    rng = np.random.default_rng(seed)
+
+    return pd.DataFrame(
+        {
+            "group": pd.Series(rng.integers(group_count, size=row_count)).map(
+                "group {}".format
+            ),
+            "value": rng.random(row_count),
+        }
+    )
+
+
+def benchmark_custom_agg(max_exponent=7, action="mean", max_jobs=None):
+    """
+    Given the largest number of rows as a power of ten, time custom_agg for
+    10^6 rows upwards with 1, 2, 4, ... processes, up to max_jobs
+
+    Parameters
+    ----------
+    max_exponent : int, optional
+        The exponent of the largest number of rows
+    action : str, optional
+        The action to aggregate the values with
+    max_jobs : int, optional
+        The largest number of processes, the number of cores by default
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        The wall time and speedup over a single process of each number of
+        processes for each number of rows
+
+    Examples
+    --------
+    >>> benchmark_custom_agg(max_exponent=6)
+    """
+
+    max_jobs = max_jobs or os.cpu_count()
+    job_counts = [1] + [2**power for power in range(1, max_jobs.bit_length())]
+    if job_counts[-1] != max_jobs:
+        job_counts.append(max_jobs)
+
+    results = []
+    for exponent in range(6, max_exponent + 1):
+        data = make_agg_data(10**exponent)
+
+        for n_jobs in job_counts:
+            start = time.perf_counter()
+            custom_agg(data, "group", "value", action, n_jobs=n_jobs)
+            results.append(
+                {
+                    "row_count": 10**exponent,
+                    "n_jobs": n_jobs,
+                    "seconds": time.perf_counter() - start,
+                }
+            )
+
+    results = pd.DataFrame(results)
+    single_seconds = results.groupby("row_count")["seconds"].transform("first")
+    results["speedup"] = single_seconds / results["seconds"]
+
+    return results
+
+
+if __name__ == "__main__":
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    max_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    print(
+        benchmark_custom_agg(max_exponent=max_exponent, max_jobs=max_jobs).to_string(
+            index=False
+        )
+    )
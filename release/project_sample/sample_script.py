@@ -7,7 +7,8 @@ Created on Mon Sep 14 22:09:19 2020
 
 """
 
-def custom_agg(data, grouping_col,action_col, action = 'count'):
+def custom_agg(data, grouping_col,action_col, action = 'count', n_jobs = 1):
+    import numpy as np
     import pandas as pd
     """
     Given a dataframe, a column and an action, return a dataframe that has been
@@ -24,6 +25,11 @@ def custom_agg(data, grouping_col,action_col, action = 'count'):
     action : str, optional
         The action to apply to the specified action_col. The default is the
         count action.
+    n_jobs : int, optional
+        The number of processes to aggregate partitions of the rows in, -1
+        for one per core. Only actions that can be merged across partitions
+        are supported, and columns that are not plain numeric columns are
+        aggregated in a single process. The default is a single process.
 
     Returns
     -------
@@ -34,6 +40,8 @@ def custom_agg(data, grouping_col,action_col, action = 'count'):
     ------
     TypeError
         If the input argument data is not of type pandas.core.frame.DataFrame
+    ValueError
+        If n_jobs is not 1 and the action cannot be merged across partitions
     AssertError
         If the input argument grouping_col is not in the data columns
     AssertError
@@ -58,6 +66,16 @@ def custom_agg(data, grouping_col,action_col, action = 'count'):
     # Tests that the the action column is in the dataframe
     assert action_col in data.columns, "The action column does not exist in the dataframe"
 
+    if n_jobs != 1:
+        if action not in MERGEABLE_STATES:
+            raise ValueError("The action cannot be computed in parallel")
+
+        # Only numeric columns can be shared with the processes as raw buffers
+        if isinstance(data[action_col].dtype, np.dtype) and \
+                data[action_col].dtype.kind in 'biuf' and len(data) > 0:
+            return parallel_custom_agg(data, grouping_col, action_col, action,
+                                       n_jobs)
+
     # compute the groupby object
     res = data.groupby(grouping_col)[action_col].agg([action])
 
@@ -69,3 +87,280 @@ def custom_agg(data, grouping_col,action_col, action = 'count'):
 
     # return the result
     return(res)
+
+
+# Partial states kept per group for each action that can be merged across chunks
+MERGEABLE_STATES = {
+    'count': ['count'],
+    'sum': ['sum'],
+    'min': ['min'],
+    'max': ['max'],
+    'mean': ['count', 'mean'],
+    'var': ['count', 'mean', 'm2'],
+    'std': ['count', 'mean', 'm2'],
+}
+
+
+def partial_agg(data, grouping_col, action_col, action = 'count'):
+    """
+    Given a dataframe chunk, return the partial states of an aggregation for
+    each group, which merge_partial_aggs can combine with those of other chunks.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        The chunk of data to aggregate
+    grouping_col : str
+        The column to group the data on
+    action_col : str
+        After grouping, the column to applying th action to
+    action : str, optional
+        The action the partial states are for. The default is the count action.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        A dataframe indexed by group, with one column per partial state.
+    """
+    import pandas as pd
+
+    grouped = data.groupby(grouping_col)[action_col]
+
+    states = {}
+    for state in MERGEABLE_STATES[action]:
+        if state == 'm2':
+            # Sum of squared deviations from the group mean (Welford's M2)
+            states['m2'] = grouped.var(ddof = 0) * states['count']
+        else:
+            states[state] = grouped.agg(state)
+
+    return pd.DataFrame(states)
+
+
+def merge_partial_aggs(partials, action = 'count'):
+    """
+    Given the partial states of several chunks, return the partial states of
+    all the chunks combined.
+
+    Parameters
+    ----------
+    partials : list of pandas.core.frame.DataFrame
+        The partial states returned by partial_agg or merge_partial_aggs
+    action : str, optional
+        The action the partial states are for. The default is the count action.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        A dataframe indexed by group, with one column per partial state.
+    """
+    import pandas as pd
+
+    stacked = pd.concat(partials)
+    grouped = stacked.groupby(level = 0)
+
+    merged = {}
+    for state in MERGEABLE_STATES[action]:
+        if state in ['count', 'sum', 'min', 'max']:
+            merged[state] = grouped[state].agg(state if state != 'count' else 'sum')
+
+    if 'mean' in stacked.columns:
+        # Chan et al.'s parallel form of Welford's algorithm, for every group at once
+        counts = stacked['count']
+        means = stacked['mean'].where(counts > 0, 0)
+        merged['mean'] = (counts * means).groupby(level = 0).sum() / merged['count']
+
+    if 'm2' in stacked.columns:
+        deviations = means - merged['mean'].reindex(stacked.index)
+        merged['m2'] = (
+            stacked['m2'].where(counts > 0, 0) + counts * deviations ** 2
+        ).groupby(level = 0).sum()
+
+    return pd.DataFrame(merged)[MERGEABLE_STATES[action]]
+
+
+def finalize_partial_agg(partial, grouping_col, action = 'count'):
+    """
+    Given the merged partial states of all the chunks, return the same
+    dataframe as custom_agg with the group by column and the result of the
+    action applied.
+    """
+    import numpy as np
+    import pandas as pd
+
+    counts = partial['count'] if 'count' in partial.columns else None
+
+    if action == 'mean':
+        res = partial['mean'].where(counts > 0)
+    elif action in ['var', 'std']:
+        res = (partial['m2'] / (counts - 1)).where(counts > 1)
+        if action == 'std':
+            res = np.sqrt(res)
+    else:
+        res = partial[action]
+
+    res = pd.DataFrame({action: res})
+    res.index.name = grouping_col
+
+    return res.reset_index()
+
+
+def chunked_custom_agg(data, grouping_col, action_col, action = 'count',
+                       chunksize = 100000):
+    """
+    Given a csv file or chunks of a dataframe, a column and an action, return
+    a dataframe that has been grouped by the column and a aggregate function
+    applied, while only keeping one chunk and one row per group in memory.
+
+    Parameters
+    ----------
+    data : str, os.PathLike or iterable of pandas.core.frame.DataFrame
+        The path of the csv file to aggregate, or the chunks to aggregate
+    grouping_col : str
+        The column to group the data on
+    action_col : str
+        After grouping, the column to applying th action to
+    action : str, optional
+        The action to apply to the specified action_col, one of count, sum,
+        min, max, mean, var or std. The default is the count action.
+    chunksize : int, optional
+        The number of rows to read at a time from a csv file
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        A dataframe with the group by column and the result of the action
+        applied, as returned by custom_agg.
+
+    Raises
+    ------
+    ValueError
+        If the action cannot be merged across chunks
+    AssertError
+        If the input argument grouping_col is not in the data columns
+    AssertError
+        If the input argument action_col is not in the data columns
+
+    Examples
+    --------
+    >>> chunked_custom_agg('data/parts.csv', 'part_cat_id', 'part_num')
+    """
+    import os
+    import pandas as pd
+
+    if action not in MERGEABLE_STATES:
+        raise ValueError("The action cannot be computed chunk by chunk")
+
+    if isinstance(data, (str, os.PathLike)):
+        chunks = pd.read_csv(data, usecols = [grouping_col, action_col],
+                             chunksize = chunksize)
+    else:
+        chunks = data
+
+    merged = None
+    for chunk in chunks:
+        # Tests that the the grouping column is in the dataframe
+        assert grouping_col in chunk.columns, "The grouping column does not exist in the dataframe"
+
+        # Tests that the the action column is in the dataframe
+        assert action_col in chunk.columns, "The action column does not exist in the dataframe"
+
+        partials = [partial_agg(chunk, grouping_col, action_col, action)]
+        if merged is not None:
+            partials.insert(0, merged)
+        merged = merge_partial_aggs(partials, action)
+
+    return finalize_partial_agg(merged, grouping_col, action)
+
+
+def _mapped_partial_agg(buffer_dir, start, stop, action, drop_missing):
+    """
+    Given the directory of the memory-mapped key and value buffers, return
+    the partial states of the rows from start to stop, grouped by key
+    """
+    import os
+    import numpy as np
+    import pandas as pd
+
+    # Only the pages of this partition are read from the shared buffers
+    keys = np.load(os.path.join(buffer_dir, 'keys.npy'), mmap_mode = 'r')
+    values = np.load(os.path.join(buffer_dir, 'values.npy'), mmap_mode = 'r')
+    chunk = pd.DataFrame({'key': keys[start:stop], 'value': values[start:stop]})
+
+    # Factorized keys mark missing groups with -1, which groupby would keep
+    if drop_missing:
+        chunk = chunk[chunk['key'] >= 0]
+
+    return partial_agg(chunk, 'key', 'value', action)
+
+
+def parallel_custom_agg(data, grouping_col, action_col, action = 'count',
+                        n_jobs = -1):
+    """
+    Given a dataframe with a numeric action column, a column and an action,
+    return the same dataframe as custom_agg, aggregating partitions of the
+    rows in a pool of processes. The key and value columns are written once
+    to memory-mapped buffers, which every process reads its partition from,
+    so no dataframe is pickled, and only the partial states of each
+    partition are sent back to be merged.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        The dataframe to aggregate
+    grouping_col : str
+        The column to group the data on
+    action_col : str
+        After grouping, the numeric column to applying th action to
+    action : str, optional
+        The action to apply to the specified action_col, one of count, sum,
+        min, max, mean, var or std. The default is the count action.
+    n_jobs : int, optional
+        The number of processes, -1 for one per core. The default is one
+        per core.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        A dataframe with the group by column and the result of the action
+        applied, as returned by custom_agg.
+
+    Examples
+    --------
+    >>> parallel_custom_agg(parts, 'part_cat_id', 'part_material_id', 'max', n_jobs = 4)
+    """
+    import os
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+    import numpy as np
+    import pandas as pd
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+
+    # Numeric keys are grouped as they are, others by their sorted codes
+    uniques = None
+    if isinstance(data[grouping_col].dtype, np.dtype) and \
+            data[grouping_col].dtype.kind in 'biuf':
+        keys = data[grouping_col].to_numpy()
+    else:
+        keys, uniques = pd.factorize(data[grouping_col], sort = True)
+
+    bounds = np.linspace(0, len(data), n_jobs + 1).astype(int)
+
+    with tempfile.TemporaryDirectory() as buffer_dir:
+        np.save(os.path.join(buffer_dir, 'keys.npy'), keys)
+        np.save(os.path.join(buffer_dir, 'values.npy'),
+                data[action_col].to_numpy())
+
+        with ProcessPoolExecutor(max_workers = n_jobs) as executor:
+            partials = list(executor.map(
+                _mapped_partial_agg, [buffer_dir] * n_jobs, bounds[:-1],
+                bounds[1:], [action] * n_jobs, [uniques is not None] * n_jobs
+            ))
+
+    merged = merge_partial_aggs(partials, action)
+    if uniques is not None:
+        merged.index = uniques.take(merged.index)
+
+    return finalize_partial_agg(merged, grouping_col, action)
@@ -9,8 +9,9 @@ This function creates a helper data to test the sample script created for
 the sample solution to the Python Programmign for Data Science project.
 """
 
-from sample_script import custom_agg
+from sample_script import custom_agg, chunked_custom_agg
 import pandas as pd
+import numpy as np
 
 def test_custom_agg():
 
@@ -35,4 +36,49 @@ def test_custom_agg():
 
     assert res.shape == (2,2)
     assert list(res['count']) == [4, 6]
-    assert list(res['type']) == ['Cherry', 'Oak']
\ No newline at end of file
+    assert list(res['type']) == ['Cherry', 'Oak']
+
+def test_chunked_custom_agg():
+
+    # Create helper data and split it into uneven chunks
+    raw = {'type': ['Oak', 'Cherry', 'Oak', 'Cherry', 'Oak',
+                    'Oak', 'Oak', 'Cherry', 'Cherry', 'Oak'],
+           'diameter': [9.0, 27.0, 3.0, 22.0, 3.0,
+                        6.5, 12.0, 18.0, 8.5, 23.0]}
+
+    helper_data = pd.DataFrame.from_dict(raw)
+    chunks = [helper_data.iloc[:3], helper_data.iloc[3:4], helper_data.iloc[4:]]
+
+    for action in ['count', 'sum', 'min', 'max', 'mean', 'var', 'std']:
+        res = chunked_custom_agg(iter(chunks), 'type', 'diameter', action)
+        expected = custom_agg(helper_data, 'type', 'diameter', action)
+
+        assert list(res.columns) == ['type', action]
+        assert list(res['type']) == ['Cherry', 'Oak']
+        assert np.allclose(res[action], expected[action])
+
+def test_parallel_custom_agg():
+
+    # Create helper data with string and numeric groups and a missing value
+    raw = {'type': ['Oak', 'Cherry', 'Oak', 'Cherry', 'Oak',
+                    'Oak', 'Oak', 'Cherry', 'Cherry', None],
+           'id': [2, 1, 2, 1, 2, 2, 2, 1, 1, 2],
+           'diameter': [9.0, 27.0, 3.0, 22.0, 3.0,
+                        6.5, 12.0, 18.0, 8.5, 23.0]}
+
+    helper_data = pd.DataFrame.from_dict(raw)
+
+    for grouping_col in ['type', 'id']:
+        for action in ['count', 'sum', 'min', 'max', 'mean', 'var', 'std']:
+            res = custom_agg(helper_data, grouping_col, 'diameter', action,
+                             n_jobs = 3)
+            expected = custom_agg(helper_data, grouping_col, 'diameter', action)
+
+            pd.testing.assert_frame_equal(res, expected)
+
+    try:
+        custom_agg(helper_data, 'type', 'diameter', 'median', n_jobs = 2)
+    except ValueError:
+        pass
+    else:
+        assert False, "Actions that cannot be merged should raise a ValueError"
@@ -0,0 +1,123 @@
+#######################
+### Import Packages ###
+#######################
+
+import os
+import stat
+
+import pandas as pd
+import pytest
+
+import datasets
+from datasets import find_dataset, get_cache_path, load_dataset
+
+
+def test_load_dataset(tmp_path):
+    csv_path = str(tmp_path / "films.csv")
+    pd.DataFrame(
+        {"title": ["Pinocchio", "Bambi", None], "year": [1940, 1942, 1950]}
+    ).to_csv(csv_path, index=False)
+
+    parsed_df = load_dataset(csv_path)
+    cached_df = load_dataset(csv_path)
+    mapped_df = load_dataset(csv_path, memory_map=True)
+
+    # Tests That the Cache Returns What read_csv Does.
+    assert os.path.exists(
+        get_cache_path(csv_path)
+    ), "The first load should save the cache next to the csv file."
+    pd.testing.assert_frame_equal(parsed_df, pd.read_csv(csv_path))
+    pd.testing.assert_frame_equal(cached_df, pd.read_csv(csv_path))
+    assert all(
+        isinstance(dtype, pd.ArrowDtype) for dtype in mapped_df.dtypes
+    ), f"Memory mapped columns should be Arrow backed. They instead are {mapped_df.dtypes.to_list()}."
+    assert mapped_df["year"].to_list() == [
+        1940,
+        1942,
+        1950,
+    ], f"The memory mapped data is wrong. It instead is {mapped_df['year'].to_list()}."
+
+    # Tests That Changing the csv File Rebuilds the Cache.
+    with open(csv_path, "a") as csv_file:
+        csv_file.write("Dumbo,1941\n")
+    assert (
+        len(load_dataset(csv_path)) == 4
+    ), "The cache should be rebuilt when the csv file changes."
+
+    # Tests That Each Set of Options Is Cached Separately.
+    titles_df = load_dataset(csv_path, usecols=["title"])
+    assert titles_df.columns.to_list() == [
+        "title"
+    ], f"The read_csv options were not used. The columns instead are {titles_df.columns.to_list()}."
+    assert get_cache_path(csv_path, {"usecols": ["title"]}) != get_cache_path(
+        csv_path
+    ), "Different read_csv options should not share a cache."
+
+    return
+
+
+def test_find_dataset():
+    # Tests That Datasets Are Found by Name in the Assignments.
+    assert find_dataset("chopped").endswith(
+        os.path.join("data", "chopped.csv")
+    ), f"The chopped dataset was not found. It instead is {find_dataset('chopped')}."
+
+    return
+
+
+def test_build_dataset_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(datasets, "RELEASE_DIR", str(tmp_path))
+    monkeypatch.setattr(datasets, "STORE_DIR", str(tmp_path / ".datasets"))
+
+    csv_paths = []
+    for assignment_name in ["assignment1", "assignment1_late", "assignment2"]:
+        (tmp_path / assignment_name / "data").mkdir(parents=True)
+        csv_paths.append(str(tmp_path / assignment_name / "data" / "films.csv"))
+        with open(csv_paths[-1], "w") as csv_file:
+            csv_file.write("title,year\nPinocchio,1940\nBambi,1942\n")
+
+    manifest = datasets.build_dataset_store(link=True)
+
+    # Tests That Copies Are Stored as a Single Blob.
+    assert (
+        len({entry["blob"] for entry in manifest.values()}) == 1
+    ), f"Every copy should share one blob. The manifest instead is {manifest}."
+    assert (
+        os.stat(csv_paths[0]).st_nlink == 4
+    ), "Each copy should be a hard link to the blob."
+
+    # Tests That Every Copy Shares One Cache.
+    assert (
+        len({get_cache_path(csv_path) for csv_path in csv_paths}) == 1
+    ), "Every copy should share the cache of its blob."
+    pd.testing.assert_frame_equal(load_dataset(csv_paths[1]), pd.read_csv(csv_paths[0]))
+    assert not any(
+        os.path.exists(os.path.splitext(csv_path)[0] + datasets.CACHE_SUFFIX)
+        for csv_path in csv_paths
+    ), "The cache of a stored dataset should not be saved next to its copies."
+
+    # Tests That a Linked Copy Cannot Be Rewritten in Place.
+    assert (
+        stat.S_IMODE(os.stat(csv_paths[2]).st_mode) == 0o444
+    ), "The blob and its hard links should be read-only."
+    if os.geteuid() != 0:
+        with pytest.raises(PermissionError):
+            with open(csv_paths[2], "w") as csv_file:
+                csv_file.write("title,year\nDumbo,1941\n")
+    assert load_dataset(csv_paths[0])["title"].to_list() == [
+        "Pinocchio",
+        "Bambi",
+    ], "Writing to a linked copy should not change the other copies."
+
+    # Tests That a Changed Copy Is No Longer Read From the Store.
+    os.remove(csv_paths[2])
+    with open(csv_paths[2], "w") as csv_file:
+        csv_file.write("title,year\nDumbo,1941\n")
+    assert (
+        datasets.resolve_dataset(csv_paths[2]) is None
+    ), "A changed file should not resolve to its old blob."
+    assert load_dataset(csv_paths[2])["title"].to_list() == [
+        "Dumbo"
+    ], "A changed file should be read from its own content."
+
+    return
@@ -0,0 +1,78 @@
+#######################
+### Import Packages ###
+#######################
+
+import pandas as pd
+
+from date_parser import _FORMAT_CACHE, detect_date_formats, parse_date_column
+
+
+def test_detect_date_formats():
+    dates = pd.Series(["22-Apr-15", "01-Jan-17", "August 31, 2018", None])
+
+    # Tests That Formats Are Detected From the Most to the Least Common.
+    assert detect_date_formats(dates) == [
+        "%d-%b-%y",
+        "%B %d, %Y",
+    ], f"The formats detected are wrong. They instead are {detect_date_formats(dates)}."
+
+    return
+
+
+def test_parse_date_column():
+    dates = pd.Series(
+        ["22-Apr-15", " August 31, 2018", None, "sometime", "22-Apr-15"],
+        index=[5, 6, 7, 8, 9],
+        name="date_added",
+    )
+    _FORMAT_CACHE.pop("netflix", None)
+
+    parsed_dates, unparsed_dates = parse_date_column(dates, cache_key="netflix")
+
+    # Tests That Every Format Is Parsed and Unparsed Dates Are Reported.
+    expected_dates = pd.Series(
+        pd.to_datetime(["2015-04-22", "2018-08-31", None, None, "2015-04-22"]),
+        index=dates.index,
+        name="date_added",
+    ).astype("datetime64[us]")
+    pd.testing.assert_series_equal(parsed_dates, expected_dates)
+    assert unparsed_dates.to_dict() == {
+        8: "sometime"
+    }, f"Only the date in no format should be reported. The unparsed dates instead are {unparsed_dates.to_dict()}."
+
+    # Tests That the Detected Formats Are Cached and Extended When Needed.
+    assert _FORMAT_CACHE["netflix"] == ["%d-%b-%y", "%B %d, %Y"]
+    parsed_dates, _ = parse_date_column(
+        pd.Series(["Dec 21, 1937", "01-Nov-19"]), cache_key="netflix"
+    )
+    assert parsed_dates.dt.year.to_list() == [
+        1937,
+        2019,
+    ], f"The dates were parsed wrongly. They instead are {parsed_dates.to_list()}."
+    assert _FORMAT_CACHE["netflix"] == [
+        "%d-%b-%y",
+        "%B %d, %Y",
+        "%b %d, %Y",
+    ], f"A new format should be added to the cache. It instead is {_FORMAT_CACHE['netflix']}."
+
+    return
+
+
+def test_parse_date_column_rare_format():
+    dates = pd.Series(
+        pd.date_range("2000-01-01", periods=5000).strftime("%d-%b-%y").to_list()
+        + ["2018-08-31", "2019-01-02"]
+    )
+
+    parsed_dates, unparsed_dates = parse_date_column(dates, sample_size=100)
+
+    # Tests That a Format Missing From the Sample Is Still Detected.
+    assert (
+        unparsed_dates.empty
+    ), f"Every date should be parsed. The unparsed dates instead are {unparsed_dates.to_list()}."
+    assert parsed_dates.iloc[-2:].dt.year.to_list() == [
+        2018,
+        2019,
+    ], f"The rare dates were parsed wrongly. They instead are {parsed_dates.iloc[-2:].to_list()}."
+
+    return
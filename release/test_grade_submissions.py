@@ -0,0 +1,211 @@
+#######################
+### Import Packages ###
+#######################
+
+import json
+import os
+import sys
+
+from grade_submissions import grade_submissions, load_submission
+
+TEST_MODULE = """
+import time
+
+
+def test_1a(answer):
+    assert answer == 1, "The answer should be 1."
+    return "Success"
+
+
+def test_1b(answer):
+    assert answer.shape == (2, 1), "The data has the wrong shape."
+    return "Success"
+
+
+def test_1c(answer):
+    time.sleep(5)
+    return "Success"
+
+
+def test_1d(answer):
+    return "Success"
+"""
+
+NOTEBOOK_CELLS = [
+    "import pandas as pd\nimport test_assignment0 as t",
+    "!pip install nothing\n%matplotlib inline\n?pd.read_csv\npd.read_csv?",
+    "t.test_1a(1)",
+    "values = pd.read_csv('data/values.csv')\nt.test_1b(values)",
+    "t.test_1c(None)",
+    "raise NotImplementedError()",
+]
+
+
+def __write_assignment(
+    tmp_path,
+    notebook_cells=NOTEBOOK_CELLS,
+    assignment_name="assignment0",
+    test_module=TEST_MODULE,
+):
+    assignment_dir = tmp_path / assignment_name
+    (assignment_dir / "data").mkdir(parents=True)
+    (assignment_dir / "test_assignment0.py").write_text(test_module)
+    (assignment_dir / "data" / "values.csv").write_text("value\n1\n2\n")
+
+    notebook_path = assignment_dir / f"{assignment_name}.ipynb"
+    notebook_path.write_text(
+        json.dumps(
+            {
+                "cells": [
+                    {"cell_type": "markdown", "source": ["# Assignment 0"]},
+                    *[
+                        {"cell_type": "code", "source": [source]}
+                        for source in notebook_cells
+                    ],
+                ]
+            }
+        )
+    )
+
+    return str(assignment_dir), str(notebook_path)
+
+
+def test_load_submission(tmp_path):
+    _, notebook_path = __write_assignment(tmp_path)
+
+    cell_sources = load_submission(notebook_path)
+
+    # Tests That Only Code Cells Are Loaded, Without IPython Syntax.
+    assert len(cell_sources) == len(
+        NOTEBOOK_CELLS
+    ), f"Only code cells should be loaded. There instead are {len(cell_sources)}."
+    assert (
+        cell_sources[1].strip() == ""
+    ), f"Shell commands, magics and help requests should be removed. The cell instead is {cell_sources[1]!r}."
+
+    return
+
+
+def test_grade_submissions(tmp_path):
+    assignment_dir, notebook_path = __write_assignment(tmp_path)
+    working_dir = os.getcwd()
+
+    try:
+        report_df = grade_submissions(
+            assignment_dir, [notebook_path], n_jobs=1, check_timeout=0.5
+        )
+    finally:
+        os.chdir(working_dir)
+
+    statuses = dict(zip(report_df["check"], report_df["status"]))
+
+    # Tests That Every Check and Failing Cell Is Recorded.
+    assert statuses == {
+        "test_1a": "passed",
+        "test_1b": "passed",
+        "test_1c": "timeout",
+        "cell 6": "error",
+        "test_1d": "missing",
+    }, f"The checks were recorded wrongly. They instead are {statuses}."
+    assert (
+        report_df["submission"] == notebook_path
+    ).all(), "Every record should name its submission."
+
+    return
+
+
+def test_grade_submissions_nested_timeout(tmp_path):
+    assignment_dir, notebook_path = __write_assignment(
+        tmp_path, NOTEBOOK_CELLS[:1] + ["t.test_1a(1)\nwhile True: pass"]
+    )
+    working_dir = os.getcwd()
+
+    try:
+        report_df = grade_submissions(
+            assignment_dir, [notebook_path], n_jobs=1, check_timeout=1, cell_timeout=2
+        )
+    finally:
+        os.chdir(working_dir)
+
+    statuses = dict(zip(report_df["check"], report_df["status"]))
+
+    # Tests That a Check Inside a Cell Keeps the Time Limit of the Cell.
+    assert (
+        statuses.get("test_1a") == "passed"
+    ), f"The check should pass. The checks instead are {statuses}."
+    assert (
+        statuses.get("cell 2") == "timeout"
+    ), f"The cell should time out after its check. The checks instead are {statuses}."
+
+    return
+
+
+def test_grade_submissions_submission_timeout(tmp_path):
+    # SIGALRM is blocked, as it would be by a hang inside C code.
+    assignment_dir, notebook_path = __write_assignment(
+        tmp_path,
+        [
+            "import signal\nsignal.pthread_sigmask(signal.SIG_BLOCK, [signal.SIGALRM])",
+            "while True: pass",
+        ],
+    )
+    working_dir = os.getcwd()
+
+    try:
+        report_df = grade_submissions(
+            assignment_dir,
+            [notebook_path],
+            n_jobs=1,
+            cell_timeout=0.5,
+            submission_timeout=2,
+        )
+    finally:
+        os.chdir(working_dir)
+
+    statuses = dict(zip(report_df["check"], report_df["status"]))
+
+    # Tests That a Submission Past Its Hard Timeout Is Killed and Recorded.
+    assert statuses == {
+        "submission": "timeout"
+    }, f"The submission should time out. The checks instead are {statuses}."
+
+    return
+
+
+def test_grade_submissions_reloads_checks(tmp_path):
+    notebook_cells = NOTEBOOK_CELLS[:1] + ["t.test_1a(1)"]
+    assignment_paths = [
+        __write_assignment(tmp_path, notebook_cells),
+        __write_assignment(
+            tmp_path,
+            notebook_cells,
+            assignment_name="assignment0_late",
+            test_module=TEST_MODULE.replace("answer == 1", "answer == 2"),
+        ),
+    ]
+    working_dir = os.getcwd()
+    search_paths = list(sys.path)
+
+    try:
+        report_dfs = [
+            grade_submissions(assignment_dir, [notebook_path], n_jobs=1)
+            for assignment_dir, notebook_path in assignment_paths
+        ]
+    finally:
+        os.chdir(working_dir)
+
+    statuses = [
+        dict(zip(report_df["check"], report_df["status"]))["test_1a"]
+        for report_df in report_dfs
+    ]
+
+    # Tests That Each Assignment Is Graded Against Its Own Checks.
+    assert statuses == [
+        "passed",
+        "failed",
+    ], f"Each assignment should use its own checks. The statuses instead are {statuses}."
+    assert (
+        sys.path == search_paths
+    ), "Grading should leave the import path of the process unchanged."
+
+    return
@@ -0,0 +1,51 @@
+#######################
+### Import Packages ###
+#######################
+
+import pandas as pd
+
+from netflix_functions import parse_durations
+
+
+def test_parse_durations():
+    netflix = pd.DataFrame(
+        {
+            "type": ["Movie", "TV Show", "TV Show", "Movie", "TV Show", None],
+            "duration": ["91 min", "1 Season", "10 Seasons", "88", None, "3"],
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+
+    durations = parse_durations(netflix)
+
+    # Tests That Durations Are Split Into Nullable Integer Columns.
+    assert durations.dtypes.to_list() == [
+        "Int16",
+        "Int16",
+    ], f"The durations should be nullable integers. They instead are {durations.dtypes.to_list()}."
+    assert durations.index.equals(
+        netflix.index
+    ), "The durations should keep the index of the titles."
+    assert durations["duration_minutes"].to_list() == [
+        91,
+        pd.NA,
+        pd.NA,
+        88,
+        pd.NA,
+        pd.NA,
+    ], f"The minutes are wrong. They instead are {durations['duration_minutes'].to_list()}."
+    assert durations["duration_seasons"].to_list() == [
+        pd.NA,
+        1,
+        10,
+        pd.NA,
+        pd.NA,
+        pd.NA,
+    ], f"The seasons are wrong. They instead are {durations['duration_seasons'].to_list()}."
+
+    # Tests That Durations Without a Unit Are Left Missing Without a Type.
+    assert (
+        parse_durations(netflix[["duration"]]).loc[13].isna().all()
+    ), "A duration without a unit or a type should be missing."
+
+    return
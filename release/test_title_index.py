@@ -0,0 +1,108 @@
+#######################
+### Import Packages ###
+#######################
+
+import numpy as np
+import pandas as pd
+
+from title_index import (
+    build_field_index,
+    build_title_index,
+    count_cooccurrences,
+    count_titles,
+    find_titles,
+    load_title_index,
+    save_title_index,
+)
+
+NETFLIX_DICT = {
+    "title": ["Big", "Sleepless in Seattle", "Cast Away", "Grown Ups"],
+    "cast": [
+        "Tom Hanks, Elizabeth Perkins",
+        "Tom Hanks,Meg Ryan, Tom Hanks",
+        "Tom Hanks, Helen Hunt",
+        "Adam Sandler",
+    ],
+    "country": ["United States", "United States", "United States, Mexico", np.nan],
+    "director": ["Penny Marshall", "Nora Ephron", "Robert Zemeckis", "Dennis Dugan"],
+    "listed_in": ["Comedies", "Comedies, Romantic Movies", "Dramas", "Comedies"],
+}
+
+
+def test_build_title_index():
+    netflix = pd.DataFrame.from_dict(NETFLIX_DICT)
+    index = build_title_index(netflix)
+
+    # Tests That Tokens Are Stripped, Sorted and Counted Once per Title.
+    assert index["cast"]["vocabulary"].tolist() == [
+        "Adam Sandler",
+        "Elizabeth Perkins",
+        "Helen Hunt",
+        "Meg Ryan",
+        "Tom Hanks",
+    ], f"The cast vocabulary is wrong. It instead is {index['cast']['vocabulary'].tolist()}."
+    assert count_titles(index, "cast").to_dict() == {
+        "Tom Hanks": 3,
+        "Adam Sandler": 1,
+        "Elizabeth Perkins": 1,
+        "Helen Hunt": 1,
+        "Meg Ryan": 1,
+    }, f"The titles of each cast member are wrong. They instead are {count_titles(index, 'cast').to_dict()}."
+    assert index["country"]["csr_indptr"].tolist() == [
+        0,
+        1,
+        2,
+        4,
+        4,
+    ], "A title without a country should have no tokens."
+
+    # Tests That the Index Is a Sparse Lookup of the Titles of Each Token.
+    assert find_titles(index, "cast", "Tom Hanks").tolist() == [0, 1, 2]
+    assert find_titles(index, "cast", ["Meg Ryan", "Helen Hunt"]).tolist() == [1, 2]
+    assert find_titles(
+        index, "country", ["United States", "Mexico"], how="all"
+    ).tolist() == [2], "Only Cast Away is from both countries."
+    assert (
+        find_titles(index, "cast", ["Tom Hanks", "Nobody"], how="all").size == 0
+    ), "No title has a cast member who is not in the index."
+
+    # Tests That Co-Occurrences Count the Tokens of Shared Titles.
+    assert count_cooccurrences(
+        index, "cast", "Tom Hanks", other_field="listed_in"
+    ).to_dict() == {
+        "Comedies": 2,
+        "Dramas": 1,
+        "Romantic Movies": 1,
+    }, "Tom Hanks has two comedies, a drama and a romantic movie."
+
+    return
+
+
+def test_save_title_index(tmp_path):
+    netflix = pd.DataFrame.from_dict(NETFLIX_DICT)
+    index = build_title_index(netflix, fields=["cast", "country"])
+    index_path = str(tmp_path / "netflix_titles.npz")
+
+    save_title_index(index, index_path)
+    loaded_index = load_title_index(index_path)
+
+    # Tests That a Loaded Index Has the Same Arrays.
+    assert loaded_index.keys() == index.keys()
+    for field, field_index in index.items():
+        for array_name, array in field_index.items():
+            np.testing.assert_array_equal(loaded_index[field][array_name], array)
+
+    return
+
+
+def test_build_field_index_empty():
+    field_index = build_field_index(pd.Series([np.nan, np.nan, np.nan]))
+
+    # Tests That a Field Without Any Values Gives an Empty Index.
+    assert (
+        len(field_index["vocabulary"]) == 0
+    ), f"The vocabulary should be empty. It instead is {field_index['vocabulary']}."
+    np.testing.assert_array_equal(field_index["csr_indptr"], [0, 0, 0, 0])
+    np.testing.assert_array_equal(field_index["csc_indptr"], [0])
+
+    return
@@ -0,0 +1,328 @@
+"""
+Indexes the comma separated fields of the netflix titles, such as the cast
+or the countries of each title, as sparse incidence matrices.
+
+Each field is tokenized once into a sorted vocabulary, and the titles each
+token appears in are stored both by title (CSR) and by token (CSC), in the
+indptr/indices layout of scipy.sparse. Finding the titles of a token,
+counting the titles of every token or counting the tokens of another field
+shared with a token are then slices and bincounts of these arrays, rather
+than scans of every string.
+
+    from title_index import build_title_index, find_titles
+
+    index = build_title_index(netflix)
+    netflix.iloc[find_titles(index, "cast", ["Tom Hanks", "Meg Ryan"], how="all")]
+"""
+
+#######################
+### Import Packages ###
+#######################
+
+import numpy as np
+import pandas as pd
+
+INDEX_FIELDS = ["cast", "country", "director", "listed_in"]
+
+#####################
+### Build Indexes ###
+#####################
+
+
+def __get_indptr(positions, length):
+    # The start of each row or column of a compressed matrix, followed by its end.
+    return np.concatenate([[0], np.cumsum(np.bincount(positions, minlength=length))])
+
+
+def build_field_index(values, separator=","):
+    """
+    Tokenizes a column of separated values into a vocabulary and the
+    compressed incidence matrix of rows by tokens, by row and by token.
+    Tokens are stripped of whitespace, and repeated tokens of a row are
+    only counted once.
+
+    Parameters
+    ----------
+    values : pandas.Series
+        The separated values of each row, missing when a row has none
+    separator : str, optional
+        The string separating the tokens of a value
+
+    Returns
+    -------
+    dict
+        the 'vocabulary' of sorted tokens, the 'csr_indptr' and
+        'csr_indices' of the tokens of each row, and the 'csc_indptr' and
+        'csc_indices' of the rows of each token
+
+    Examples
+    --------
+    >>> build_field_index(netflix["listed_in"])
+    """
+
+    # A column without any values is float, so it is cast before being split.
+    tokens = (
+        values.reset_index(drop=True)
+        .astype("string")
+        .str.split(separator)
+        .explode()
+        .str.strip()
+    )
+    tokens = tokens[tokens.notna() & (tokens != "")]
+
+    token_codes, vocabulary = pd.factorize(tokens, sort=True)
+    row_positions = tokens.index.to_numpy()
+
+    # Each row is sorted by token, and a token repeated in a row is dropped.
+    incidence = np.unique(
+        row_positions.astype(np.int64) * len(vocabulary) + token_codes
+    )
+    row_positions, token_codes = np.divmod(incidence, max(len(vocabulary), 1))
+
+    # A stable sort by token keeps the rows of each token sorted.
+    column_order = np.argsort(token_codes, kind="stable")
+
+    return {
+        "vocabulary": np.asarray(vocabulary, dtype=str),
+        "csr_indptr": __get_indptr(row_positions, len(values)),
+        "csr_indices": token_codes.astype(np.int32),
+        "csc_indptr": __get_indptr(token_codes, len(vocabulary)),
+        "csc_indices": row_positions[column_order].astype(np.int32),
+    }
+
+
+def build_title_index(data, fields=INDEX_FIELDS, separator=","):
+    """
+    Builds the incidence index of each of the comma separated fields of the
+    netflix titles. Rows are identified by their position in data.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The netflix titles
+    fields : list of str, optional
+        The comma separated columns to index
+    separator : str, optional
+        The string separating the tokens of a value
+
+    Returns
+    -------
+    dict
+        the index of each field, as in build_field_index
+
+    Examples
+    --------
+    >>> build_title_index(netflix, fields=["cast", "country"])
+    """
+
+    # This checks if the data variable is of type pd.dataframe
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError("The data argument is not of type DataFrame")
+
+    return {field: build_field_index(data[field], separator) for field in fields}
+
+
+#####################
+### Query Indexes ###
+#####################
+
+
+def __get_token_codes(field_index, tokens):
+    vocabulary = field_index["vocabulary"]
+    token_codes = np.searchsorted(vocabulary, tokens)
+    is_known = token_codes < len(vocabulary)
+    is_known[is_known] = (
+        vocabulary[token_codes[is_known]] == np.asarray(tokens)[is_known]
+    )
+    return np.unique(token_codes[is_known]), is_known.all()
+
+
+def __gather(indptr, indices, positions):
+    # Concatenates the slices of indices of every position without a python loop.
+    starts, stops = indptr[positions], indptr[positions + 1]
+    lengths = stops - starts
+    offsets = np.arange(lengths.sum()) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    return indices[np.repeat(starts, lengths) + offsets]
+
+
+def find_titles(index, field, tokens, how="any"):
+    """
+    Returns the positions of the titles with any or all of the given tokens
+    of a field.
+
+    Parameters
+    ----------
+    index : dict
+        The title index, as in build_title_index
+    field : str
+        The field of the tokens
+    tokens : str or list of str
+        The tokens to look for
+    how : {'any', 'all'}, optional
+        Whether a title needs any of the tokens or all of them
+
+    Returns
+    -------
+    numpy.ndarray
+        the sorted positions of the titles
+
+    Examples
+    --------
+    >>> netflix.iloc[find_titles(index, "country", ["Canada", "France"])]
+    """
+
+    if how not in ["any", "all"]:
+        raise ValueError(f"how should be 'any' or 'all', not {how!r}")
+
+    tokens = np.atleast_1d(np.asarray(tokens, dtype=str))
+    field_index = index[field]
+    token_codes, has_all_tokens = __get_token_codes(field_index, tokens)
+
+    row_positions = __gather(
+        field_index["csc_indptr"], field_index["csc_indices"], token_codes
+    )
+    if how == "any":
+        return np.unique(row_positions)
+
+    if not has_all_tokens:
+        return np.array([], dtype=row_positions.dtype)
+
+    # A title has every token when it appears once in the rows of each of them.
+    row_positions, token_counts = np.unique(row_positions, return_counts=True)
+    return row_positions[token_counts == len(token_codes)]
+
+
+def count_titles(index, field):
+    """
+    Counts the titles of every token of a field.
+
+    Parameters
+    ----------
+    index : dict
+        The title index, as in build_title_index
+    field : str
+        The field to count the tokens of
+
+    Returns
+    -------
+    pandas.Series
+        the number of titles of each token, from most to fewest
+
+    Examples
+    --------
+    >>> count_titles(index, "country").head(10)
+    """
+
+    field_index = index[field]
+
+    return pd.Series(
+        np.diff(field_index["csc_indptr"]),
+        index=pd.Index(field_index["vocabulary"], name=field),
+        name="count",
+    ).sort_values(ascending=False, kind="stable")
+
+
+def count_cooccurrences(index, field, tokens, other_field=None):
+    """
+    Counts the tokens of a field which appear in the same titles as any of
+    the given tokens, the rows of the product of the two incidence matrices.
+
+    Parameters
+    ----------
+    index : dict
+        The title index, as in build_title_index
+    field : str
+        The field of the tokens
+    tokens : str or list of str
+        The tokens whose titles to count the other tokens of
+    other_field : str, optional
+        The field to count the tokens of, field itself by default
+
+    Returns
+    -------
+    pandas.Series
+        the number of titles shared with each token, from most to fewest,
+        without the tokens which share none
+
+    Examples
+    --------
+    >>> count_cooccurrences(index, "cast", "Adam Sandler", other_field="director")
+    """
+
+    other_field = other_field or field
+    row_positions = find_titles(index, field, tokens)
+
+    other_index = index[other_field]
+    other_counts = np.bincount(
+        __gather(other_index["csr_indptr"], other_index["csr_indices"], row_positions),
+        minlength=len(other_index["vocabulary"]),
+    )
+    is_shared = other_counts > 0
+
+    return pd.Series(
+        other_counts[is_shared],
+        index=pd.Index(other_index["vocabulary"][is_shared], name=other_field),
+        name="count",
+    ).sort_values(ascending=False, kind="stable")
+
+
+####################
+### Save Indexes ###
+####################
+
+
+def save_title_index(index, index_path):
+    """
+    Saves a title index to a single uncompressed .npz file.
+
+    Parameters
+    ----------
+    index : dict
+        The title index, as in build_title_index
+    index_path : str
+        The path of the file to save
+
+    Examples
+    --------
+    >>> save_title_index(index, "data/netflix_titles.npz")
+    """
+
+    np.savez(
+        index_path,
+        **{
+            f"{field}/{array_name}": array
+            for field, field_index in index.items()
+            for array_name, array in field_index.items()
+        },
+    )
+
+
+def load_title_index(index_path):
+    """
+    Loads a title index saved with save_title_index, without tokenizing the
+    titles again.
+
+    Parameters
+    ----------
+    index_path : str
+        The path of the saved index
+
+    Returns
+    -------
+    dict
+        the index of each field, as in build_field_index
+
+    Examples
+    --------
+    >>> load_title_index("data/netflix_titles.npz")
+    """
+
+    index = {}
+    with np.load(index_path) as index_file:
+        for key in index_file.files:
+            field, array_name = key.rsplit("/", 1)
+            index.setdefault(field, {})[array_name] = index_file[key]
+
+    return index